@@ -56,6 +56,8 @@ class TestTradingBot:
             self.config['api_keys']['upbit']['secret_key'],
             is_test=True
         )
+        # 저장 대기 중인 테스트 거래 데이터 (run_test 종료 시 일괄 저장)
+        self._pending_trades = []
 
     def _load_config(self):
         """설정 파일 로드"""
@@ -68,8 +70,8 @@ class TestTradingBot:
         try:
             logger.info(f"테스트 시작: {market}")
             
-            # 캔들 데이터 조회
-            candles = await self.upbit.get_candle(market, '5', 200)
+            # 캔들 데이터 조회 (동기 HTTP 호출이므로 스레드에서 실행하여 다른 마켓 조회와 겹치도록 함)
+            candles = await asyncio.to_thread(self.upbit.get_candle, market, '5', 200)
             if not candles:
                 logger.warning(f"{market}: 충분한 캔들 데이터 없음")
                 return
@@ -78,7 +80,7 @@ class TestTradingBot:
             logger.debug(f"캔들 데이터 샘플: {candles[0] if candles else 'None'}")
 
             # 시장 분석
-            analysis = await self.market_analyzer.analyze_market(market, candles)
+            analysis = self.market_analyzer.analyze_market(market, candles)
             logger.info(f"분석 결과: {analysis}")
 
             # 매수 신호 확인
@@ -105,23 +107,32 @@ class TestTradingBot:
                 'status': 'test'
             }
             
-            try:
-                # 동기식으로 MongoDB 저장
-                self.db.trades.insert_one(trade_data)
-                logger.info(f"{market} 거래 데이터 저장 완료")
-            except Exception as e:
-                logger.error(f"거래 데이터 저장 실패: {str(e)}")
+            # 모든 마켓 테스트가 끝난 뒤 run_test에서 한 번에 저장
+            self._pending_trades.append(trade_data)
 
         except Exception as e:
             logger.error(f"{market} 테스트 중 오류: {str(e)}", exc_info=True)
 
+    def _flush_trades(self):
+        """대기 중인 테스트 거래 데이터를 한 번의 요청으로 저장"""
+        if not self._pending_trades:
+            return
+        try:
+            # 동기식으로 MongoDB 저장 (순서 무관, 일부 실패해도 나머지는 저장)
+            self.db.trades.insert_many(self._pending_trades, ordered=False)
+            logger.info(f"거래 데이터 {len(self._pending_trades)}건 저장 완료")
+        except Exception as e:
+            logger.error(f"거래 데이터 저장 실패: {str(e)}")
+        finally:
+            self._pending_trades = []
+
     async def run_test(self):
         """테스트 실행"""
         try:
             logger.info("테스트 모드 시작")
             
             # 원화 마켓 목록 조회
-            markets = await self.upbit.get_krw_markets()
+            markets = await asyncio.to_thread(self.upbit.get_krw_markets)
             logger.info(f"조회된 마켓: {markets[:5]}")  # 처음 5개만 로깅
             
             if not markets:
@@ -133,12 +144,19 @@ class TestTradingBot:
             
             logger.info(f"테스트 대상 마켓: {test_markets}")
             
-            for market in test_markets:
-                try:
-                    await self.test_single_market(market)
-                except Exception as e:
-                    logger.error(f"{market} 테스트 중 오류: {str(e)}")
-                await asyncio.sleep(0.1)
+            # 업비트 요청 제한을 고려하여 동시에 최대 3개 마켓만 조회
+            semaphore = asyncio.Semaphore(3)
+
+            async def run_market(market: str):
+                async with semaphore:
+                    try:
+                        await self.test_single_market(market)
+                    except Exception as e:
+                        logger.error(f"{market} 테스트 중 오류: {str(e)}")
+                    await asyncio.sleep(0.1)
+
+            await asyncio.gather(*(run_market(market) for market in test_markets))
+            self._flush_trades()
 
             logger.info("테스트 완료")
 
@@ -8,7 +8,6 @@ from database.mongodb_manager import MongoDBManager
 from trade_market_api.UpbitCall import UpbitCall
 from messenger.Messenger import Messenger
 from strategy.StrategyBase import StrategyManager
-from strategy.Strategies import *
 from trading.thread_manager import ThreadManager
 from trading.market_analyzer import MarketAnalyzer
 from trading.trading_manager import TradingManager
@@ -96,27 +95,8 @@ class InvestmentCenter:
 
     
     def _initialize_strategies(self) -> StrategyManager:
-        """전략 초기화"""
-        manager = StrategyManager()
-        
-        # 기본 전략들 추가
-        strategies = [
-            RSIStrategy(),
-            MACDStrategy(),
-            BollingerBandStrategy(),
-            VolumeStrategy(),
-            PriceChangeStrategy(),
-            MovingAverageStrategy(),
-            MomentumStrategy(),
-            StochasticStrategy(),
-            IchimokuStrategy(),
-            MarketSentimentStrategy()
-        ]
-        
-        for strategy in strategies:
-            manager.add_strategy(strategy)
-            
-        return manager
+        """전략 초기화 (StrategyManager가 strategy 패키지의 전략을 모두 자동 로드)"""
+        return StrategyManager()
 
     
     def _check_api_status(self) -> bool:
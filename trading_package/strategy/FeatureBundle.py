@@ -0,0 +1,140 @@
+"""
+전략 간 공유 지표 모듈
+
+여러 전략이 공통으로 계산하는 파생 지표(가격 변화율, 거래량 비율 등)를
+한 틱에 한 번만 계산하여 재사용할 수 있도록 묶어 제공합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Any, Optional, Union
+from .MarketSnapshot import MarketSnapshot
+from utils.ring_buffer import RingBuffer
+
+def _lag(history, offset: int) -> Optional[float]:
+    """이력의 뒤에서 offset번째 값 (이력이 부족하면 None)"""
+    if isinstance(history, RingBuffer):
+        return history.last_scalar(offset)
+    return history[-offset] if len(history) >= offset else None
+
+def _tail_mean(history, count: int) -> float:
+    """이력의 최근 count개 평균 (링 버퍼에 정확히 count개가 있으면 누적 합으로 O(1))"""
+    if isinstance(history, RingBuffer) and len(history) == count:
+        return history.mean()
+    return float(np.asarray(history[-count:], dtype=np.float64).mean())
+
+@dataclass
+class FeatureBundle:
+    """
+    한 번의 시장 데이터 평가에서 공유되는 파생 지표 묶음
+
+    Attributes:
+        snapshot (MarketSnapshot): 원본 시장 데이터 (딕셔너리는 생성 시 스냅샷으로 변환)
+
+    Notes:
+        - 각 지표는 처음 접근할 때 한 번만 계산(cached_property)
+        - 이력이 부족해 계산할 수 없는 지표는 None
+    """
+    snapshot: Union[MarketSnapshot, Dict[str, Any]]
+
+    def __post_init__(self):
+        self.snapshot = MarketSnapshot.of(self.snapshot)
+
+    @cached_property
+    def prev_price(self) -> Optional[float]:
+        """직전 가격 (price_history[-2])"""
+        return _lag(self.snapshot.price_history, 2)
+
+    @cached_property
+    def prev_rsi(self) -> Optional[float]:
+        """직전 RSI (rsi_history[-2])"""
+        return _lag(self.snapshot.rsi_history, 2)
+
+    @cached_property
+    def price_change_pct(self) -> Optional[float]:
+        """현재 가격 기준 직전 대비 변화율(%)"""
+        if self.prev_price is None:
+            return None
+        return (self.snapshot.current_price / self.prev_price - 1) * 100
+
+    @cached_property
+    def ret_1(self) -> Optional[float]:
+        """가격 이력 기준 1구간 수익률 (history[-1] / history[-2] - 1)"""
+        if self.prev_price is None:
+            return None
+        return self.snapshot.price_history[-1] / self.prev_price - 1
+
+    @cached_property
+    def ret_2(self) -> Optional[float]:
+        """가격 이력 기준 2구간 수익률 (history[-1] / history[-3] - 1)"""
+        price_history = self.snapshot.price_history
+        prev_price_2 = _lag(price_history, 3)
+        if prev_price_2 is None:
+            return None
+        return price_history[-1] / prev_price_2 - 1
+
+    @cached_property
+    def short_change_pct(self) -> Optional[float]:
+        """가격 이력 기준 단기 변화율(%) (ret_1 기준)"""
+        return None if self.ret_1 is None else self.ret_1 * 100
+
+    @cached_property
+    def long_change_pct(self) -> Optional[float]:
+        """가격 이력 기준 장기 변화율(%) (ret_2 기준)"""
+        return None if self.ret_2 is None else self.ret_2 * 100
+
+    @cached_property
+    def prev_change_pct(self) -> Optional[float]:
+        """직전 구간 변화율(%) (history[-2] / history[-3])"""
+        prev_price_2 = _lag(self.snapshot.price_history, 3)
+        if prev_price_2 is None:
+            return None
+        return (self.prev_price / prev_price_2 - 1) * 100
+
+    @cached_property
+    def ma_diff_ratio(self) -> Optional[float]:
+        """단기(ma5)/장기(ma20) 이동평균 괴리율(%)"""
+        ma20 = self.snapshot.ma20
+        if not ma20:
+            return None
+        return (self.snapshot.ma5 - ma20) / ma20 * 100
+
+    @cached_property
+    def macd_hist(self) -> float:
+        """MACD 히스토그램 (macd - signal)"""
+        return self.snapshot.macd - self.snapshot.signal
+
+    @cached_property
+    def volume_ratio(self) -> float:
+        """평균 거래량 대비 현재 거래량 비율"""
+        current_volume = self.snapshot.current_volume
+        average_volume = self.snapshot.average_volume
+        if average_volume is None:
+            average_volume = current_volume
+        return current_volume / average_volume if average_volume > 0 else 1
+
+    @cached_property
+    def uptrend_volume_ratio(self) -> float:
+        """평균 거래량 대비 현재 거래량 비율 (UptrendEndStrategy용, 평균 거래량이 없으면 1로 계산)"""
+        current_volume = self.snapshot.current_volume
+        average_volume = self.snapshot.average_volume
+        if average_volume is None:
+            average_volume = 1
+        return current_volume / average_volume if average_volume > 0 else 1
+
+    @cached_property
+    def volume_surge(self) -> float:
+        """거래량 이동평균(volume_ma) 대비 현재 거래량 비율"""
+        volume_ma = self.snapshot.volume_ma
+        return self.snapshot.volume / volume_ma if volume_ma > 0 else 1
+
+    @cached_property
+    def history_volume_surge(self) -> float:
+        """최근 5개 거래량 이력 평균 대비 현재 거래량 비율"""
+        volume = self.snapshot.volume
+        volume_history = self.snapshot.volume_history
+        volume_ma = _tail_mean(volume_history, 5) if len(volume_history) >= 5 else volume
+        return volume / volume_ma if volume_ma > 0 else 1
+
+__all__ = ['FeatureBundle']
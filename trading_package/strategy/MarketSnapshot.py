@@ -0,0 +1,86 @@
+"""
+시장 데이터 스냅샷 모듈
+
+전략이 사용하는 시장 데이터를 고정 스키마의 slots 데이터클래스로 정의합니다.
+딕셔너리 조회(문자열 해싱 + 기본값 생성) 대신 속성 접근으로 값을 읽습니다.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional, Sequence, Union
+
+@dataclass(slots=True, frozen=True)
+class MarketSnapshot:
+    """
+    한 시점의 시장 데이터 (전략 입력)
+
+    Notes:
+        - 필드 이름은 기존 market_data 딕셔너리의 키와 동일
+        - 기본값은 각 전략이 사용하던 market_data.get 기본값과 동일
+        - 전략마다 기본값이 다른 필드(밴드, 구름대, 평균 거래량)는 None으로 두고
+          각 전략에서 기본값을 적용
+    """
+    # 가격
+    current_price: float = 0.0
+    price_history: Sequence[float] = ()
+    price_change_rate: float = 0.0
+
+    # 거래량
+    volume: float = 0.0
+    volume_history: Sequence[float] = ()
+    current_volume: float = 0.0
+    average_volume: Optional[float] = None
+    volume_ma: float = 0.0
+    volume_surge: float = 1.0
+
+    # RSI
+    rsi: float = 50.0
+    rsi_history: Sequence[float] = ()
+
+    # MACD
+    macd: float = 0.0
+    signal: float = 0.0
+    macd_history: Sequence[float] = ()
+
+    # 볼린저 밴드
+    upper_band: Optional[float] = None
+    lower_band: Optional[float] = None
+
+    # 스토캐스틱
+    stoch_k: float = 50.0
+    stoch_d: float = 50.0
+    stoch_k_history: Sequence[float] = ()
+    stoch_d_history: Sequence[float] = ()
+
+    # 이동평균
+    ma5: float = 0.0
+    ma20: float = 0.0
+
+    # 추세/모멘텀/심리
+    momentum: float = 0.0
+    volatility: float = 0.0
+    market_sentiment: float = 0.0
+
+    # 일목균형표
+    ichimoku_cloud_top: Optional[float] = None
+    ichimoku_cloud_bottom: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, market_data: Dict[str, Any]) -> 'MarketSnapshot':
+        """
+        market_data 딕셔너리로부터 스냅샷 생성
+
+        Notes:
+            - 스키마에 없는 키는 무시
+        """
+        return cls(**{name: market_data[name] for name in _FIELD_NAMES if name in market_data})
+
+    @classmethod
+    def of(cls, market_data: Union['MarketSnapshot', Dict[str, Any]]) -> 'MarketSnapshot':
+        """스냅샷은 그대로, 딕셔너리는 변환하여 반환"""
+        if isinstance(market_data, cls):
+            return market_data
+        return cls.from_dict(market_data)
+
+_FIELD_NAMES = tuple(field.name for field in fields(MarketSnapshot))
+
+__all__ = ['MarketSnapshot']
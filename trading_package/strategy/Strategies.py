@@ -5,11 +5,16 @@
 각 전략은 StrategyBase를 상속받아 독립적으로 동작합니다.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Union
 import numpy as np
-from .StrategyBase import StrategyBase
-import logging
+from .StrategyBase import StrategyBase, register, BATCH_DTYPE, _batch_size, _batch_column, _batch_lag, _batch_window
+from .FeatureBundle import FeatureBundle
+from .MarketSnapshot import MarketSnapshot
+from ._kernels import (_clip_hi, _clip_lo, trend_direction, trend_masks, macd_signal,
+                       moving_average_signal, momentum_signal, price_change_signal,
+                       downtrend_end_signal, uptrend_end_signal)
 
+@register
 class RSIStrategy(StrategyBase):
     """
     RSI(Relative Strength Index) 기반 투자 전략
@@ -25,8 +30,10 @@ class RSIStrategy(StrategyBase):
         - 0.2~0.3: 강한 매도 신호 (RSI > 70)
         - 0.45~0.55: 중립 구간
     """
+    __slots__ = ()
     
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
         """
         RSI 지표를 기반으로 매수/매도 신호 생성
         
@@ -42,19 +49,48 @@ class RSIStrategy(StrategyBase):
                 - 0.2~0.3: 강한 매도 신호 (RSI > 70)
                 - 0.45~0.55: 중립 구간
         """
-        rsi = market_data.get('rsi', 50)
-        rsi_history = market_data.get('rsi_history', [])
-        
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        rsi = md.rsi
+        # 이전 값이 없으면 자기 자신과 비교하여 반등/하락 조건이 모두 거짓이 되도록 함
+        prev_rsi = rsi if features.prev_rsi is None else features.prev_rsi
+        
+        # 분기 없이 조건을 모두 평가한 뒤 인덱스로 결과 선택 (0: 중립, 1: 매수, -1: 매도)
         # 하락세 종료 감지: RSI가 과매도 구간에서 반등
-        if rsi < 30 and len(rsi_history) >= 2 and rsi > rsi_history[-2]:
-            return min(0.8, 0.7 + (30 - rsi) / 100)  # 중간 변동성 범위
-            
+        buy = (rsi < 30) & (rsi > prev_rsi)
         # 상승세 종료 감지: RSI가 과매수 구간에서 하락
-        if rsi > 70 and len(rsi_history) >= 2 and rsi < rsi_history[-2]:
-            return max(0.2, 0.3 - (rsi - 70) / 100)  # 중간 변동성 범위
-            
-        return 0.5
+        sell = (rsi > 70) & (rsi < prev_rsi)
+        
+        return (
+            0.5,
+            _clip_hi(0.8, 0.7 + (30 - rsi) / 100),  # 중간 변동성 범위
+            _clip_lo(0.2, 0.3 - (rsi - 70) / 100),  # 중간 변동성 범위
+        )[int(buy) - int(sell)]
+
+    def analyze_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """
+        RSI 신호를 분기 없이 마스크 연산으로 일괄 계산
+        
+        Notes:
+            - float32로 계산
+            - 파이썬 스칼라 상수는 float32 배열을 float64로 올리지 않음
+        """
+        size = _batch_size(market_data_batch)
+        rsi = _batch_column(market_data_batch, 'rsi', 50, size).astype(np.float32)
+        prev_rsi = _batch_lag(market_data_batch, 'rsi_history', 2)
+        out = np.full(size, 0.5, dtype=BATCH_DTYPE)
+        if prev_rsi is None:
+            return out
+        prev_rsi = prev_rsi.astype(np.float32)
+        
+        buy = (rsi < 30) & (rsi > prev_rsi)
+        sell = (rsi > 70) & (rsi < prev_rsi)
+        np.copyto(out, np.minimum(0.8, 0.7 + (30 - rsi) / 100), where=buy)
+        np.copyto(out, np.maximum(0.2, 0.3 - (rsi - 70) / 100), where=sell)
+        return out
 
+@register
 class MACDStrategy(StrategyBase):
     """
     MACD(Moving Average Convergence Divergence) 기반 투자 전략
@@ -70,8 +106,9 @@ class MACDStrategy(StrategyBase):
         - 0.0~0.2: 강한 매도 신호 (MACD 하향돌파)
         - 0.45~0.55: 중립 구간
     """
+    __slots__ = ()
     
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None) -> float:
         """
         MACD 지표를 기반으로 매수/매도 신호 생성
         
@@ -88,41 +125,30 @@ class MACDStrategy(StrategyBase):
                 - 0.0~0.2: 매우 강한 매도 신호 (데드크로스)
                 - 0.4~0.6: 중립 구간
         """
-        macd = market_data.get('macd', 0)
-        signal = market_data.get('signal', 0)
-        macd_history = market_data.get('macd_history', [])
-        rsi = market_data.get('rsi', 50)
-        
-        # 추가 필요한 변수들
-        macd_hist = macd - signal
-        prev_hist = macd_history[-2] - signal if len(macd_history) >= 2 else 0
-        
-        # 최대/최소 히스토그램 계산
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        macd = md.macd
+        signal = md.signal
+        macd_history = md.macd_history
+        
+        # 추가 필요한 변수들 (이력이 없으면 직전 MACD는 NaN으로 두어 돌파 조건이 거짓이 되도록 함)
+        macd_hist = features.macd_hist
+        prev_macd = macd_history[-2] if len(macd_history) >= 2 else float('nan')
+        prev_hist = prev_macd - signal if len(macd_history) >= 2 else 0
+        
+        # 최대/최소 히스토그램 계산 (최근 10개 구간을 배열로 한 번에 계산)
         if len(macd_history) >= 10:
-            max_hist = max([h - signal for h in macd_history[-10:]])
-            min_hist = min([h - signal for h in macd_history[-10:]])
+            recent_hist = np.asarray(macd_history[-10:], dtype=np.float64) - signal
+            max_hist = float(recent_hist.max())
+            min_hist = float(recent_hist.min())
         else:
             max_hist = macd_hist if macd_hist > 0 else 0.1  # 0으로 나누기 방지
             min_hist = macd_hist if macd_hist < 0 else -0.1  # 0으로 나누기 방지
         
-        # 하락세 종료 감지: MACD가 시그널선 상향돌파
-        if macd > signal and len(macd_history) >= 2 and macd_history[-2] < signal:
-            return min(2.5, 2.0 + (macd - signal) * 2)  # 높은 변동성 범위
-            
-        # 상승세 종료 감지: MACD가 시그널선 하향돌파
-        if macd < signal and len(macd_history) >= 2 and macd_history[-2] > signal:
-            return max(-2.0, -1.5 - (signal - macd) * 2)  # 높은 변동성 범위
-            
-        # 매우 강한 매수 신호
-        if macd_hist > 0 and macd_hist > prev_hist * 1.5 and rsi < 40:
-            return min(4.0, 2.0 + macd_hist / max_hist * 2.0)
-            
-        # 매우 강한 매도 신호
-        if macd_hist < 0 and macd_hist < prev_hist * 1.5 and rsi > 60:
-            return max(-4.0, -2.0 + macd_hist / min_hist * 2.0)
-            
-        return 0.5
+        return macd_signal(macd, signal, prev_macd, prev_hist, md.rsi, max_hist, min_hist)
 
+@register
 class BollingerBandStrategy(StrategyBase):
     """
     볼린저 밴드 기반 투자 전략
@@ -138,7 +164,9 @@ class BollingerBandStrategy(StrategyBase):
         - 0.05~0.15: 매우 강한 매도 신호 (상단 돌파 후 하락)
         - 0.45~0.55: 중립 구간 (밴드 내부)
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
         """
         볼린저 밴드 기반 매수/매도 신호 생성
         
@@ -157,21 +185,47 @@ class BollingerBandStrategy(StrategyBase):
                 - 0.7: 상승세 감지
                 - 0.3: 매도 신호
         """
-        price = market_data.get('current_price', 0)
-        lower = market_data.get('lower_band', price * 0.98)
-        upper = market_data.get('upper_band', price * 1.02)
-        price_history = market_data.get('price_history', [])
-        
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        price = md.current_price
+        lower = md.lower_band if md.lower_band is not None else price * 0.98
+        upper = md.upper_band if md.upper_band is not None else price * 1.02
+        # 이전 값이 없으면 자기 자신과 비교하여 반등/하락 조건이 모두 거짓이 되도록 함
+        prev_price = price if features.prev_price is None else features.prev_price
+        
+        # 분기 없이 조건을 모두 평가한 뒤 인덱스로 결과 선택 (0: 중립, 1: 매수, -1: 매도)
         # 하락세 종료 감지: 하단밴드 터치 후 반등
-        if price <= lower and len(price_history) >= 2 and price > price_history[-2]:
-            return min(2.5, 1.8 + (lower - price) / lower * 10)
-            
+        buy = (price <= lower) & (price > prev_price)
         # 상승세 종료 감지: 상단밴드 터치 후 하락
-        if price >= upper and len(price_history) >= 2 and price < price_history[-2]:
-            return max(-2.0, -1.5 - (price - upper) / upper * 10)
-            
-        return 0.5
+        sell = (price >= upper) & (price < prev_price)
+        
+        # 선택되지 않는 값도 계산되므로 밴드가 0인 경우의 나눗셈을 방지
+        return (
+            0.5,
+            _clip_hi(2.5, 1.8 + (lower - price) / (lower or 1) * 10),
+            _clip_lo(-2.0, -1.5 - (price - upper) / (upper or 1) * 10),
+        )[int(buy) - int(sell)]
+
+    def analyze_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """볼린저 밴드 신호를 분기 없이 마스크 연산으로 일괄 계산 (가격 비교는 정밀도를 위해 float64)"""
+        size = _batch_size(market_data_batch)
+        price = _batch_column(market_data_batch, 'current_price', 0, size)
+        lower = _batch_column(market_data_batch, 'lower_band', price * 0.98, size)
+        upper = _batch_column(market_data_batch, 'upper_band', price * 1.02, size)
+        prev_price = _batch_lag(market_data_batch, 'price_history', 2)
+        out = np.full(size, 0.5, dtype=BATCH_DTYPE)
+        if prev_price is None:
+            return out
+        
+        buy = (price <= lower) & (price > prev_price)
+        sell = (price >= upper) & (price < prev_price)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.copyto(out, np.maximum(-2.0, -1.5 - (price - upper) / upper * 10), where=sell)
+            np.copyto(out, np.minimum(2.5, 1.8 + (lower - price) / lower * 10), where=buy)
+        return out
 
+@register
 class VolumeStrategy(StrategyBase):
     """
     거래량 기반 투자 전략
@@ -187,7 +241,9 @@ class VolumeStrategy(StrategyBase):
         - 0.2~0.3: 강한 매도 신호 (거래량 급감 + 가격 하락)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
         """
         Args:
             market_data (Dict[str, Any]): 시장 데이터
@@ -201,29 +257,31 @@ class VolumeStrategy(StrategyBase):
                 - 0.8: 상승세 감지 (거래량 증가 + 상승추세)
                 - 0.4: 중립적 신호
         """
-        current_volume = market_data.get('current_volume', 0)
-        average_volume = market_data.get('average_volume', current_volume)
-        price_history = market_data.get('price_history', [])
-        volume_history = market_data.get('volume_history', [])
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        price_history = md.price_history
+        volume_history = md.volume_history
         
         if len(price_history) < 2 or len(volume_history) < 2:
             return 0.5
             
-        volume_ratio = current_volume / average_volume if average_volume > 0 else 1
-        price_change = (price_history[-1] / price_history[-2] - 1) * 100
+        volume_ratio = features.volume_ratio
+        price_change = features.short_change_pct
         
         # 하락세 종료 감지: 거래량 급증 + 가격 반등
         if (volume_ratio > 1.5 and price_change > 0 and 
             volume_history[-1] > volume_history[-2] * 1.3):
-            return min(0.75, 0.65 + (volume_ratio - 1.5) * 0.1)
+            return _clip_hi(0.75, 0.65 + (volume_ratio - 1.5) * 0.1)
             
         # 상승세 종료 감지: 거래량 급감 + 가격 하락
         if (volume_ratio < 0.7 and price_change < 0 and 
             volume_history[-1] < volume_history[-2] * 0.7):
-            return max(0.25, 0.35 - (0.7 - volume_ratio) * 0.1)
+            return _clip_lo(0.25, 0.35 - (0.7 - volume_ratio) * 0.1)
             
         return 0.5
 
+@register
 class PriceChangeStrategy(StrategyBase):
     """
     가격 변화율 기반 투자 전략
@@ -239,7 +297,8 @@ class PriceChangeStrategy(StrategyBase):
         - 0.0~0.2: 매우 강한 매도 신호 (급격한 상승 후 하락)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None) -> float:
         """
         가격 변동 분석을 통한 매수/매도 신호 생성
         
@@ -254,29 +313,24 @@ class PriceChangeStrategy(StrategyBase):
                 - 0.0~0.2: 매우 강한 매도 신호 (급격한 하락)
                 - 0.45~0.55: 중립 구간
         """
-        price_history = market_data.get('price_history', [])
-        volume_history = market_data.get('volume_history', [])
-        rsi = market_data.get('rsi', 50)
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        price_history = md.price_history
+        volume_history = md.volume_history
         
         if len(price_history) < 3 or len(volume_history) < 3:
             return 0.5
             
-        # 최근 가격 변화율 계산
-        short_term_change = (price_history[-1] / price_history[-2] - 1) * 100
-        long_term_change = (price_history[-1] / price_history[-3] - 1) * 100
-        
-        # 하락세 종료 감지: 급격한 하락 후 반등
-        if (short_term_change > 0 and long_term_change < -5 and 
-            volume_history[-1] > volume_history[-2] and rsi < 40):
-            return min(2.5, 2.0 + abs(long_term_change) / 25)  # 매우 높은 변동성 범위
-            
-        # 상승세 종료 감지: 급격한 상승 후 하락
-        if (short_term_change < 0 and long_term_change > 5 and 
-            volume_history[-1] > volume_history[-2] and rsi > 60):
-            return max(-2.0, -1.5 - short_term_change / 25)  # 매우 높은 변동성 범위
-            
-        return 0.5
+        # 최근 가격 변화율 기준으로 급격한 하락 후 반등 / 급격한 상승 후 하락 감지
+        return price_change_signal(
+            features.short_change_pct,
+            features.long_change_pct,
+            volume_history[-1] > volume_history[-2],
+            md.rsi
+        )
 
+@register
 class MovingAverageStrategy(StrategyBase):
     """
     이동평균선 기반 투자 전략
@@ -292,7 +346,8 @@ class MovingAverageStrategy(StrategyBase):
         - 0.3~0.4: 매도 신호 (단기선 하향 돌파)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None) -> float:
         """
         이동평균선 분석을 통한 매수/매도 신호 생성
         
@@ -307,27 +362,19 @@ class MovingAverageStrategy(StrategyBase):
                 - 0.7: 매수 신호 (단기선 상향 돌파)
                 - 0.3: 매도 신호 (단기선 하향 돌파)
         """
-        ma5 = market_data.get('ma5', 0)
-        ma20 = market_data.get('ma20', 0)
-        price = market_data.get('current_price', 0)
-        price_history = market_data.get('price_history', [])
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        ma5 = md.ma5
+        ma20 = md.ma20
         
-        if not all([ma5, ma20, price]) or len(price_history) < 2:
+        if not all([ma5, ma20, md.current_price]) or features.prev_price is None:
             return 0.5
             
-        ma_diff_ratio = (ma5 - ma20) / ma20 * 100
-        price_change = (price / price_history[-2] - 1) * 100
-        
-        # 하락세 종료 감지: 단기선이 장기선 접근 + 가격 반등
-        if ma5 < ma20 and ma_diff_ratio > -2 and price_change > 0:
-            return min(0.7, 0.6 + abs(ma_diff_ratio) / 10)  # 낮은 변동성 범위
-            
-        # 상승세 종료 감지: 단기선이 장기선 이탈 + 가격 하락
-        if ma5 > ma20 and ma_diff_ratio < 2 and price_change < 0:
-            return max(0.3, 0.4 - abs(ma_diff_ratio) / 10)  # 낮은 변동성 범위
-            
-        return 0.5
+        # 단기선/장기선 괴리율과 가격 변화율로 추세 전환 감지
+        return moving_average_signal(ma5, ma20, features.ma_diff_ratio, features.price_change_pct)
 
+@register
 class MomentumStrategy(StrategyBase):
     """
     모멘텀 기반 투자 전략
@@ -343,7 +390,8 @@ class MomentumStrategy(StrategyBase):
         - 0.0~0.2: 강한 매도 신호 (강한 하락 모멘텀)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None) -> float:
         """
         모멘텀 분석을 통한 매수/매도 신호 생성
         
@@ -357,24 +405,17 @@ class MomentumStrategy(StrategyBase):
                 - 1.0: 매수 신호 (양의 모멘텀)
                 - 0.4: 매도 신호 (음의 모멘텀)
         """
-        momentum = market_data.get('momentum', 0)
-        volume_surge = market_data.get('volume_surge', 1)
-        rsi = market_data.get('rsi', 50)
-        price_history = market_data.get('price_history', [])
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
         
-        if len(price_history) < 2:
+        if len(md.price_history) < 2:
             return 0.5
 
-        # 하락세 종료 감지: 모멘텀 반등 + 거래량 증가
-        if momentum > -0.3 and momentum < 0 and volume_surge > 1.2 and rsi < 40:
-            return min(2.5, 1.8 + abs(momentum) * 2)  # 높은 변동성 범위
-            
-        # 상승세 종료 감지: 모멘텀 약화 + 거래량 감소
-        if momentum < 0.3 and momentum > 0 and volume_surge < 0.8 and rsi > 60:
-            return max(-2.0, -1.5 - momentum * 2)  # 높은 변동성 범위
-            
-        return 0.5
+        # 모멘텀 반등/약화와 거래량 변화로 추세 전환 감지
+        return momentum_signal(md.momentum, md.volume_surge, md.rsi)
 
+@register
 class StochasticStrategy(StrategyBase):
     """
     스토캐스틱 기반 투자 전략
@@ -390,7 +431,9 @@ class StochasticStrategy(StrategyBase):
         - 0.0~0.2: 매우 강한 매도 신호 (과매수 하락)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
         """
         스토캐스틱 분석을 통한 매수/매도 신호 생성
         
@@ -408,38 +451,67 @@ class StochasticStrategy(StrategyBase):
                 - 0.1: 강한 매도 신호 (과매수)
                 - 0.5: 중립
         """
-        k = market_data.get('stoch_k', 50)
-        d = market_data.get('stoch_d', 50)
-        k_history = market_data.get('stoch_k_history', [])
-        d_history = market_data.get('stoch_d_history', [])
-        volume = market_data.get('volume', 0)
-        volume_ma = market_data.get('volume_ma', 0)
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        k = md.stoch_k
+        d = md.stoch_d
+        k_history = md.stoch_k_history
+        d_history = md.stoch_d_history
         
         # 이전 값 계산
         prev_k = k_history[-2] if len(k_history) >= 2 else k
         prev_d = d_history[-2] if len(d_history) >= 2 else d
         
         # 거래량 확인
-        volume_surge = volume / volume_ma if volume_ma > 0 else 1
+        volume_surge = features.volume_surge
         
+        # 분기 없이 조건을 모두 평가한 뒤 인덱스로 결과 선택
+        # (매우 강한 신호는 일반 신호 조건을 포함하므로 두 조건의 합이 신호 단계가 됨)
         # 매우 강한 매수 신호 (과매도 구간에서 반등)
-        if k < 20 and k > d and prev_k < prev_d and volume_surge > 1.2:
-            return min(4.0, 2.0 + (20 - k) / 20 * 2.0)
-        
+        strong_buy = (k < 20) & (k > d) & (prev_k < prev_d) & (volume_surge > 1.2)
         # 매우 강한 매도 신호 (과매수 구간에서 하락)
-        if k > 80 and k < d and prev_k > prev_d and volume_surge > 1.2:
-            return max(-4.0, -2.0 - (k - 80) / 20 * 2.0)
-        
+        strong_sell = (k > 80) & (k < d) & (prev_k > prev_d) & (volume_surge > 1.2)
         # 일반적인 매수 신호
-        if k < 30 and k > d:
-            return min(2.5, 1.5 + (30 - k) / 30)
-            
+        buy = (k < 30) & (k > d)
         # 일반적인 매도 신호
-        if k > 70 and k < d:
-            return max(-2.5, -1.5 - (k - 70) / 30)
-            
-        return 0.5
+        sell = (k > 70) & (k < d)
+        
+        return (
+            0.5,
+            _clip_hi(2.5, 1.5 + (30 - k) / 30),
+            _clip_hi(4.0, 2.0 + (20 - k) / 20 * 2.0),
+            _clip_lo(-4.0, -2.0 - (k - 80) / 20 * 2.0),
+            _clip_lo(-2.5, -1.5 - (k - 70) / 30),
+        )[int(buy) + int(strong_buy) - int(sell) - int(strong_sell)]
+
+    def analyze_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """스토캐스틱 신호를 분기 없이 마스크 연산으로 일괄 계산 (0~100 범위 지표는 float32)"""
+        size = _batch_size(market_data_batch)
+        k = _batch_column(market_data_batch, 'stoch_k', 50, size, dtype=np.float32)
+        d = _batch_column(market_data_batch, 'stoch_d', 50, size, dtype=np.float32)
+        volume = _batch_column(market_data_batch, 'volume', 0, size)
+        volume_ma = _batch_column(market_data_batch, 'volume_ma', 0, size)
+        prev_k = _batch_lag(market_data_batch, 'stoch_k_history', 2, dtype=np.float32)
+        prev_d = _batch_lag(market_data_batch, 'stoch_d_history', 2, dtype=np.float32)
+        prev_k = k if prev_k is None else prev_k
+        prev_d = d if prev_d is None else prev_d
+        
+        has_volume_ma = volume_ma > 0
+        volume_surge = np.where(has_volume_ma, volume / np.where(has_volume_ma, volume_ma, 1), 1)
+        surge = volume_surge > 1.2
+        
+        # 우선순위가 낮은 조건부터 덮어써서 스칼라 analyze의 if 순서를 유지
+        out = np.full(size, 0.5, dtype=BATCH_DTYPE)
+        np.copyto(out, np.maximum(-2.5, -1.5 - (k - 70) / 30), where=(k > 70) & (k < d))
+        np.copyto(out, np.minimum(2.5, 1.5 + (30 - k) / 30), where=(k < 30) & (k > d))
+        np.copyto(out, np.maximum(-4.0, -2.0 - (k - 80) / 20 * 2.0),
+                  where=(k > 80) & (k < d) & (prev_k > prev_d) & surge)
+        np.copyto(out, np.minimum(4.0, 2.0 + (20 - k) / 20 * 2.0),
+                  where=(k < 20) & (k > d) & (prev_k < prev_d) & surge)
+        return out
 
+@register
 class IchimokuStrategy(StrategyBase):
     """
     일목균형표 기반 투자 전략
@@ -455,7 +527,9 @@ class IchimokuStrategy(StrategyBase):
         - 0.2~0.3: 강한 매도 신호 (구름대 하향 돌파)
         - 0.4~0.6: 중립 구간 (구름대 내)
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
         """
         일목균형표 분석을 통한 매수/매도 신호 생성
         
@@ -472,21 +546,25 @@ class IchimokuStrategy(StrategyBase):
                 - 0.3: 매도 신호 (구름대 하향 돌파)
                 - 0.5: 중립 (구름대 내)
         """
-        price = market_data.get('current_price', 0)
-        cloud_top = market_data.get('ichimoku_cloud_top', price)
-        cloud_bottom = market_data.get('ichimoku_cloud_bottom', price)
-        price_history = market_data.get('price_history', [])
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        price = md.current_price
+        cloud_top = md.ichimoku_cloud_top if md.ichimoku_cloud_top is not None else price
+        cloud_bottom = md.ichimoku_cloud_bottom if md.ichimoku_cloud_bottom is not None else price
+        prev_price = features.prev_price
         
         # 하락세 종료 감지: 구름대 하단 지지 후 반등
-        if price <= cloud_bottom and len(price_history) >= 2 and price > price_history[-2]:
-            return min(0.8, 0.7 + (cloud_bottom - price) / cloud_bottom * 0.1)
+        if price <= cloud_bottom and prev_price is not None and price > prev_price:
+            return _clip_hi(0.8, 0.7 + (cloud_bottom - price) / cloud_bottom * 0.1)
             
         # 상승세 종료 감지: 구름대 상단 저항 후 하락
-        if price >= cloud_top and len(price_history) >= 2 and price < price_history[-2]:
-            return max(0.2, 0.3 - (price - cloud_top) / cloud_top * 0.1)
+        if price >= cloud_top and prev_price is not None and price < prev_price:
+            return _clip_lo(0.2, 0.3 - (price - cloud_top) / cloud_top * 0.1)
             
         return 0.5
 
+@register
 class MarketSentimentStrategy(StrategyBase):
     """
     시장 심리 기반 투자 전략
@@ -502,7 +580,9 @@ class MarketSentimentStrategy(StrategyBase):
         - 0.3~0.4: 매도 신호 (부정적 심리)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
         """
         시장 심리 분석을 통한 매수/매도 신호 생성
         Args:
@@ -510,22 +590,26 @@ class MarketSentimentStrategy(StrategyBase):
                 필수 키:
                 - market_sentiment: 시장 심리 지수 (-1 ~ 1)
         """
-        sentiment = market_data.get('market_sentiment', 0)
-        volume_change = market_data.get('volume_surge', 1)
-        price_change = market_data.get('price_change_rate', 0)
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        sentiment = md.market_sentiment
+        volume_change = md.volume_surge
+        price_change = md.price_change_rate
         
         normalized = (sentiment + 1) / 2
         
         # 하락세 종료 감지: 시장 심리 개선 + 거래량 증가
         if normalized < 0.4 and volume_change > 1.2 and price_change > 0:
-            return min(0.7, 0.6 + (volume_change - 1.2) * 0.5)  # 낮은 변동성 범위
+            return _clip_hi(0.7, 0.6 + (volume_change - 1.2) * 0.5)  # 낮은 변동성 범위
             
         # 상승세 종료 감지: 시장 심리 악화 + 거래량 감소
         if normalized > 0.6 and volume_change < 0.8 and price_change < 0:
-            return max(0.3, 0.4 - (0.8 - volume_change) * 0.5)  # 낮은 변동성 범위
+            return _clip_lo(0.3, 0.4 - (0.8 - volume_change) * 0.5)  # 낮은 변동성 범위
             
         return 0.5
 
+@register
 class DivergenceStrategy(StrategyBase):
     """
     다이버전스 기반 투자 전략
@@ -537,30 +621,33 @@ class DivergenceStrategy(StrategyBase):
         - MACD, RSI 다이버전스 동시 분석
         - 강력한 추세 전환 신호 생성
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None,
+                _clip_hi=_clip_hi, _clip_lo=_clip_lo) -> float:
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
         # 기본 데이터 가져오기
-        price = market_data.get('current_price', 0)
-        price_history = market_data.get('price_history', [])
-        rsi = market_data.get('rsi', 50)
-        rsi_history = market_data.get('rsi_history', [])
-        macd = market_data.get('macd', 0)
-        macd_history = market_data.get('macd_history', [])
-        volume = market_data.get('volume', 0)
-        volume_ma = market_data.get('volume_ma', 0)
+        price = md.current_price
+        price_history = md.price_history
+        rsi = md.rsi
+        rsi_history = md.rsi_history
+        macd = md.macd
+        macd_history = md.macd_history
         
         if len(price_history) < 3 or len(rsi_history) < 3 or len(macd_history) < 3:
             return 0.5
             
-        # 가격과 지표의 방향성 확인
-        price_down = price < price_history[-2] < price_history[-3]
-        price_up = price > price_history[-2] > price_history[-3]
-        rsi_down = rsi < rsi_history[-2] < rsi_history[-3]
-        rsi_up = rsi > rsi_history[-2] > rsi_history[-3]
-        macd_down = macd < macd_history[-2] < macd_history[-3]
-        macd_up = macd > macd_history[-2] > macd_history[-3]
+        # 가격과 지표의 방향성 확인 (history[-3] -> history[-2] -> 현재값)
+        price_direction = trend_direction(price_history[-3], price_history[-2], price)
+        rsi_direction = trend_direction(rsi_history[-3], rsi_history[-2], rsi)
+        macd_direction = trend_direction(macd_history[-3], macd_history[-2], macd)
+        price_down, price_up = price_direction < 0, price_direction > 0
+        rsi_down, rsi_up = rsi_direction < 0, rsi_direction > 0
+        macd_down, macd_up = macd_direction < 0, macd_direction > 0
         
         # 거래량 확인
-        volume_surge = volume / volume_ma if volume_ma > 0 else 1
+        volume_surge = features.volume_surge
         volume_up = volume_surge > 1.2
         volume_down = volume_surge < 0.8
         
@@ -570,23 +657,68 @@ class DivergenceStrategy(StrategyBase):
         # 매우 강한 긍정적 다이버전스 (가격 하락 + 지표 상승)
         if (price_down and (rsi_up and macd_up) and volume_up and 
             rsi < 40 and volume_surge > 1.5):
-            return min(4.0, 2.0 + rsi_strength * 2.0)
+            return _clip_hi(4.0, 2.0 + rsi_strength * 2.0)
         
         # 매우 강한 부정적 다이버전스 (가격 상승 + 지표 하락)
         if (price_up and (rsi_down and macd_down) and volume_down and 
             rsi > 60 and volume_surge < 0.5):
-            return max(-4.0, -2.0 - rsi_strength * 2.0)
+            return _clip_lo(-4.0, -2.0 - rsi_strength * 2.0)
         
         # 일반적인 긍정적 다이버전스
         if price_down and (rsi_up or macd_up) and volume_up:
-            return min(2.5, 1.5 + rsi_strength)
+            return _clip_hi(2.5, 1.5 + rsi_strength)
             
         # 일반적인 부정적 다이버전스
         if price_up and (rsi_down or macd_down) and volume_down:
-            return max(-2.5, -1.5 - rsi_strength)
+            return _clip_lo(-2.5, -1.5 - rsi_strength)
             
         return 0.5
 
+    def analyze_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """
+        다이버전스 신호를 분기 없이 마스크 연산으로 일괄 계산
+        
+        Notes:
+            - 가격/RSI/MACD의 (history[-3], history[-2], 현재값) 구간은 길이가 고정이므로
+              차분 배열을 만들지 않고 열 간 비교로 펼쳐서 방향 판정
+            - 가격 비교는 정밀도를 위해 float64
+        """
+        size = _batch_size(market_data_batch)
+        out = np.full(size, 0.5, dtype=BATCH_DTYPE)
+        windows = [_batch_window(market_data_batch, key, 3)
+                   for key in ('price_history', 'rsi_history', 'macd_history')]
+        if any(window is None for window in windows):
+            return out
+        
+        price = _batch_column(market_data_batch, 'current_price', 0, size)
+        rsi = _batch_column(market_data_batch, 'rsi', 50, size)
+        macd = _batch_column(market_data_batch, 'macd', 0, size)
+        volume = _batch_column(market_data_batch, 'volume', 0, size)
+        volume_ma = _batch_column(market_data_batch, 'volume_ma', 0, size)
+        
+        (price_up, price_down), (rsi_up, rsi_down), (macd_up, macd_down) = (
+            trend_masks(window[:, 0], window[:, 1], current)
+            for window, current in zip(windows, (price, rsi, macd))
+        )
+        
+        has_volume_ma = volume_ma > 0
+        volume_surge = np.where(has_volume_ma, volume / np.where(has_volume_ma, volume_ma, 1), 1)
+        volume_up = volume_surge > 1.2
+        volume_down = volume_surge < 0.8
+        rsi_strength = np.abs(50 - rsi) / 50
+        
+        # 우선순위가 낮은 조건부터 덮어써서 스칼라 analyze의 if 순서를 유지
+        np.copyto(out, np.maximum(-2.5, -1.5 - rsi_strength),
+                  where=price_up & (rsi_down | macd_down) & volume_down)
+        np.copyto(out, np.minimum(2.5, 1.5 + rsi_strength),
+                  where=price_down & (rsi_up | macd_up) & volume_up)
+        np.copyto(out, np.maximum(-4.0, -2.0 - rsi_strength * 2.0),
+                  where=price_up & rsi_down & macd_down & volume_down & (rsi > 60) & (volume_surge < 0.5))
+        np.copyto(out, np.minimum(4.0, 2.0 + rsi_strength * 2.0),
+                  where=price_down & rsi_up & macd_up & volume_up & (rsi < 40) & (volume_surge > 1.5))
+        return out
+
+@register
 class DowntrendEndStrategy(StrategyBase):
     """
     하락장 종료 감지 전략
@@ -598,60 +730,28 @@ class DowntrendEndStrategy(StrategyBase):
         - 여러 지표의 복합적 분석
         - 반등 매수 기회 포착
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
-        # 기본 데이터 가져오기
-        price = market_data.get('current_price', 0)
-        price_history = market_data.get('price_history', [])
-        volume = market_data.get('volume', 0)
-        volume_history = market_data.get('volume_history', [])
-        rsi = market_data.get('rsi', 50)
-        macd = market_data.get('macd', 0)
-        signal = market_data.get('signal', 0)
-        bb_lower = market_data.get('lower_band', price * 0.95)
-        
-        if len(price_history) < 3 or len(volume_history) < 3:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None) -> float:
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        # 이력이 부족하면 다른 값을 읽기 전에 중립 반환
+        if len(md.price_history) < 3 or len(md.volume_history) < 3:
             return 0.5
             
-        # 가격 변화율 계산
-        price_change = (price / price_history[-2] - 1) * 100
-        prev_price_change = (price_history[-2] / price_history[-3] - 1) * 100
-        
-        # 거래량 변화 계산
-        volume_ma = sum(volume_history[-5:]) / 5 if len(volume_history) >= 5 else volume
-        volume_surge = volume / volume_ma if volume_ma > 0 else 1
-        
-        # MACD 히스토그램
-        macd_hist = macd - signal
-        
-        # 매우 강한 반등 신호
-        if (price_change > 0 and prev_price_change < -2 and  # 가격 반등
-            volume_surge > 1.5 and  # 거래량 급증
-            rsi < 35 and  # 과매도
-            price <= bb_lower and  # 볼린저 밴드 하단 터치
-            macd_hist > 0):  # MACD 반등
-            
-            return min(4.0, 2.0 + abs(prev_price_change) / 5)
-        
-        # 매우 강한 하락 지속 신호
-        if (price_change < -2 and prev_price_change < -2 and  # 하락 지속
-            volume_surge > 1.5 and  # 거래량 급증
-            rsi > 65 and  # 과매수
-            macd_hist < 0):  # MACD 하락
-            
-            return max(-4.0, -2.0 - abs(price_change) / 5)
-        
-        # 일반적인 반등 신호
-        if (price_change > 0 and prev_price_change < -1 and 
-            volume_surge > 1.2 and rsi < 40):
-            return min(2.5, 1.5 + volume_surge / 2)
-            
-        # 일반적인 하락 지속 신호
-        if (price_change < -1 and prev_price_change < -1 and 
-            volume_surge > 1.2 and rsi > 60):
-            return max(-2.5, -1.5 - volume_surge / 2)
-            
-        return 0.5
+        # 기본 데이터 가져오기
+        price = md.current_price
+        bb_lower = md.lower_band if md.lower_band is not None else price * 0.95
+        
+        return downtrend_end_signal(
+            price, bb_lower, md.rsi,
+            features.price_change_pct,      # 가격 변화율
+            features.prev_change_pct,       # 직전 구간 가격 변화율
+            features.history_volume_surge,  # 거래량 변화
+            features.macd_hist,             # MACD 히스토그램
+        )
 
+@register
 class UptrendEndStrategy(StrategyBase):
     """
     상승장 종료 감지 전략
@@ -668,7 +768,8 @@ class UptrendEndStrategy(StrategyBase):
         - 1.3~1.5: 매우 강한 매수 신호 (상승 지속)
         - 0.45~0.55: 중립 구간
     """
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    def analyze(self, market_data: Union[MarketSnapshot, Dict[str, Any]], features: Optional[FeatureBundle] = None) -> float:
         """
         상승장 종료 신호 분석
         
@@ -687,29 +788,54 @@ class UptrendEndStrategy(StrategyBase):
                 - 0.5: 중립
                 - 0.7: 상승 지속
         """
-        try:
-            momentum = market_data.get('momentum', 0)
-            rsi = market_data.get('rsi', 50)
-            current_volume = market_data.get('current_volume', 0)
-            average_volume = market_data.get('average_volume', 1)
-            volatility = market_data.get('volatility', 0)
-            
-            # 거래량 변화율
-            volume_ratio = current_volume / average_volume if average_volume > 0 else 1
-            
-            # 상승 추세 종료 + 하락 확인
-            if momentum < 0.3 and rsi > 70 and volume_ratio < 0.8 and volatility > 0.2:
-                return max(-2.0, -1.5 - momentum * volatility)  # 매우 높은 변동성 범위
-                
-            # 상승 지속
-            if momentum > 0.7 and volume_ratio > 1.2:
-                return min(2.5, 2.0 + momentum * 0.5)  # 매우 높은 변동성 범위
-                
-            return 0.5
-            
-        except Exception as e:
-            logging.error(f"UptrendEndStrategy 분석 중 오류: {str(e)}")
-            return 0.5
+        if features is None:
+            features = FeatureBundle(market_data)
+        md = features.snapshot
+        return uptrend_end_signal(md.momentum, md.rsi, features.uptrend_volume_ratio, md.volatility)
+
+# fused_scalar_signals가 한 번에 계산하는 전략 (반환 순서와 동일)
+FUSED_SCALAR_STRATEGIES = (MovingAverageStrategy, MomentumStrategy, PriceChangeStrategy)
+
+def fused_scalar_signals(market_data: Union[MarketSnapshot, Dict[str, Any]],
+                         features: FeatureBundle) -> Tuple[float, float, float]:
+    """
+    이동평균/모멘텀/가격 변화율 전략 신호를 한 번에 계산
+    
+    Args:
+        market_data: 시장 데이터 (features.snapshot을 사용하므로 평가 함수 시그니처 호환용)
+        features (FeatureBundle): 전략 간 공유 파생 지표
+    
+    Returns:
+        Tuple[float, float, float]: FUSED_SCALAR_STRATEGIES 순서의 신호 강도
+        
+    Notes:
+        - StrategyManager 평가 함수가 세 전략의 analyze를 각각 호출하는 대신 사용 (결과 동일)
+        - 스냅샷 필드를 한 번씩만 읽고 세 커널을 연달아 호출
+    """
+    md = features.snapshot
+    price_history = md.price_history
+    volume_history = md.volume_history
+    rsi = md.rsi
+    ma5 = md.ma5
+    ma20 = md.ma20
+    
+    if not all([ma5, ma20, md.current_price]) or features.prev_price is None:
+        moving_average = 0.5
+    else:
+        moving_average = moving_average_signal(ma5, ma20, features.ma_diff_ratio, features.price_change_pct)
+    
+    if len(price_history) < 2:
+        momentum = 0.5
+    else:
+        momentum = momentum_signal(md.momentum, md.volume_surge, rsi)
+    
+    if len(price_history) < 3 or len(volume_history) < 3:
+        price_change = 0.5
+    else:
+        price_change = price_change_signal(features.short_change_pct, features.long_change_pct,
+                                           volume_history[-1] > volume_history[-2], rsi)
+    
+    return moving_average, momentum, price_change
 
 __all__ = [
     'RSIStrategy',
@@ -4,7 +4,91 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+from typing import Dict, Any, List, Callable, Optional, Union
+import numpy as np
+
+# 배치 경로의 신호 출력 타입 (신호는 유효 자릿수가 작아 float32로 충분하며 SIMD 레인이 2배)
+BATCH_DTYPE = np.float32
+
+# 임계값 비교 결과 인덱스별 투자 결정 (0: 매도 임계값 이하, 1: 중립, 2: 매수 임계값 이상)
+_DECISIONS = ("sell", "hold", "buy")
+_DECISION_ARRAY = np.array(_DECISIONS)
+
+# @register로 등록된 전략 클래스 (정의 순서 유지)
+_REGISTRY: List[type] = []
+
+# 검색된 전략 클래스 목록 (프로세스당 한 번만 검색, 인스턴스가 아닌 클래스를 보관)
+_STRATEGY_CLASSES: Optional[List[type]] = None
+_STRATEGY_CLASSES_LOCK = threading.Lock()
+
+def _batch_size(market_data_batch: Dict[str, Any]) -> int:
+    """배치(SoA) 시장 데이터의 종목 수를 반환"""
+    for value in market_data_batch.values():
+        return len(value)
+    return 0
+
+def _batch_column(market_data_batch: Dict[str, Any], key: str, default, size: int,
+                  dtype=np.float64) -> np.ndarray:
+    """
+    배치 데이터에서 스칼라 지표 열을 float 배열로 가져오기
+
+    Notes:
+        - 키가 없으면 default(스칼라 또는 배열)를 종목 수만큼 브로드캐스트
+        - 범위가 작은 지표(RSI, 스토캐스틱)는 float32, 가격/거래량은 float64 권장
+    """
+    if key in market_data_batch:
+        return np.asarray(market_data_batch[key], dtype=dtype)
+    return np.broadcast_to(np.asarray(default, dtype=dtype), (size,))
+
+def _batch_lag(market_data_batch: Dict[str, Any], key: str, lag: int,
+               dtype=np.float64) -> Optional[np.ndarray]:
+    """
+    배치 이력 데이터(종목 수 x 이력 길이)에서 history[-lag] 열을 가져오기
+
+    Returns:
+        Optional[np.ndarray]: 이력이 없거나 길이가 부족하면 None
+            (스칼라 analyze의 len(history) >= lag 조건과 동일)
+    """
+    history = market_data_batch.get(key)
+    if history is None:
+        return None
+    history = np.asarray(history)
+    if history.ndim != 2 or history.shape[1] < lag:
+        return None
+    return history[:, -lag].astype(dtype, copy=False)
+
+def _batch_window(market_data_batch: Dict[str, Any], key: str, width: int,
+                  dtype=np.float64) -> Optional[np.ndarray]:
+    """
+    배치 이력 데이터에서 최근 width개 열(종목 수 x width)을 가져오기
+
+    Returns:
+        Optional[np.ndarray]: 이력이 없거나 길이가 부족하면 None
+    """
+    history = market_data_batch.get(key)
+    if history is None:
+        return None
+    history = np.asarray(history)
+    if history.ndim != 2 or history.shape[1] < width:
+        return None
+    return history[:, -width:].astype(dtype, copy=False)
+
+def register(strategy_class: type) -> type:
+    """
+    전략 클래스를 StrategyManager 자동 로드 대상으로 등록하는 데코레이터
+
+    Args:
+        strategy_class (type): StrategyBase를 상속받은 구현 클래스
+
+    Returns:
+        type: 전달받은 클래스 그대로 (클래스 정의에 영향 없음)
+    """
+    if strategy_class not in _REGISTRY:
+        _REGISTRY.append(strategy_class)
+    return strategy_class
 
 class StrategyBase(ABC):
     """
@@ -16,19 +100,24 @@ class StrategyBase(ABC):
         - 각 전략은 독립적으로 동작하며, 시장 데이터를 분석하여 매수/매도 신호를 생성
         - 반환값은 0~1 사이의 값으로, 1에 가까울수록 강한 매수 신호를 의미
     """
+    # 전략은 인스턴스 상태를 갖지 않으므로 하위 클래스도 __slots__ = ()로 __dict__ 생성 생략
+    __slots__ = ()
     
     @abstractmethod
-    def analyze(self, market_data: Dict[str, Any]) -> float:
+    def analyze(self, market_data: Union['MarketSnapshot', Dict[str, Any]], features: Optional['FeatureBundle'] = None) -> float:
         """
         시장 데이터를 분석하여 매수/매도 신호를 생성하는 추상 메서드
         
         Args:
-            market_data (Dict[str, Any]): 분석할 시장 데이터
+            market_data (Union[MarketSnapshot, Dict[str, Any]]): 분석할 시장 데이터
+                (딕셔너리는 MarketSnapshot으로 변환되어 속성으로 접근)
                 필수 포함 정보:
                 - current_price: 현재 가격
                 - volume: 거래량
                 - price_history: 가격 이력
                 - technical_indicators: 기술적 지표들
+            features (Optional[FeatureBundle]): 전략 간 공유 파생 지표
+                - 없으면 전략 내부에서 market_data로부터 생성
         
         Returns:
             float: 0~1 사이의 값으로 표현된 매수 신호 강도
@@ -42,6 +131,26 @@ class StrategyBase(ABC):
         """
         pass
 
+    def analyze_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """
+        여러 종목의 시장 데이터를 한 번에 분석
+
+        Args:
+            market_data_batch (Dict[str, Any]): 열 단위(SoA) 시장 데이터
+                - 스칼라 지표: 길이 N 배열 (예: rsi)
+                - 이력 지표: N x H 배열 (예: rsi_history)
+
+        Returns:
+            np.ndarray: 종목별 신호 강도 (길이 N, BATCH_DTYPE)
+
+        Notes:
+            - 기본 구현은 종목별로 analyze를 호출
+            - 분기가 단순한 전략은 마스크 연산으로 재정의하여 분기 없이 계산
+        """
+        size = _batch_size(market_data_batch)
+        rows = ({key: value[i] for key, value in market_data_batch.items()} for i in range(size))
+        return np.fromiter((self.analyze(row) for row in rows), dtype=BATCH_DTYPE, count=size)
+
 class StrategyManager:
     """
     전략 관리자 클래스
@@ -52,19 +161,28 @@ class StrategyManager:
         strategies (List[StrategyBase]): 등록된 전략 목록
         buy_threshold (float): 매수 결정 임계값
         sell_threshold (float): 매도 결정 임계값
+        parallel_threshold (int): 배치 평가 시 스레드 풀을 사용하는 최소 종목 수
+        weights (np.ndarray): 전략별 가중치 (strategies와 같은 순서, 기본값 1)
     """
 
-    def __init__(self, buy_threshold: float = 0.65, sell_threshold: float = 0.35):
+    def __init__(self, buy_threshold: float = 0.65, sell_threshold: float = 0.35,
+                 parallel_threshold: int = 256):
         """
         StrategyManager 초기화
         
         Args:
             buy_threshold (float, optional): 매수 결정 임계값. Defaults to 0.65.
             sell_threshold (float, optional): 매도 결정 임계값. Defaults to 0.35.
+            parallel_threshold (int, optional): 스레드 풀 사용 최소 종목 수. Defaults to 256.
         """
         self.strategies: List[StrategyBase] = self._load_all_strategies()
         self.buy_threshold = buy_threshold
         self.sell_threshold = sell_threshold
+        self.parallel_threshold = parallel_threshold
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.weights = np.ones(len(self.strategies))
+        self._evaluate = self._build_evaluator()
+        self._weights = self._build_weights()
         
     def _load_all_strategies(self) -> List[StrategyBase]:
         """
@@ -74,41 +192,138 @@ class StrategyManager:
             List[StrategyBase]: 초기화된 전략 객체 리스트
             
         Notes:
-            - strategy 패키지 내의 모든 전략 클래스를 자동으로 검색
-            - StrategyBase를 상속받은 실제 구현 클래스만 로드
-            - 추상 클래스는 제외
+            - strategy 패키지 내의 모듈에서 @register로 등록된 전략 클래스를 로드
+            - 검색 결과(클래스 목록)는 모듈 전역에 캐시하고 호출마다 새 인스턴스 생성
+        """
+        global _STRATEGY_CLASSES
+        if _STRATEGY_CLASSES is None:
+            # 여러 스레드가 동시에 관리자를 생성해도 검색은 한 번만 수행
+            with _STRATEGY_CLASSES_LOCK:
+                if _STRATEGY_CLASSES is None:
+                    _STRATEGY_CLASSES = self._discover_strategy_classes()
+        
+        return [strategy_class() for strategy_class in _STRATEGY_CLASSES]
+
+    @staticmethod
+    def _discover_strategy_classes() -> List[type]:
+        """
+        strategy 패키지에서 전략 클래스를 검색
+        
+        Returns:
+            List[type]: @register로 등록된 구현 클래스 목록 (정의 순서)
+            
+        Notes:
+            - 패키지 내 모듈을 모두 임포트하여 @register가 실행되도록 한 뒤 등록 목록을 사용
+            - 모듈 속성 전체를 검사(inspect.getmembers)하지 않음
         """
-        import inspect
-        import sys
         import pkgutil
         import importlib
         import strategy  # strategy 패키지
 
-        strategies = []
-        # strategy 패키지 내의 모든 모듈을 순회
+        # strategy 패키지 내의 모든 모듈을 임포트 (등록은 클래스 정의 시점에 수행됨)
         for _, name, _ in pkgutil.iter_modules(strategy.__path__):
-            module = importlib.import_module(f'strategy.{name}')
-            # 모듈 내의 모든 클래스를 검사
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                # StrategyBase를 상속받은 클래스이고 추상 클래스가 아닌 경우
-                if (issubclass(obj, StrategyBase) and 
-                    obj != StrategyBase and 
-                    not inspect.isabstract(obj)):
-                    strategies.append(obj())
+            importlib.import_module(f'strategy.{name}')
         
-        return strategies
+        return list(_REGISTRY)
         
-    def add_strategy(self, strategy: StrategyBase) -> None:
+    def add_strategy(self, strategy: StrategyBase, weight: float = 1.0) -> None:
         """
         새로운 전략을 추가
         
         Args:
             strategy (StrategyBase): 추가할 전략 객체
+            weight (float, optional): 신호 평균에 반영할 가중치. Defaults to 1.0.
             
         Notes:
             - 런타임에 새로운 전략을 동적으로 추가 가능
         """
         self.strategies.append(strategy)
+        self.weights = np.append(self.weights, float(weight))
+        self._evaluate = self._build_evaluator()
+        self._weights = self._build_weights()
+
+    def set_weight(self, strategy_name: str, weight: float) -> None:
+        """
+        전략별 가중치 변경
+        
+        Args:
+            strategy_name (str): 전략 클래스 이름 (예: 'RSIStrategy')
+            weight (float): 새 가중치 (0 이상, 0이면 결정에서 제외)
+            
+        Raises:
+            ValueError: 음수 가중치이거나 등록되지 않은 전략인 경우
+        """
+        if weight < 0:
+            raise ValueError(f"가중치는 0 이상이어야 합니다: {weight}")
+        names = self.get_all_strategies()
+        if strategy_name not in names:
+            raise ValueError(f"등록되지 않은 전략입니다: {strategy_name}")
+        self.weights[names.index(strategy_name)] = weight
+        self._weights = self._build_weights()
+
+    def _build_evaluator(self) -> Callable[[Dict[str, Any]], np.ndarray]:
+        """
+        등록된 전략 전체를 한 번에 평가하는 함수를 런타임에 생성
+
+        Returns:
+            Callable: market_data를 받아 전략별 신호 배열(float64)을 반환하는 함수
+
+        Notes:
+            - 각 전략의 바운드 analyze 메서드를 기본 인자로 묶어 지역 변수(LOAD_FAST)로 접근
+            - 리스트 컴프리헨션의 반복/속성 조회/메서드 바인딩 비용 제거
+            - 전략 목록이 바뀔 때마다(add_strategy) 다시 생성
+            - 공유 파생 지표(FeatureBundle)는 평가마다 한 번만 생성하여 모든 전략에 전달
+            - 결과는 전략 수 크기로 한 번 할당한 배열에 직접 기록 (신호별 컨테이너 생성 없음)
+            - 임계값 비교가 바뀌지 않도록 float64 유지
+            - 이동평균/모멘텀/가격 변화율 전략은 fused_scalar_signals 한 번으로 평가
+              (정확히 해당 클래스가 각각 하나씩 있을 때만, 하위 클래스는 개별 평가)
+        """
+        from .FeatureBundle import FeatureBundle
+        from .Strategies import FUSED_SCALAR_STRATEGIES, fused_scalar_signals
+
+        count = len(self.strategies)
+        # 단순 스칼라 전략이 각각 한 번씩 등록되어 있으면 하나의 함수 호출로 합쳐서 평가
+        types = [type(strategy) for strategy in self.strategies]
+        fused = [types.index(cls) for cls in FUSED_SCALAR_STRATEGIES if types.count(cls) == 1]
+        if len(fused) != len(FUSED_SCALAR_STRATEGIES):
+            fused = []
+        
+        params = ''.join(f', _a{i}=_a{i}' for i in range(count) if i not in fused)
+        calls = ''.join(f'    out[{i}] = _a{i}(md, features)\n' for i in range(count) if i not in fused)
+        if fused:
+            params += ', _fused=_fused'
+            calls += f"    {', '.join(f'out[{i}]' for i in fused)} = _fused(md, features)\n"
+        source = (f"def _evaluate(md, _bundle=_bundle, _empty=_empty{params}):\n"
+                  f"    features = _bundle(md)\n"
+                  f"    out = _empty({count})\n"
+                  f"{calls}"
+                  f"    return out\n")
+        namespace = {f'_a{i}': strategy.analyze for i, strategy in enumerate(self.strategies)}
+        namespace['_bundle'] = FeatureBundle
+        namespace['_empty'] = np.empty
+        namespace['_fused'] = fused_scalar_signals
+        exec(compile(source, '<strategy-evaluator>', 'exec'), namespace)
+        return namespace['_evaluate']
+        
+    def _build_weights(self) -> np.ndarray:
+        """
+        전략 신호 평균에 사용할 정규화 가중치 벡터 생성
+
+        Returns:
+            np.ndarray: 합이 1인 전략 수 크기의 가중치 (float64)
+
+        Notes:
+            - 가중 평균을 신호 배열과의 내적 한 번으로 계산 (합계 후 나눗셈 불필요)
+            - 전략 목록이나 가중치가 바뀔 때마다(add_strategy, set_weight) 다시 생성
+            - 가중치 합이 0이면 균등 가중치 사용
+        """
+        count = len(self.strategies)
+        if not count:
+            return np.empty(0)
+        total = self.weights.sum()
+        if total <= 0:
+            return np.full(count, 1.0 / count)
+        return self.weights / total
         
     def get_all_strategies(self) -> List[str]:
         """
@@ -133,19 +348,73 @@ class StrategyManager:
                 - "hold": 관망 신호
                 
         Notes:
-            - 각 전략의 결과를 평균하여 최종 신호 강도 계산
+            - 각 전략의 결과를 정규화 가중치와 내적하여 최종 신호 강도(가중 평균) 계산
             - 임계값을 기준으로 매수/매도/홀딩 결정
             - 전략이 없는 경우 기본값으로 "hold" 반환
         """
         if not self.strategies:
             return "hold"
             
-        signals = [strategy.analyze(market_data) for strategy in self.strategies]
-        average_signal = sum(signals) / len(signals)
+        average_signal = self._evaluate(market_data) @ self._weights
         
-        if average_signal >= self.buy_threshold:
-            return "buy"
-        elif average_signal <= self.sell_threshold:
-            return "sell"
+        # 분기 없이 비교 결과로 인덱스 계산 (NaN은 두 비교가 모두 거짓이므로 "hold")
+        return _DECISIONS[1 - int(average_signal <= self.sell_threshold) + int(average_signal >= self.buy_threshold)]
+
+    def evaluate_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """
+        여러 종목에 대해 모든 전략을 일괄 평가
+        
+        Args:
+            market_data_batch (Dict[str, Any]): 열 단위(SoA) 시장 데이터 (StrategyBase.analyze_batch 참고)
+        
+        Returns:
+            np.ndarray: 전략 수 x 종목 수 신호 배열 (행 순서는 self.strategies와 동일)
+            
+        Notes:
+            - 종목 수가 parallel_threshold 이상이면 전략별 analyze_batch를 스레드 풀에서 병렬 실행
+            - NumPy 연산은 GIL을 해제하므로 전략 간 병렬 실행 효과가 있음
+            - 종목 수가 적으면 스레드 전환 비용이 더 크므로 순차 실행
+        """
+        size = _batch_size(market_data_batch)
+        if not self.strategies:
+            return np.empty((0, size), dtype=BATCH_DTYPE)
+        
+        if size < self.parallel_threshold:
+            results = [strategy.analyze_batch(market_data_batch) for strategy in self.strategies]
         else:
-            return "hold" 
\ No newline at end of file
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(len(self.strategies), os.cpu_count() or 1),
+                    thread_name_prefix='strategy-batch'
+                )
+            results = list(self._executor.map(lambda strategy: strategy.analyze_batch(market_data_batch),
+                                              self.strategies))
+        return np.vstack(results)
+
+    def get_decisions_batch(self, market_data_batch: Dict[str, Any]) -> np.ndarray:
+        """
+        여러 종목의 최종 투자 결정을 한 번에 생성
+        
+        Args:
+            market_data_batch (Dict[str, Any]): 열 단위(SoA) 시장 데이터 (StrategyBase.analyze_batch 참고)
+        
+        Returns:
+            np.ndarray: 종목별 투자 결정 문자열 배열 ("buy" / "sell" / "hold")
+            
+        Notes:
+            - 전략 수 x 종목 수 신호 배열을 가중치 벡터와 한 번에 곱해 종목별 평균 계산
+            - 임계값 비교 결과를 인덱스로 변환해 결정 배열에서 한 번에 선택 (get_decision과 동일한 기준)
+        """
+        size = _batch_size(market_data_batch)
+        if not self.strategies:
+            return np.full(size, "hold")
+        
+        average_signal = self._weights @ self.evaluate_batch(market_data_batch)
+        index = 1 - (average_signal <= self.sell_threshold).astype(np.intp) + (average_signal >= self.buy_threshold)
+        return _DECISION_ARRAY[index]
+
+    def close(self) -> None:
+        """배치 평가용 스레드 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None 
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+전략 신호 계산 커널 모듈
+
+분기가 많은 전략의 계산부를 스칼라 float 인자만 받는 순수 함수로 분리합니다.
+전략 클래스의 analyze는 입력을 꺼내 커널을 호출하는 역할만 합니다.
+
+Notes:
+    - 커널은 @njit(cache=True)로 컴파일 (numba가 없으면 순수 파이썬으로 동작)
+    - njit 함수는 함수 객체를 기본 인자로 받을 수 없으므로 상/하한 보조 함수도 컴파일 버전을 직접 호출
+"""
+
+from utils._njit import njit
+
+def _clip_hi(cap: float, value: float) -> float:
+    """상한 적용 (min(cap, value)와 동일, NaN이면 cap)"""
+    return value if value < cap else cap
+
+def _clip_lo(floor: float, value: float) -> float:
+    """하한 적용 (max(floor, value)와 동일, NaN이면 floor)"""
+    return value if value > floor else floor
+
+def trend_direction(oldest: float, prev: float, current: float) -> int:
+    """
+    세 시점 값의 방향 판정 (전략 간 공통 단조성 검사)
+
+    Returns:
+        int: 1 (순증가), -1 (순감소), 0 (그 외, NaN 포함)
+    """
+    if oldest < prev < current:
+        return 1
+    if oldest > prev > current:
+        return -1
+    return 0
+
+def trend_masks(oldest, prev, current):
+    """
+    trend_direction의 배치 버전 (길이 3 구간을 비교 연산 4번으로 펼쳐 계산)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (순증가 마스크, 순감소 마스크)
+    """
+    return ((prev > oldest) & (current > prev),
+            (prev < oldest) & (current < prev))
+
+# 커널 내부 호출용 컴파일 버전 (전략 클래스의 파이썬 코드는 원본 함수를 그대로 사용)
+_jit_clip_hi = njit(cache=True)(_clip_hi)
+_jit_clip_lo = njit(cache=True)(_clip_lo)
+
+@njit(cache=True)
+def macd_signal(macd: float, signal: float, prev_macd: float, prev_hist: float, rsi: float,
+                max_hist: float, min_hist: float) -> float:
+    """
+    MACD 신호 계산 (MACDStrategy)
+
+    Args:
+        macd (float): 현재 MACD
+        signal (float): 현재 시그널
+        prev_macd (float): 직전 MACD (이력이 없으면 NaN, 모든 비교가 거짓이 됨)
+        prev_hist (float): 직전 히스토그램 (이력이 없으면 0)
+        rsi (float): 현재 RSI
+        max_hist (float): 최근 히스토그램 최대값
+        min_hist (float): 최근 히스토그램 최소값
+
+    Returns:
+        float: 신호 강도 (-4.0~4.0)
+    """
+    macd_hist = macd - signal
+
+    # 하락세 종료 감지: MACD가 시그널선 상향돌파
+    if macd > signal and prev_macd < signal:
+        return _jit_clip_hi(2.5, 2.0 + (macd - signal) * 2)  # 높은 변동성 범위
+
+    # 상승세 종료 감지: MACD가 시그널선 하향돌파
+    if macd < signal and prev_macd > signal:
+        return _jit_clip_lo(-2.0, -1.5 - (signal - macd) * 2)  # 높은 변동성 범위
+
+    # 매우 강한 매수 신호
+    if macd_hist > 0 and macd_hist > prev_hist * 1.5 and rsi < 40:
+        return _jit_clip_hi(4.0, 2.0 + macd_hist / max_hist * 2.0)
+
+    # 매우 강한 매도 신호
+    if macd_hist < 0 and macd_hist < prev_hist * 1.5 and rsi > 60:
+        return _jit_clip_lo(-4.0, -2.0 + macd_hist / min_hist * 2.0)
+
+    return 0.5
+
+@njit(cache=True)
+def moving_average_signal(ma5: float, ma20: float, ma_diff_ratio: float, price_change: float) -> float:
+    """
+    이동평균 신호 계산 (MovingAverageStrategy)
+
+    Args:
+        ma5 (float): 5일 이동평균
+        ma20 (float): 20일 이동평균
+        ma_diff_ratio (float): 단기/장기 이동평균 괴리율(%)
+        price_change (float): 직전 대비 가격 변화율(%)
+
+    Returns:
+        float: 신호 강도 (0.3~0.7)
+    """
+    # 하락세 종료 감지: 단기선이 장기선 접근 + 가격 반등
+    if ma5 < ma20 and ma_diff_ratio > -2 and price_change > 0:
+        return _jit_clip_hi(0.7, 0.6 + abs(ma_diff_ratio) / 10)  # 낮은 변동성 범위
+
+    # 상승세 종료 감지: 단기선이 장기선 이탈 + 가격 하락
+    if ma5 > ma20 and ma_diff_ratio < 2 and price_change < 0:
+        return _jit_clip_lo(0.3, 0.4 - abs(ma_diff_ratio) / 10)  # 낮은 변동성 범위
+
+    return 0.5
+
+@njit(cache=True)
+def momentum_signal(momentum: float, volume_surge: float, rsi: float) -> float:
+    """
+    모멘텀 신호 계산 (MomentumStrategy)
+
+    Args:
+        momentum (float): 모멘텀 지표 (-1 ~ 1)
+        volume_surge (float): 거래량 급증 비율
+        rsi (float): 현재 RSI
+
+    Returns:
+        float: 신호 강도 (-2.0~2.5)
+    """
+    # 하락세 종료 감지: 모멘텀 반등 + 거래량 증가
+    if momentum > -0.3 and momentum < 0 and volume_surge > 1.2 and rsi < 40:
+        return _jit_clip_hi(2.5, 1.8 + abs(momentum) * 2)  # 높은 변동성 범위
+
+    # 상승세 종료 감지: 모멘텀 약화 + 거래량 감소
+    if momentum < 0.3 and momentum > 0 and volume_surge < 0.8 and rsi > 60:
+        return _jit_clip_lo(-2.0, -1.5 - momentum * 2)  # 높은 변동성 범위
+
+    return 0.5
+
+@njit(cache=True)
+def price_change_signal(short_term_change: float, long_term_change: float,
+                        volume_rising: bool, rsi: float) -> float:
+    """
+    가격 변화율 신호 계산 (PriceChangeStrategy)
+
+    Args:
+        short_term_change (float): 단기 가격 변화율(%)
+        long_term_change (float): 장기 가격 변화율(%)
+        volume_rising (bool): 최근 거래량이 직전보다 큰지 여부
+        rsi (float): 현재 RSI
+
+    Returns:
+        float: 신호 강도 (-2.0~2.5)
+    """
+    # 하락세 종료 감지: 급격한 하락 후 반등
+    if short_term_change > 0 and long_term_change < -5 and volume_rising and rsi < 40:
+        return _jit_clip_hi(2.5, 2.0 + abs(long_term_change) / 25)  # 매우 높은 변동성 범위
+
+    # 상승세 종료 감지: 급격한 상승 후 하락
+    if short_term_change < 0 and long_term_change > 5 and volume_rising and rsi > 60:
+        return _jit_clip_lo(-2.0, -1.5 - short_term_change / 25)  # 매우 높은 변동성 범위
+
+    return 0.5
+
+@njit(cache=True)
+def downtrend_end_signal(price: float, bb_lower: float, rsi: float, price_change: float,
+                         prev_price_change: float, volume_surge: float, macd_hist: float) -> float:
+    """
+    하락장 종료 신호 계산 (DowntrendEndStrategy)
+
+    Args:
+        price (float): 현재 가격
+        bb_lower (float): 볼린저 밴드 하단
+        rsi (float): 현재 RSI
+        price_change (float): 직전 대비 가격 변화율(%)
+        prev_price_change (float): 직전 구간 가격 변화율(%)
+        volume_surge (float): 최근 평균 대비 거래량 비율
+        macd_hist (float): MACD 히스토그램
+
+    Returns:
+        float: 신호 강도 (-4.0~4.0)
+    """
+    # 매우 강한 반등 신호
+    if (price_change > 0 and prev_price_change < -2 and  # 가격 반등
+        volume_surge > 1.5 and  # 거래량 급증
+        rsi < 35 and  # 과매도
+        price <= bb_lower and  # 볼린저 밴드 하단 터치
+        macd_hist > 0):  # MACD 반등
+        return _jit_clip_hi(4.0, 2.0 + abs(prev_price_change) / 5)
+
+    # 매우 강한 하락 지속 신호
+    if (price_change < -2 and prev_price_change < -2 and  # 하락 지속
+        volume_surge > 1.5 and  # 거래량 급증
+        rsi > 65 and  # 과매수
+        macd_hist < 0):  # MACD 하락
+        return _jit_clip_lo(-4.0, -2.0 - abs(price_change) / 5)
+
+    # 일반적인 반등 신호
+    if (price_change > 0 and prev_price_change < -1 and
+        volume_surge > 1.2 and rsi < 40):
+        return _jit_clip_hi(2.5, 1.5 + volume_surge / 2)
+
+    # 일반적인 하락 지속 신호
+    if (price_change < -1 and prev_price_change < -1 and
+        volume_surge > 1.2 and rsi > 60):
+        return _jit_clip_lo(-2.5, -1.5 - volume_surge / 2)
+
+    return 0.5
+
+@njit(cache=True)
+def uptrend_end_signal(momentum: float, rsi: float, volume_ratio: float, volatility: float) -> float:
+    """
+    상승장 종료 신호 계산 (UptrendEndStrategy)
+
+    Args:
+        momentum (float): 모멘텀 지표 (-1 ~ 1)
+        rsi (float): 현재 RSI
+        volume_ratio (float): 평균 대비 거래량 비율
+        volatility (float): 변동성 지표
+
+    Returns:
+        float: 신호 강도 (-2.0~2.5)
+    """
+    # 상승 추세 종료 + 하락 확인
+    if momentum < 0.3 and rsi > 70 and volume_ratio < 0.8 and volatility > 0.2:
+        return _jit_clip_lo(-2.0, -1.5 - momentum * volatility)  # 매우 높은 변동성 범위
+
+    # 상승 지속
+    if momentum > 0.7 and volume_ratio > 1.2:
+        return _jit_clip_hi(2.5, 2.0 + momentum * 0.5)  # 매우 높은 변동성 범위
+
+    return 0.5
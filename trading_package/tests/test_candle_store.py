@@ -0,0 +1,82 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import logging
+import tempfile
+import time
+import unittest
+from pathlib import Path
+import numpy as np
+from trade_market_api.UpbitCall import UpbitCall
+from trade_market_api.CandleBatch import CandleBatch
+
+MINUTE_MS = 60_000
+
+
+def make_batch(start: int, count: int, close_offset: float = 0.0) -> CandleBatch:
+    """start번째 1분봉부터 count개의 시간순 캔들 묶음 생성 (현재 시각에 끝나도록 배치)"""
+    base = int(time.time() * 1000) // MINUTE_MS * MINUTE_MS - 49 * MINUTE_MS
+    index = np.arange(start, start + count)
+    closes = 100.0 + index + close_offset
+    return CandleBatch('KRW-BTC', base + index * MINUTE_MS, [f't{i}' for i in index],
+                       closes, closes + 1, closes - 1, closes, np.ones(count), closes * 10)
+
+
+class TestCandleStore(unittest.TestCase):
+    def setUp(self):
+        # 저장/조회 흐름만 확인하므로 API 세션 없이 필요한 속성만 준비
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.upbit = object.__new__(UpbitCall)
+        self.upbit.logger = logging.getLogger('test_candle_store')
+        self.upbit.CANDLE_STORE_DIR = Path(self.temp_dir.name)
+        self.requests = []
+        self.responses = []
+
+        def fetch(market, url, count):
+            self.requests.append(count)
+            return self.responses.pop(0)
+        self.upbit._fetch_candle_batch = fetch
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tail_refresh(self):
+        """저장된 캔들이 있으면 마지막 저장 캔들 이후만 조회하고, 진행 중이던 캔들은 새 값으로 교체되는지 확인"""
+        self.responses.append(make_batch(0, 49))
+        first = self.upbit.load_candles('KRW-BTC', '1', 40)
+        self.assertEqual(len(first), 40)
+        self.assertEqual(self.requests, [40])
+
+        # 마지막 저장 캔들(48번)이 마감되어 값이 바뀌고 49번 캔들이 새로 생김
+        self.responses.append(make_batch(48, 2, close_offset=0.5))
+        second = self.upbit.load_candles('KRW-BTC', '1', 40)
+        self.assertLessEqual(self.requests[1], 3)
+        self.assertEqual(len(second), 40)
+        self.assertEqual(second.close[-2], 148.5)
+        self.assertEqual(second.close[-1], 149.5)
+        self.assertTrue((np.diff(second.timestamp) == MINUTE_MS).all())
+
+    def test_store_capped(self):
+        """저장 파일이 CANDLE_STORE_MAX_ROWS개를 넘지 않는지 확인"""
+        self.upbit.CANDLE_STORE_MAX_ROWS = 30
+        self.responses.append(make_batch(0, 50))
+        self.upbit.load_candles('KRW-BTC', '1', 50)
+        stored = np.load(Path(self.temp_dir.name) / 'KRW-BTC' / '1.npy')
+        self.assertEqual(len(stored), 30)
+        self.assertEqual(stored['close'][-1], 149.0)
+
+    def test_fetch_failure_returns_stored(self):
+        """추가 조회가 실패하면 저장된 캔들을 반환하는지 확인"""
+        self.responses.extend([make_batch(0, 50), None])
+        self.upbit.load_candles('KRW-BTC', '1', 20)
+        stored = self.upbit.load_candles('KRW-BTC', '1', 20)
+        self.assertEqual(len(stored), 20)
+        self.assertEqual(stored.close[-1], 149.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+import numpy as np
+import pandas as pd
+from trade_market_api._kernels import rsi_wilder, rsi_last, rsi_last_matrix, bollinger_bands, volatility_score, macd_lines, ichimoku_lines
+
+
+class TestIndicatorKernels(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.prices = np.cumsum(rng.normal(0, 1, 300)) + 100
+
+    def test_rsi_wilder(self):
+        """Wilder 평활 RSI가 단순평균 시작 후 재귀식으로 갱신되는지 확인"""
+        period = 14
+        delta = np.diff(self.prices)
+        gains = np.where(delta > 0, delta, 0)
+        losses = np.where(delta < 0, -delta, 0)
+        avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+        expected = [np.nan] * period + [100 - 100 / (1 + avg_gain / avg_loss)]
+        for gain, loss in zip(gains[period:], losses[period:]):
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+        np.testing.assert_allclose(rsi_wilder(self.prices, period), expected)
+
+    def test_rsi_wilder_edge_cases(self):
+        """데이터 부족 시 NaN, 하락이 없을 때 100, 변화가 없을 때 50인지 확인"""
+        self.assertTrue(np.isnan(rsi_wilder(self.prices[:14], 14)).all())
+        self.assertEqual(rsi_wilder(np.arange(20, dtype=np.float64), 14)[-1], 100.0)
+        self.assertEqual(rsi_wilder(np.ones(20), 14)[-1], 50.0)
+
+    def test_rsi_last(self):
+        """마지막 값만 계산한 RSI가 전체 계산 결과의 마지막 값과 같은지 확인"""
+        self.assertAlmostEqual(rsi_last(self.prices, 14), rsi_wilder(self.prices, 14)[-1], places=12)
+        self.assertTrue(np.isnan(rsi_last(self.prices[:14], 14)))
+        self.assertEqual(rsi_last(np.ones(20), 14), 50.0)
+
+    def test_rsi_last_matrix(self):
+        """여러 마켓을 한 번에 계산한 RSI가 마켓별 rsi_last 결과와 같은지 확인"""
+        closes = np.vstack([self.prices, self.prices[::-1], np.arange(300, dtype=np.float64), np.ones(300)])
+        expected = [rsi_last(row, 14) for row in closes]
+
+        np.testing.assert_allclose(rsi_last_matrix(closes, 14), expected, rtol=1e-12)
+        self.assertTrue(np.isnan(rsi_last_matrix(closes[:, :14], 14)).all())
+
+    def test_bollinger_bands(self):
+        """한 번의 순회로 계산한 밴드가 pandas rolling mean/std 결과와 같은지 확인"""
+        close = pd.Series(self.prices * 1e6)  # 실제 원화 가격 규모에서도 오차가 누적되지 않는지 확인
+        middle, upper, lower = bollinger_bands(close.to_numpy(), 20, 2.0)
+        expected_middle = close.rolling(window=20).mean()
+        expected_std = close.rolling(window=20).std()
+
+        np.testing.assert_allclose(middle, expected_middle, rtol=1e-9)
+        np.testing.assert_allclose(upper, expected_middle + expected_std * 2, rtol=1e-9)
+        np.testing.assert_allclose(lower, expected_middle - expected_std * 2, rtol=1e-9)
+
+    def test_volatility_score(self):
+        """한 번의 순회로 계산한 변동성 점수가 pandas rolling 계산 결과와 같은지 확인"""
+        rng = np.random.default_rng(1)
+        close = pd.Series(self.prices)
+        high = close * (1 + rng.uniform(0, 0.02, close.size))
+        low = close * (1 - rng.uniform(0, 0.02, close.size))
+        volume = pd.Series(rng.uniform(0, 100, close.size))
+        volume[::7] = 0
+
+        daily_volatility = ((high - low) / close).rolling(window=10).std()
+        volume_volatility = (volume / volume.rolling(window=20).mean()).clip(0, 5)
+        expected = (daily_volatility * 0.7 + (volume_volatility / 5) * 0.3).clip(0, 1)
+
+        result = volatility_score(high.to_numpy(), low.to_numpy(), close.to_numpy(), volume.to_numpy(), 10, 20)
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_macd_lines(self):
+        """한 번의 순회로 계산한 MACD/시그널/오실레이터가 pandas ewm 결과와 같은지 확인"""
+        close = pd.Series(self.prices)
+        expected_macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+        expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+
+        macd, signal, oscillator = macd_lines(close.to_numpy(), 12, 26, 9)
+        np.testing.assert_allclose(macd, expected_macd, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(signal, expected_signal, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(oscillator, expected_macd - expected_signal, rtol=1e-9, atol=1e-12)
+
+    def test_ichimoku_lines(self):
+        """단조 덱으로 계산한 일목균형표가 pandas rolling max/min 결과와 같은지 확인"""
+        rng = np.random.default_rng(2)
+        high = pd.Series(self.prices + rng.uniform(0, 1, self.prices.size))
+        low = pd.Series(self.prices - rng.uniform(0, 1, self.prices.size))
+
+        def midpoint(period):
+            return (high.rolling(window=period, min_periods=1).max() + low.rolling(window=period, min_periods=1).min()) / 2
+
+        conversion, base = midpoint(9), midpoint(26)
+        expected = (conversion, base, ((conversion + base) / 2).shift(26), midpoint(52).shift(26))
+
+        for result, expected_line in zip(ichimoku_lines(high.to_numpy(), low.to_numpy(), 9, 26, 52, 26), expected):
+            np.testing.assert_array_equal(result, expected_line)
+
+
+if __name__ == '__main__':
+    unittest.main()
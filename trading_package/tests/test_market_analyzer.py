@@ -0,0 +1,44 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+import numpy as np
+from trading.market_analyzer import MarketAnalyzer
+
+
+def _candle(timestamp, close):
+    return {'timestamp': timestamp, 'close': float(close), 'volume': 1.0}
+
+
+class TestRecentHistories(unittest.TestCase):
+    def setUp(self):
+        # 이력 생성만 확인하므로 설정/DB 연결 없이 생성
+        self.analyzer = object.__new__(MarketAnalyzer)
+
+    def _prices(self, candles):
+        return self.analyzer._recent_histories(candles)['price_history'].tolist()
+
+    def test_closed_candle_uses_latest_values(self):
+        """진행 중이던 캔들이 마감되면 마감 값이 이력에 반영되는지 확인"""
+        candles = [_candle(i, 100 + i) for i in range(9)] + [_candle(9, 999)]
+        self.assertEqual(self._prices(candles)[-1], 999.0)
+
+        candles = [_candle(i, 100 + i) for i in range(11)]
+        expected = [c['close'] for c in candles[-MarketAnalyzer.HISTORY_SIZE:]]
+        self.assertEqual(self._prices(candles), expected)
+
+    def test_field_types(self):
+        """필드별 저장 타입과 기본값, 짧은 캔들 목록 처리 확인"""
+        histories = self.analyzer._recent_histories([_candle(0, 100), _candle(1, 101)])
+        self.assertEqual(histories['price_history'].dtype, np.float64)
+        self.assertEqual(histories['rsi_history'].dtype, np.float32)
+        self.assertEqual(histories['rsi_history'].tolist(), [50.0, 50.0])
+        self.assertEqual(histories['price_history'].tolist(), [100.0, 101.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+import numpy as np
+from trade_market_api.MarketDataConverter import MarketDataConverter
+from trade_market_api.CandleBatch import CandleBatch
+
+
+def make_candles(count: int, seed: int = 0):
+    """테스트용 1분봉 캔들 데이터 생성 (업비트 응답과 같이 최신순)"""
+    rng = np.random.default_rng(seed)
+    closes = 50_000_000 * np.cumprod(1 + rng.normal(0, 0.01, count))
+    candles = []
+    for i, close in enumerate(closes):
+        open_price = close * (1 + rng.normal(0, 0.003))
+        candles.append({
+            'timestamp': 1_700_000_000_000 + i * 60_000,
+            'datetime': f'2024-01-01T{i // 60:02d}:{i % 60:02d}:00',
+            'open': open_price,
+            'high': max(open_price, close) * (1 + abs(rng.normal(0, 0.002))),
+            'low': min(open_price, close) * (1 - abs(rng.normal(0, 0.002))),
+            'close': close,
+            'volume': rng.uniform(1, 100),
+            'value': rng.uniform(1e6, 1e8),
+            'market': 'KRW-BTC'
+        })
+    return candles[::-1]
+
+
+class TestMarketDataConverter(unittest.TestCase):
+    def setUp(self):
+        self.converter = MarketDataConverter()
+        self.candles = make_candles(200)
+
+    def test_latest_matches_full_conversion(self):
+        """최근 캔들만 계산한 결과가 전체 변환 결과의 마지막 행과 같은지 확인"""
+        full = self.converter.convert_upbit_candle(self.candles)
+        latest = self.converter.convert_upbit_candle_latest(self.candles)
+
+        self.assertEqual(len(full), len(self.candles))
+        self.assertEqual(full[0]['timestamp'], self.candles[-1]['timestamp'])
+        self.assertEqual(set(latest), set(full[-1]))
+        for key, expected in full[-1].items():
+            with self.subTest(key=key):
+                if isinstance(expected, (int, float, list)):
+                    np.testing.assert_allclose(latest[key], expected, rtol=1e-6, atol=1e-6)
+                else:
+                    self.assertEqual(latest[key], expected)
+
+    def test_insufficient_data(self):
+        """캔들이 50개 미만이면 빈 결과를 반환하는지 확인"""
+        self.assertEqual(self.converter.convert_upbit_candle(self.candles[:49]), [])
+        self.assertEqual(self.converter.convert_upbit_candle_latest(self.candles[:49]), {})
+
+    def test_candle_batch_input(self):
+        """업비트 응답에서 바로 만든 컬럼별 배열 묶음의 변환 결과가 딕셔너리 목록 변환 결과와 같은지 확인"""
+        raw = [{
+            'timestamp': candle['timestamp'],
+            'candleDateTimeKst': candle['datetime'],
+            'openingPrice': candle['open'],
+            'highPrice': candle['high'],
+            'lowPrice': candle['low'],
+            'tradePrice': candle['close'],
+            'candleAccTradeVolume': candle['volume'],
+            'candleAccTradePrice': candle['value']
+        } for candle in self.candles]
+        batch = CandleBatch.from_upbit(raw, 'KRW-BTC')
+
+        self.assertEqual(MarketDataConverter().convert_upbit_candle(batch), self.converter.convert_upbit_candle(self.candles))
+        self.assertEqual(MarketDataConverter().convert_upbit_candle_latest(batch), self.converter.convert_upbit_candle_latest(self.candles))
+
+    def test_candle_batch_merge(self):
+        """저장된 캔들과 새로 조회한 캔들을 합칠 때 시간순으로 중복 없이, 겹치는 캔들은 새 값으로 합쳐지는지 확인"""
+        stored = CandleBatch.from_candles(self.candles[50:]).sorted()
+        fetched = CandleBatch.from_candles(self.candles[:60])
+        fetched.close[-1] += 1  # 진행 중이던 캔들이 갱신된 경우
+
+        merged = stored.merge(fetched)
+        expected = CandleBatch.from_candles(self.candles).sorted()
+        np.testing.assert_array_equal(merged.timestamp, expected.timestamp)
+        self.assertEqual(merged.datetime, expected.datetime)
+        self.assertEqual(merged.close[len(self.candles) - 60], fetched.close[-1])
+        np.testing.assert_array_equal(merged.tail(10).close, merged.close[-10:])
+
+        restored = CandleBatch.from_records(merged.to_records(), 'KRW-BTC')
+        np.testing.assert_array_equal(restored.close, merged.close)
+        self.assertEqual(restored.datetime, merged.datetime)
+
+    def test_conversion_cache(self):
+        """같은 캔들 묶음은 다시 계산하지 않고 이전 변환 결과를 반환하는지 확인"""
+        first = self.converter.convert_upbit_candle(self.candles)
+        self.assertEqual(self.converter.convert_upbit_candle(list(self.candles)), first)
+        self.assertNotEqual(self.converter.convert_upbit_candle(self.candles[1:]), first)
+
+    def test_conversion_cache_in_progress_candle(self):
+        """마지막 캔들 시각이 같아도 값이 바뀌면 다시 계산하고, 반환값 수정이 캐시에 남지 않는지 확인"""
+        first = self.converter.convert_upbit_candle(self.candles)
+        first[-1]['close'] = -1
+        self.assertNotEqual(self.converter.convert_upbit_candle(self.candles)[-1]['close'], -1)
+
+        updated = [dict(candle) for candle in self.candles]
+        updated[0]['close'] = updated[0]['close'] * 0.5  # 최신순이므로 0번이 진행 중인 마지막 캔들
+        result = self.converter.convert_upbit_candle(updated)
+        self.assertEqual(result[-1]['close'], updated[0]['close'])
+
+
+if __name__ == '__main__':
+    unittest.main()
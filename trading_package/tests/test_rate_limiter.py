@@ -0,0 +1,47 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+from utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.waits = []
+        self.bucket = TokenBucket(rate=2, capacity=2, timer=lambda: self.now, sleep=self.waits.append)
+
+    def test_burst_then_wait(self):
+        """capacity개까지는 바로 진행하고, 이후 요청은 토큰이 채워지는 시점까지 차례로 대기하는지 확인"""
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertAlmostEqual(self.bucket.acquire(), 0.5)
+        self.assertAlmostEqual(self.bucket.acquire(), 1.0)
+        self.assertEqual(self.waits, [0.5, 1.0])
+
+    def test_refill(self):
+        """시간이 지나면 토큰이 채워지되 capacity를 넘지 않는지 확인"""
+        self.bucket.acquire()
+        self.bucket.acquire()
+        self.now = 10.0
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertAlmostEqual(self.bucket.acquire(), 0.5)
+
+    def test_limit(self):
+        """서버가 알려준 남은 요청 수가 더 적으면 그만큼만 바로 진행하는지 확인"""
+        self.bucket.limit(0)
+        self.assertAlmostEqual(self.bucket.acquire(), 0.5)
+        self.now = 10.0
+        self.bucket.limit(5)
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertEqual(self.bucket.acquire(), 0.0)
+        self.assertAlmostEqual(self.bucket.acquire(), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
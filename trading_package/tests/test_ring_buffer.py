@@ -0,0 +1,59 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+from utils.ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_append_and_wrap(self):
+        """용량 초과 시 오래된 값부터 밀려나고 시간 순서가 유지되는지 확인"""
+        buffer = RingBuffer(3)
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        for i, value in enumerate(values):
+            buffer.append(value)
+            self.assertEqual(buffer.last().tolist(), values[max(0, i - 2):i + 1])
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer[-2], 4.0)
+        self.assertEqual(buffer[-2:].tolist(), [4.0, 5.0])
+
+    def test_last_scalar(self):
+        """offset 조회와 값이 부족한 경우의 기본값 확인"""
+        buffer = RingBuffer(5)
+        buffer.extend([10.0, 20.0])
+        self.assertEqual(buffer.last_scalar(), 20.0)
+        self.assertEqual(buffer.last_scalar(2), 10.0)
+        self.assertIsNone(buffer.last_scalar(3))
+        self.assertEqual(buffer.last_scalar(3, default=0.0), 0.0)
+
+    def test_replace_last_and_clear(self):
+        """진행 중인 값 교체와 초기화 확인"""
+        buffer = RingBuffer(2)
+        buffer.extend([1.0, 2.0, 3.0])
+        buffer.replace_last(30.0)
+        self.assertEqual(buffer.last().tolist(), [2.0, 30.0])
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        buffer.replace_last(7.0)
+        self.assertEqual(buffer.last().tolist(), [7.0])
+
+    def test_running_sum(self):
+        """append/replace_last/clear 후 누적 합과 평균이 실제 값과 일치하는지 확인"""
+        buffer = RingBuffer(3)
+        self.assertIsNone(buffer.mean())
+        buffer.extend([1.0, 2.0, 3.0, 4.0])
+        self.assertAlmostEqual(buffer.sum(), 9.0)
+        buffer.replace_last(10.0)
+        self.assertAlmostEqual(buffer.sum(), 15.0)
+        self.assertAlmostEqual(buffer.mean(), 5.0)
+        buffer.clear()
+        buffer.append(2.0)
+        self.assertAlmostEqual(buffer.mean(), 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
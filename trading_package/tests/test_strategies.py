@@ -0,0 +1,137 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+import numpy as np
+from strategy import Strategies
+from strategy.StrategyBase import StrategyManager
+from strategy.FeatureBundle import FeatureBundle
+
+
+class TestStrategyBatch(unittest.TestCase):
+    def setUp(self):
+        """종목 N개 x 이력 5개의 랜덤 배치 데이터 생성"""
+        rng = np.random.default_rng(42)
+        self.size = 500
+        price = rng.uniform(100, 1000, self.size)
+        self.batch = {
+            'current_price': price,
+            'price_history': price[:, None] * rng.uniform(0.9, 1.1, (self.size, 5)),
+            'upper_band': price * rng.uniform(0.95, 1.05, self.size),
+            'lower_band': price * rng.uniform(0.95, 1.05, self.size),
+            'rsi': rng.uniform(0, 100, self.size),
+            'rsi_history': rng.uniform(0, 100, (self.size, 5)),
+            'macd': rng.uniform(-2, 2, self.size),
+            'signal': rng.uniform(-2, 2, self.size),
+            'macd_history': rng.uniform(-2, 2, (self.size, 5)),
+            'stoch_k': rng.uniform(0, 100, self.size),
+            'stoch_d': rng.uniform(0, 100, self.size),
+            'stoch_k_history': rng.uniform(0, 100, (self.size, 5)),
+            'stoch_d_history': rng.uniform(0, 100, (self.size, 5)),
+            'volume': rng.uniform(0, 1000, self.size),
+            'volume_ma': rng.uniform(0, 1000, self.size),
+            'volume_history': rng.uniform(0, 1000, (self.size, 5)),
+        }
+
+    def _scalar_results(self, strategy, batch):
+        """종목별 analyze 결과"""
+        rows = [{key: value[i] for key, value in batch.items()} for i in range(self.size)]
+        return np.array([strategy.analyze(row) for row in rows], dtype=np.float64)
+
+    def test_batch_matches_scalar(self):
+        """모든 전략의 analyze_batch 결과가 analyze와 일치하는지 확인 (배치 출력은 float32)"""
+        for name in Strategies.__all__:
+            strategy = getattr(Strategies, name)()
+            with self.subTest(strategy=name):
+                result = strategy.analyze_batch(self.batch)
+                self.assertEqual(result.dtype, np.float32)
+                np.testing.assert_allclose(
+                    result,
+                    self._scalar_results(strategy, self.batch),
+                    rtol=1e-6, atol=1e-6
+                )
+
+    def test_batch_short_history(self):
+        """이력이 부족한 경우 중립값(0.5) 처리가 analyze와 일치하는지 확인"""
+        batch = dict(self.batch)
+        for key in ('price_history', 'rsi_history', 'macd_history', 'stoch_k_history'):
+            batch[key] = batch[key][:, -1:]
+        batch.pop('stoch_d_history')
+        for name in ('RSIStrategy', 'BollingerBandStrategy', 'StochasticStrategy', 'DivergenceStrategy'):
+            strategy = getattr(Strategies, name)()
+            with self.subTest(strategy=name):
+                np.testing.assert_allclose(
+                    strategy.analyze_batch(batch),
+                    self._scalar_results(strategy, batch),
+                    rtol=1e-6, atol=1e-6
+                )
+
+    def test_manager_evaluate_batch_parallel(self):
+        """스레드 풀 병렬 평가 결과가 순차 평가와 일치하는지 확인"""
+        manager = StrategyManager(parallel_threshold=1)
+        try:
+            expected = np.vstack([strategy.analyze_batch(self.batch) for strategy in manager.strategies])
+            np.testing.assert_allclose(manager.evaluate_batch(self.batch), expected)
+        finally:
+            manager.close()
+
+    def test_decisions_batch(self):
+        """일괄 투자 결정이 종목별 신호 평균의 임계값 비교와 일치하는지 확인"""
+        manager = StrategyManager()
+        average_signal = manager.evaluate_batch(self.batch).astype(np.float64).mean(axis=0)
+        expected = np.where(average_signal >= manager.buy_threshold, "buy",
+                            np.where(average_signal <= manager.sell_threshold, "sell", "hold"))
+        np.testing.assert_array_equal(manager.get_decisions_batch(self.batch), expected)
+
+    def test_weighted_decision(self):
+        """전략별 가중치가 일괄 결정의 가중 평균에 반영되는지 확인"""
+        manager = StrategyManager()
+        manager.set_weight('RSIStrategy', 3.0)
+        manager.set_weight('MACDStrategy', 0.0)
+        signals = manager.evaluate_batch(self.batch).astype(np.float64)
+        average_signal = np.average(signals, axis=0, weights=manager.weights)
+        expected = np.where(average_signal >= manager.buy_threshold, "buy",
+                            np.where(average_signal <= manager.sell_threshold, "sell", "hold"))
+        np.testing.assert_array_equal(manager.get_decisions_batch(self.batch), expected)
+        with self.assertRaises(ValueError):
+            manager.set_weight('UnknownStrategy', 1.0)
+
+    def test_evaluator_matches_analyze(self):
+        """합쳐서 평가하는 전략을 포함한 평가 함수 결과가 전략별 analyze와 일치하는지 확인"""
+        manager = StrategyManager()
+        rng = np.random.default_rng(7)
+        for i in range(200):
+            row = {key: value[i] for key, value in self.batch.items()}
+            row.update({
+                'ma5': row['current_price'] * rng.uniform(0.97, 1.03),
+                'ma20': row['current_price'] * rng.uniform(0.97, 1.03),
+                'momentum': rng.uniform(-1, 1),
+                'volume_surge': rng.uniform(0, 2),
+            })
+            expected = [strategy.analyze(row) for strategy in manager.strategies]
+            np.testing.assert_allclose(manager._evaluate(row), expected)
+
+    def test_strategy_classes_cached(self):
+        """전략 클래스 검색은 한 번만 수행되고 관리자마다 새 인스턴스를 생성하는지 확인"""
+        first = StrategyManager()
+        second = StrategyManager()
+        self.assertEqual([type(s) for s in first.strategies], [type(s) for s in second.strategies])
+        self.assertTrue(all(a is not b for a, b in zip(first.strategies, second.strategies)))
+        self.assertEqual(len(first.strategies), len(Strategies.__all__))
+
+    def test_missing_average_volume_fallback(self):
+        """평균 거래량이 없을 때 전략별 기본값(거래량 전략: 현재 거래량, 상승장 종료 전략: 1)을 사용하는지 확인"""
+        market_data = {'current_volume': 0.5, 'momentum': 0.2, 'rsi': 75, 'volatility': 0.3}
+        features = FeatureBundle(market_data)
+        self.assertEqual(features.volume_ratio, 1.0)
+        self.assertEqual(features.uptrend_volume_ratio, 0.5)
+        # 거래량 비율 0.5 < 0.8 이므로 상승세 종료 신호
+        self.assertLess(Strategies.UptrendEndStrategy().analyze(market_data), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
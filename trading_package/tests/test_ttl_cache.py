@@ -0,0 +1,42 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 파이썬 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import unittest
+from utils.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = TTLCache(maxsize=2, timer=lambda: self.now)
+
+    def test_expiry(self):
+        """유효 시간 내에는 저장된 값을, 만료 후에는 기본값을 반환하는지 확인"""
+        self.cache.set('a', [1, 2], ttl=10)
+        self.now = 9.9
+        self.assertEqual(self.cache.get('a'), [1, 2])
+        self.now = 10.0
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_eviction(self):
+        """가득 찬 경우 만료 항목을 먼저, 없으면 가장 오래 저장된 항목을 제거하는지 확인"""
+        self.cache.set('a', 1, ttl=5)
+        self.cache.set('b', 2, ttl=100)
+        self.now = 6
+        self.cache.set('c', 3, ttl=100)
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('b'), 2)
+        self.cache.set('b', 20, ttl=100)
+        self.cache.set('d', 4, ttl=100)
+        self.assertIsNone(self.cache.get('c'))
+        self.assertEqual(self.cache.get('b'), 20)
+        self.assertEqual(self.cache.get('d'), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+캔들 묶음 모듈
+
+한 마켓의 캔들 데이터를 캔들별 딕셔너리(AoS) 대신
+컬럼별 NumPy 배열(SoA)로 보관합니다.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Dict, List
+
+# 디스크 저장용 레코드 형식 (캔들 시각은 최대 32자 문자열)
+RECORD_DTYPE = np.dtype([
+    ('timestamp', np.int64), ('datetime', 'U32'),
+    ('open', np.float64), ('high', np.float64), ('low', np.float64),
+    ('close', np.float64), ('volume', np.float64), ('value', np.float64)
+])
+
+@dataclass(slots=True)
+class CandleBatch:
+    """
+    한 마켓의 캔들 데이터 (컬럼별 배열)
+
+    Attributes:
+        market (str): 마켓 코드 (예: KRW-BTC)
+        timestamp (np.ndarray): 타임스탬프 (int64, ms)
+        datetime (List[str]): 캔들 시각 (KST)
+        open, high, low, close, volume, value (np.ndarray): 시가/고가/저가/종가/누적 거래량/누적 거래대금 (float64)
+
+    Notes:
+        - 지표 계산은 연속된 float64 배열을 그대로 사용하므로 추가 복사가 없음
+    """
+    market: str
+    timestamp: np.ndarray
+    datetime: List[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    value: np.ndarray
+
+    @classmethod
+    def from_candles(cls, candles: List[Dict]) -> 'CandleBatch':
+        """
+        변환된 캔들 딕셔너리 목록(open/high/low/close/volume/value 키)에서 생성
+
+        Args:
+            candles: 한 마켓의 캔들 데이터 리스트 (비어 있지 않아야 함)
+        """
+        return cls._from_rows(candles, candles[0]['market'], 'timestamp', 'datetime',
+                              'open', 'high', 'low', 'close', 'volume', 'value')
+
+    @classmethod
+    def from_upbit(cls, candles: List[Dict], market: str) -> 'CandleBatch':
+        """
+        업비트 캔들 API 응답(openingPrice/highPrice/... 키)에서 중간 딕셔너리 없이 바로 생성
+
+        Args:
+            candles: 업비트 캔들 API 응답 리스트
+            market: 마켓 코드
+        """
+        return cls._from_rows(candles, market, 'timestamp', 'candleDateTimeKst',
+                              'openingPrice', 'highPrice', 'lowPrice', 'tradePrice',
+                              'candleAccTradeVolume', 'candleAccTradePrice')
+
+    @classmethod
+    def _from_rows(cls, rows: List[Dict], market: str, timestamp_key: str, datetime_key: str,
+                   open_key: str, high_key: str, low_key: str, close_key: str,
+                   volume_key: str, value_key: str) -> 'CandleBatch':
+        """캔들 목록을 한 번만 순회하며 미리 할당한 배열에 채움"""
+        n = len(rows)
+        timestamps = np.empty(n, dtype=np.int64)
+        opens, highs, lows = np.empty(n), np.empty(n), np.empty(n)
+        closes, volumes, values = np.empty(n), np.empty(n), np.empty(n)
+        datetimes = [None] * n
+        for i, row in enumerate(rows):
+            timestamps[i] = row[timestamp_key]
+            datetimes[i] = row[datetime_key]
+            opens[i] = row[open_key]
+            highs[i] = row[high_key]
+            lows[i] = row[low_key]
+            closes[i] = row[close_key]
+            volumes[i] = row[volume_key]
+            values[i] = row[value_key]
+        return cls(market, timestamps, datetimes, opens, highs, lows, closes, volumes, values)
+
+    @classmethod
+    def from_records(cls, records: np.ndarray, market: str) -> 'CandleBatch':
+        """
+        RECORD_DTYPE 레코드 배열(np.load 결과 등)에서 생성
+
+        Args:
+            records: 시간순으로 정렬된 캔들 레코드 배열
+            market: 마켓 코드
+        """
+        return cls(market, records['timestamp'].copy(), records['datetime'].tolist(),
+                   *(records[column].copy() for column in ('open', 'high', 'low', 'close', 'volume', 'value')))
+
+    def to_records(self) -> np.ndarray:
+        """RECORD_DTYPE 레코드 배열로 변환 (np.save로 저장해 np.load로 다시 읽는 형식)"""
+        records = np.empty(len(self), dtype=RECORD_DTYPE)
+        for column in RECORD_DTYPE.names:
+            records[column] = getattr(self, column)
+        return records
+
+    def merge(self, newer: 'CandleBatch') -> 'CandleBatch':
+        """
+        다른 캔들 묶음을 합친 시간순 캔들 묶음 반환
+
+        Args:
+            newer: 더 최근에 조회한 캔들 묶음 (같은 시각의 캔들은 이 값을 사용)
+
+        Notes:
+            - 진행 중이던 마지막 캔들은 새로 조회한 값으로 갱신됨
+        """
+        combined = np.concatenate((newer.to_records(), self.to_records()))
+        _, first_index = np.unique(combined['timestamp'], return_index=True)
+        return CandleBatch.from_records(combined[first_index], self.market)
+
+    def tail(self, count: int) -> 'CandleBatch':
+        """최근 count개 캔들 묶음 반환"""
+        start = max(len(self) - count, 0)
+        return CandleBatch(self.market, self.timestamp[start:], self.datetime[start:],
+                           self.open[start:], self.high[start:], self.low[start:],
+                           self.close[start:], self.volume[start:], self.value[start:])
+
+    def __len__(self) -> int:
+        return self.timestamp.size
+
+    def sorted(self) -> 'CandleBatch':
+        """
+        시간순(오래된 데이터부터)으로 정렬된 캔들 묶음 반환
+
+        Notes:
+            - 이미 시간순이면 그대로, 최신순(업비트 응답 순서)이면 뒤집은 뷰를 반환 (정렬 생략)
+        """
+        steps = np.diff(self.timestamp)
+        if (steps >= 0).all():
+            return self
+        if (steps < 0).all():
+            order = slice(None, None, -1)
+            datetimes = self.datetime[::-1]
+        else:
+            order = np.argsort(self.timestamp, kind='stable')
+            datetimes = [self.datetime[i] for i in order]
+        return CandleBatch(self.market, self.timestamp[order], datetimes,
+                           self.open[order], self.high[order], self.low[order],
+                           self.close[order], self.volume[order], self.value[order])
+
+    def to_frame(self) -> pd.DataFrame:
+        """date, open, high, low, close, volume, value, market 컬럼의 DataFrame으로 변환"""
+        return pd.DataFrame({
+            'date': self.datetime,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+            'value': self.value,
+            'market': self.market
+        })
+
+__all__ = ['CandleBatch', 'RECORD_DTYPE']
@@ -1,93 +1,211 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
-import numpy as np
-from monitoring.memory_monitor import MemoryProfiler, memory_profiler
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Union
+from numpy.lib.stride_tricks import sliding_window_view
+from utils._bottleneck import move_min, move_max, move_mean
+from trade_market_api.CandleBatch import CandleBatch
+from trade_market_api._kernels import rsi_wilder, bollinger_bands, volatility_score, macd_lines, ichimoku_lines
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator (분모가 0인 위치는 0)"""
+    out = np.zeros(np.shape(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+def _history_windows(values: np.ndarray, size: int = 5) -> np.ndarray:
+    """
+    각 시점의 최근 size개 값을 행으로 갖는 (n, size) 배열 반환
+    - 앞쪽의 부족한 값은 0으로 채움
+    - 패딩 배열 위의 슬라이딩 윈도우 뷰이므로 행마다 복사하지 않음
+    """
+    padded = np.concatenate((np.zeros(size - 1), np.asarray(values, dtype=np.float64)))
+    return sliding_window_view(padded, size)
 
 class MarketDataConverter:
     """
     시장 데이터를 전략에 맞는 형식으로 변환하는 클래스
     """
-    def __init__(self):
-        # 필수 기술적 지표 컬럼 목록
-        self.memory_profiler = MemoryProfiler()
-        self.required_columns = [
-            'open', 'high', 'low', 'close', 'volume',  # OHLCV 기본 데이터
-            'rsi', 'macd', 'signal', 'oscillator',     # RSI와 MACD 관련 지표
-            'sma5', 'sma20', 'sma60', 'sma120',       # 단순이동평균선
-            'upper_band', 'lower_band',                # 볼린저 밴드
-            'stoch_k', 'stoch_d'                       # 스토캐스틱
-        ]
+    # 필수 기술적 지표 컬럼 목록
+    REQUIRED_COLUMNS = (
+        'open', 'high', 'low', 'close', 'volume',  # OHLCV 기본 데이터
+        'rsi', 'macd', 'signal', 'oscillator',     # RSI와 MACD 관련 지표
+        'sma5', 'sma20', 'sma60', 'sma120',       # 단순이동평균선
+        'upper_band', 'lower_band',                # 볼린저 밴드
+        'stoch_k', 'stoch_d'                       # 스토캐스틱
+    )
+
+    # 값의 범위가 제한된 지표 컬럼 (float32로 충분한 정밀도)
+    # 가격 단위 지표(이동평균, 밴드, MACD 등)는 원화 가격 규모의 정밀도를 위해 float64 유지
+    FLOAT32_COLUMNS = frozenset({
+        'rsi', 'stoch_k', 'stoch_d',                           # 0 ~ 100
+        'trend_strength', 'market_sentiment', 'price_trend',   # -1 ~ 1
+        'volatility',                                          # 0 ~ 1
+    })
+
+    # 이동 윈도우 지표가 참조하는 최대 캔들 수 (sma120, 일목균형표 선행스팬 26 + 52)
+    LATEST_WINDOW = 120
+
+    def __init__(self, cache_size: int = 256):
+        """
+        Args:
+            cache_size: 변환 결과를 보관할 최대 캔들 묶음 수 (마켓, 캔들 수, 첫/마지막 캔들 시각, 마지막 캔들 값 기준)
+        """
+        self.logger = logging.getLogger('investment_center')
+        # 동일한 캔들 묶음의 재계산을 막는 변환 결과 캐시 (LRU)
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_size = cache_size
 
     
-    def convert_upbit_candle(self, candle_data: List[Dict]) -> List[Dict]:
+    def convert_upbit_candle(self, candle_data: Union[List[Dict], CandleBatch]) -> List[Dict]:
         """
         업비트 캔들 데이터를 전략 분석에 적합한 형식으로 변환
         Args:
-            candle_data: 업비트 API로부터 받은 원시 캔들 데이터 리스트
+            candle_data: 업비트 API로부터 받은 캔들 데이터 리스트 또는 컬럼별 배열 묶음(CandleBatch)
         Returns:
             각 캔들의 기술적 지표가 포함된 딕셔너리 리스트
+        Notes:
+            - 캐시된 결과도 행 딕셔너리는 매번 새로 복사해 반환 (행 안의 *_history 리스트는 공유하므로 읽기 전용)
         """
         try:
-            if not candle_data:
-                print("빈 캔들 데이터")
+            if not len(candle_data):
+                self.logger.warning("빈 캔들 데이터")
                 return []
 
             # 시간순으로 정렬 (오래된 데이터부터)
-            sorted_candles = sorted(candle_data, key=lambda x: x['timestamp'])
+            batch = self._to_batch(candle_data).sorted()
             
-            if len(sorted_candles) < 50:
-                print(f"불충분한 캔들 데이터: {len(sorted_candles)}개")
+            if len(batch) < 50:
+                self.logger.warning(f"불충분한 캔들 데이터: {len(batch)}개")
                 return []
 
-            # DataFrame 생성 (전체 캔들 데이터 사용)
-            df = pd.DataFrame({
-                'date': [x['datetime'] for x in sorted_candles],
-                'open': [x['open'] for x in sorted_candles],
-                'high': [x['high'] for x in sorted_candles],
-                'low': [x['low'] for x in sorted_candles],
-                'close': [x['close'] for x in sorted_candles],
-                'volume': [x['volume'] for x in sorted_candles],
-                'value': [x['value'] for x in sorted_candles],
-                'market': [x['market'] for x in sorted_candles]
-            })
+            # 같은 캔들 묶음이면 지표 계산 없이 이전 변환 결과 반환
+            # 진행 중인 마지막 캔들은 시각이 같아도 가격/거래량이 바뀌므로 그 값까지 키에 포함
+            timestamps = batch.timestamp.tolist()
+            cache_key = (batch.market, len(batch), timestamps[0], timestamps[-1],
+                         float(batch.open[-1]), float(batch.high[-1]), float(batch.low[-1]),
+                         float(batch.close[-1]), float(batch.volume[-1]), float(batch.value[-1]))
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    return [dict(row) for row in cached]
+
+            # DataFrame 생성 (컬럼별 배열을 그대로 사용)
+            df = batch.to_frame()
             
             # 기술적 지표 계산
             df = self._calculate_indicators(df)
             
-            # 각 행을 딕셔너리로 변환
+            # 히스토리 데이터 계산 (각 시점에서 이전 5개 데이터, 부족한 데이터는 0으로 채움)
+            history_columns = ['rsi', 'macd', 'close', 'volume']
+            histories = {
+                f"{col}_history": _history_windows(df[col].to_numpy()).tolist()
+                for col in history_columns
+            }
+            histories['price_history'] = histories['close_history']  # 종가 이력의 별칭
+
+            # 각 행을 딕셔너리로 변환 (한 번에 변환 후 행별 추가 데이터만 채움)
             converted_data = []
-            for idx in range(len(df)):
-                row_data = df.iloc[idx].to_dict()
-                
-                # 히스토리 데이터 계산 (각 시점에서 이전 5개 데이터)
-                history_columns = ['rsi', 'macd', 'close', 'volume']
-                for col in history_columns:
-                    history_key = f"{col}_history"
-                    start_idx = max(0, idx - 4)  # 최근 5개 데이터
-                    row_data[history_key] = df[col].iloc[start_idx:idx + 1].tolist()
-                    # 부족한 데이터는 0으로 채움
-                    while len(row_data[history_key]) < 5:
-                        row_data[history_key].insert(0, 0.0)
+            for idx, row_data in enumerate(df.to_dict(orient='records')):
+                for history_key, windows in histories.items():
+                    row_data[history_key] = windows[idx]
                 
                 # 추가 시장 데이터
                 row_data.update({
-                    'timestamp': sorted_candles[idx]['timestamp'],
-                    'datetime': sorted_candles[idx]['datetime'],
-                    'market': sorted_candles[idx]['market'],
+                    'timestamp': timestamps[idx],
+                    'datetime': batch.datetime[idx],
+                    'market': batch.market,
                     'market_state': 'active'
                 })
                 
                 converted_data.append(row_data)
 
-            return converted_data
+            with self._cache_lock:
+                self._cache[cache_key] = converted_data
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+            return [dict(row) for row in converted_data]
 
         except Exception as e:
-            print(f"데이터 변환 실패: {str(e)}")
-            print(f"First candle data: {candle_data[0] if candle_data else 'No data'}")
+            self.logger.error(f"데이터 변환 실패: {str(e)}", exc_info=True)
+            if isinstance(candle_data, list):
+                self.logger.debug(f"First candle data: {candle_data[0] if candle_data else 'No data'}")
             return []
 
     
+    def convert_upbit_candle_latest(self, candle_data: Union[List[Dict], CandleBatch]) -> Dict:
+        """
+        업비트 캔들 데이터에서 가장 최근 캔들의 기술적 지표만 계산
+        Args:
+            candle_data: 업비트 API로부터 받은 캔들 데이터 리스트 또는 컬럼별 배열 묶음(CandleBatch)
+        Returns:
+            최근 캔들의 기술적 지표가 포함된 딕셔너리 (변환 실패 시 빈 딕셔너리)
+        Notes:
+            - convert_upbit_candle 결과의 마지막 행과 같은 값
+            - 이동 윈도우 지표는 최근 LATEST_WINDOW개 캔들에만 계산
+        """
+        try:
+            if not len(candle_data):
+                self.logger.warning("빈 캔들 데이터")
+                return {}
+
+            # 시간순으로 정렬 (오래된 데이터부터)
+            batch = self._to_batch(candle_data).sorted()
+
+            if len(batch) < 50:
+                self.logger.warning(f"불충분한 캔들 데이터: {len(batch)}개")
+                return {}
+
+            latest = self._calculate_latest_indicators(batch.to_frame())
+
+            latest.update({
+                'timestamp': int(batch.timestamp[-1]),
+                'datetime': batch.datetime[-1],
+                'market': batch.market,
+                'market_state': 'active'
+            })
+            return latest
+
+        except Exception as e:
+            self.logger.error(f"최근 캔들 데이터 변환 실패: {str(e)}", exc_info=True)
+            return {}
+
+    
+    def _calculate_latest_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        가장 최근 캔들의 기술적 지표 계산 (_calculate_indicators 마지막 행과 같은 값)
+        Args:
+            df: OHLCV 데이터가 포함된 DataFrame
+        Returns:
+            최근 캔들의 OHLCV, 기술적 지표, 최근 5개 이력이 포함된 딕셔너리
+        Notes:
+            - RSI/MACD는 재귀식이므로 전체 구간으로 계산
+            - 이동 윈도우 지표는 최근 LATEST_WINDOW개 캔들에만 같은 계산을 적용
+        """
+        df = self._calculate_recursive_indicators(df)
+        tail = self._calculate_window_indicators(df.iloc[-self.LATEST_WINDOW:].copy())
+
+        latest = tail.iloc[-1:].to_dict(orient='records')[0]
+
+        # 최근 5개 이력 (convert_upbit_candle과 같은 길이와 정밀도)
+        for col in ('rsi', 'macd', 'close', 'volume'):
+            latest[f"{col}_history"] = tail[col].to_numpy()[-5:].astype(np.float64).tolist()
+        latest['price_history'] = latest['close_history']
+        return latest
+
+    
+    def _to_batch(self, candle_data: Union[List[Dict], CandleBatch]) -> CandleBatch:
+        """캔들 딕셔너리 목록이면 컬럼별 배열 묶음으로 변환 (한 번만 순회)"""
+        if isinstance(candle_data, CandleBatch):
+            return candle_data
+        return CandleBatch.from_candles(candle_data)
+
+    
     def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         모든 기술적 지표를 한번에 계산하는 메서드
@@ -97,89 +215,75 @@ class MarketDataConverter:
             기술적 지표가 추가된 DataFrame
         """
         try:
-            # 숫자형 데이터 확인 및 변환
-            numeric_columns = ['open', 'high', 'low', 'close', 'volume', 'value']
-            for col in numeric_columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-
-            # 기본 기술적 지표 계산
-            df['rsi'] = self._calculate_rsi(df['close'], 14)
-            df = self._calculate_macd(df)
-            
-            # 이동평균선
-            for period in [5, 20, 60, 120]:
-                df[f'sma{period}'] = df['close'].rolling(window=period).mean()
-            
-            # 볼린저 밴드
-            df = self._calculate_bollinger_bands(df)
-            
-            # 스토캐스틱
-            df = self._calculate_stochastic(df)
-            
-            # 히스토리 데이터 생성 (문자열 형태로 저장)
-            history_columns = {
-                'rsi_history': 'rsi',
-                'macd_history': 'macd',
-                'price_history': 'close',
-                'volume_history': 'volume'
-            }
-            
-            for hist_col, source_col in history_columns.items():
-                # 먼저 숫자형으로 변환
-                values = pd.to_numeric(df[source_col], errors='coerce').fillna(0)
-                # 롤링 윈도우로 최근 5개 값 가져오기
-                history_values = []
-                for i in range(len(df)):
-                    start_idx = max(0, i - 4)  # 최근 5개 값
-                    window_values = values[start_idx:i + 1].tolist()
-                    # 부족한 데이터는 0으로 채움
-                    while len(window_values) < 5:
-                        window_values.insert(0, 0.0)
-                    history_values.append(','.join(map(str, window_values)))
-                df[hist_col] = history_values
-            
-            # 추가 지표 계산 (모두 float 형식)
-            df['momentum'] = df['close'].pct_change(14).fillna(0).astype(float)
-            df['trend_strength'] = self._calculate_trend_strength(df).astype(float)
-            df['volatility'] = (df['close'].rolling(window=20).std() / 
-                              df['close'].rolling(window=20).mean()).fillna(0).astype(float)
-            df['average_volume'] = df['volume'].rolling(window=20).mean().fillna(0).astype(float)
-            df['current_volume'] = df['volume'].astype(float)
-            
-            # 일목균형표
-            df = self._calculate_ichimoku(df)
-            
-            # 시장 심리 지수
-            df['market_sentiment'] = self._calculate_market_sentiment(df)
-            
-            # 가격 변화율
-            df['price_change_rate'] = df['close'].pct_change().fillna(0).astype(float) * 100
-            
-            # 거래량 변화율
-            df['volume_change_rate'] = df['volume'].pct_change().fillna(0).astype(float) * 100
-            
-            # 가격 추세와 변동성 계산 추가
-            df['price_trend'] = self._calculate_price_trend(df)
-            df['volatility'] = self._calculate_volatility(df)
-            
-            # NaN 값을 0으로 변환
-            df = df.fillna(0)
-            
-            # 모든 숫자형 컬럼을 float로 변환 (히스토리 데이터 제외)
-            for col in df.columns:
-                if col not in ['date', 'market'] and not col.endswith('_history'):
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(float)
-            
-            return df
+            df = self._calculate_recursive_indicators(df)
+            return self._calculate_window_indicators(df)
 
         except Exception as e:
-            import traceback
-            print(f"지표 계산 중 오류 발생: {str(e)}")
-            print("Traceback:")
-            print(''.join(traceback.format_tb(e.__traceback__)))
+            self.logger.error(f"지표 계산 중 오류 발생: {str(e)}", exc_info=True)
             return df.fillna(0)
 
     
+    def _calculate_recursive_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        재귀식 지표(RSI, MACD) 계산 (이전 값에 의존하므로 전체 구간 필요)
+        """
+        df['rsi'] = self._calculate_rsi(df['close'], 14)
+        return self._calculate_macd(df)
+
+    
+    def _calculate_window_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        이동 윈도우 지표 계산 및 NaN/자료형 정리
+        - 각 행의 값은 최근 LATEST_WINDOW개 캔들만으로 결정됨
+        """
+        # 이동평균선 (기간이 채워지지 않은 초기 구간의 부분 평균은 추세 계산에서 재사용)
+        moving_averages = {}
+        close = df['close'].to_numpy()
+        positions = np.arange(len(df))
+        for period in [5, 20, 60, 120]:
+            moving_averages[period] = pd.Series(move_mean(close, period, min_count=1), index=df.index)
+            df[f'sma{period}'] = moving_averages[period].where(positions >= period - 1)
+        
+        # 볼린저 밴드
+        df = self._calculate_bollinger_bands(df)
+        
+        # 스토캐스틱
+        df = self._calculate_stochastic(df)
+        
+        # 추가 지표 계산 (NaN은 마지막에 한 번에 0으로 변환)
+        df['momentum'] = df['close'].pct_change(14)
+        df['trend_strength'] = self._calculate_trend_strength(df, moving_averages[20])
+        df['average_volume'] = move_mean(df['volume'].to_numpy(), 20)
+        df['current_volume'] = df['volume']
+        
+        # 일목균형표
+        df = self._calculate_ichimoku(df)
+        
+        # 시장 심리 지수
+        df['market_sentiment'] = self._calculate_market_sentiment(df)
+        
+        # 가격 변화율
+        df['price_change_rate'] = df['close'].pct_change() * 100
+        
+        # 거래량 변화율
+        df['volume_change_rate'] = df['volume'].pct_change() * 100
+        
+        # 가격 추세와 변동성 계산 추가
+        df['price_trend'] = self._calculate_price_trend(df, moving_averages[5], moving_averages[20])
+        df['volatility'] = self._calculate_volatility(df)
+        
+        # NaN 값을 0으로 변환
+        df = df.fillna(0)
+        
+        # 모든 숫자형 컬럼을 한 번에 float로 변환 (범위가 제한된 지표는 float32)
+        df = df.astype({
+            col: np.float32 if col in self.FLOAT32_COLUMNS else np.float64
+            for col in df.columns if col not in ('date', 'market')
+        })
+        
+        return df
+
+    
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """
         상대강도지수(RSI) 계산
@@ -190,29 +294,12 @@ class MarketDataConverter:
             RSI 값이 포함된 Series
         """
         try:
-            # 가격 변화량 계산
-            delta = prices.diff()
-            
-            # 상승/하락 분리
-            gains = delta.where(delta > 0, 0.0)
-            losses = -delta.where(delta < 0, 0.0)
-            
-            # 평균 계산
-            avg_gains = gains.rolling(window=period).mean()
-            avg_losses = losses.rolling(window=period).mean()
-            
-            # RS 계산 (0으로 나누기 방지)
-            rs = avg_gains / avg_losses.replace(0, float('inf'))
-            
-            # RSI 계산
-            rsi = 100 - (100 / (1 + rs))
-            
-            # NaN 및 무한값 처리
-            rsi = rsi.replace([np.inf, -np.inf], 100)
+            # Wilder 평활 방식으로 평균 상승/하락폭을 한 번의 순회로 갱신
+            rsi = pd.Series(rsi_wilder(prices.to_numpy(dtype=np.float64), period), index=prices.index)
             return rsi.fillna(50)  # 초기값은 중립적인 50으로 설정
 
         except Exception as e:
-            print(f"RSI 계산 중 오류: {str(e)}")
+            self.logger.error(f"RSI 계산 중 오류: {str(e)}", exc_info=True)
             return pd.Series([50] * len(prices))  # 오류 시 중립값 반환
 
     
@@ -228,18 +315,11 @@ class MarketDataConverter:
             MACD 관련 지표가 추가된 DataFrame
         """
         try:
-            # 지수이동평균 계산
-            exp1 = df['close'].ewm(span=12, adjust=False).mean()
-            exp2 = df['close'].ewm(span=26, adjust=False).mean()
-            
-            # MACD 계산
-            df['macd'] = exp1 - exp2
-            
-            # Signal Line 계산
-            df['signal'] = df['macd'].ewm(span=9, adjust=False).mean()
-            
-            # Oscillator 계산
-            df['oscillator'] = df['macd'] - df['signal']
+            # 12/26일 EMA, MACD, 9일 Signal Line, Oscillator를 한 번의 순회로 계산
+            macd, signal, oscillator = macd_lines(df['close'].to_numpy(dtype=np.float64), 12, 26, 9)
+            df['macd'] = macd
+            df['signal'] = signal
+            df['oscillator'] = oscillator
             
             # NaN 값을 0으로 변환
             df[['macd', 'signal', 'oscillator']] = df[['macd', 'signal', 'oscillator']].fillna(0)
@@ -247,7 +327,7 @@ class MarketDataConverter:
             return df
 
         except Exception as e:
-            print(f"MACD 계산 중 오류: {str(e)}")
+            self.logger.error(f"MACD 계산 중 오류: {str(e)}", exc_info=True)
             # 오류 발생 시 0으로 채움
             df['macd'] = 0
             df['signal'] = 0
@@ -265,10 +345,11 @@ class MarketDataConverter:
         Returns:
             볼린저 밴드 지표가 추가된 DataFrame
         """
-        df['middle_band'] = df['close'].rolling(window=20).mean()
-        std = df['close'].rolling(window=20).std()
-        df['upper_band'] = df['middle_band'] + (std * 2)
-        df['lower_band'] = df['middle_band'] - (std * 2)
+        # 이동평균과 표준편차를 한 번의 순회로 함께 계산
+        middle, upper, lower = bollinger_bands(df['close'].to_numpy(dtype=np.float64), 20, 2.0)
+        df['middle_band'] = middle
+        df['upper_band'] = upper
+        df['lower_band'] = lower
         return df
 
     
@@ -286,45 +367,42 @@ class MarketDataConverter:
             n = 14  # 기본 기간
             
             # 최저가와 최고가 계산
-            df['lowest_low'] = df['low'].rolling(window=n, min_periods=1).min()
-            df['highest_high'] = df['high'].rolling(window=n, min_periods=1).max()
+            lowest_low = move_min(df['low'].to_numpy(), n, min_count=1)
+            highest_high = move_max(df['high'].to_numpy(), n, min_count=1)
             
-            # 분모가 0인 경우 방지
-            denominator = df['highest_high'] - df['lowest_low']
-            denominator = denominator.replace(0, np.inf)
-            
-            # %K 계산
-            df['stoch_k'] = ((df['close'] - df['lowest_low']) / denominator * 100).fillna(0)
+            # %K 계산 (분모가 0이면 0)
+            stoch_k = _safe_ratio(df['close'].to_numpy() - lowest_low, highest_high - lowest_low) * 100
+            stoch_k = np.nan_to_num(stoch_k, nan=0.0)
             
             # %D 계산
-            df['stoch_d'] = df['stoch_k'].rolling(window=3, min_periods=1).mean().fillna(0)
-            
-            # 불필요한 컬럼 제거
-            df = df.drop(['lowest_low', 'highest_high'], axis=1)
+            stoch_d = move_mean(stoch_k, 3, min_count=1)
             
             # 값 범위 제한 (0-100)
-            df['stoch_k'] = df['stoch_k'].clip(0, 100)
-            df['stoch_d'] = df['stoch_d'].clip(0, 100)
+            df['stoch_k'] = np.clip(stoch_k, 0, 100)
+            df['stoch_d'] = np.clip(stoch_d, 0, 100)
             
             return df
 
         except Exception as e:
-            print(f"스토캐스틱 계산 중 오류: {str(e)}")
+            self.logger.error(f"스토캐스틱 계산 중 오류: {str(e)}", exc_info=True)
             df['stoch_k'] = 50  # 중립값으로 설정
             df['stoch_d'] = 50
             return df
 
     
-    def _calculate_trend_strength(self, df: pd.DataFrame) -> pd.Series:
+    def _calculate_trend_strength(self, df: pd.DataFrame, ma20: pd.Series) -> pd.Series:
         """
         추세 강도 계산 (-1: 강한 하락세, 1: 강한 상승세)
+        Args:
+            df: 가격 데이터가 포함된 DataFrame
+            ma20: 20일 이동평균 (초기 구간은 부분 평균)
         """
         try:
-            ma20 = df['close'].rolling(window=20, min_periods=1).mean()
-            price_change = (df['close'] - ma20) / ma20.replace(0, np.inf)
-            return price_change.clip(-1, 1).fillna(0)
+            ma20 = ma20.to_numpy()
+            price_change = np.clip(_safe_ratio(df['close'].to_numpy() - ma20, ma20), -1, 1)
+            return pd.Series(np.nan_to_num(price_change, nan=0.0), index=df.index)
         except Exception as e:
-            print(f"추세 강도 계산 중 오류: {str(e)}")
+            self.logger.error(f"추세 강도 계산 중 오류: {str(e)}", exc_info=True)
             return pd.Series([0] * len(df))
 
     
@@ -333,26 +411,17 @@ class MarketDataConverter:
         일목균형표 계산
         """
         try:
-            # 전환선 (9일)
-            period9_high = df['high'].rolling(window=9, min_periods=1).max()
-            period9_low = df['low'].rolling(window=9, min_periods=1).min()
-            df['conversion_line'] = (period9_high + period9_low) / 2
-            
-            # 기준선 (26일)
-            period26_high = df['high'].rolling(window=26, min_periods=1).max()
-            period26_low = df['low'].rolling(window=26, min_periods=1).min()
-            df['base_line'] = (period26_high + period26_low) / 2
-            
-            # 선행스팬 A
-            df['ichimoku_cloud_top'] = ((df['conversion_line'] + df['base_line']) / 2).shift(26)
-            
-            # 선행스팬 B
-            period52_high = df['high'].rolling(window=52, min_periods=1).max()
-            period52_low = df['low'].rolling(window=52, min_periods=1).min()
-            df['ichimoku_cloud_bottom'] = ((period52_high + period52_low) / 2).shift(26)
+            # 전환선(9일), 기준선(26일), 선행스팬 A/B(52일, 26캔들 이동)를 한 번의 순회로 계산
+            lines = ichimoku_lines(
+                df['high'].to_numpy(dtype=np.float64),
+                df['low'].to_numpy(dtype=np.float64),
+                9, 26, 52, 26
+            )
+            ichimoku_cols = ['conversion_line', 'base_line', 'ichimoku_cloud_top', 'ichimoku_cloud_bottom']
+            for col, values in zip(ichimoku_cols, lines):
+                df[col] = values
             
             # NaN 값 처리 (deprecated method 대체)
-            ichimoku_cols = ['conversion_line', 'base_line', 'ichimoku_cloud_top', 'ichimoku_cloud_bottom']
             for col in ichimoku_cols:
                 df[col] = df[col].ffill().fillna(df['close'].iloc[0])
             
@@ -361,7 +430,7 @@ class MarketDataConverter:
             
             return df
         except Exception as e:
-            print(f"일목균형표 계산 중 오류: {str(e)}")
+            self.logger.error(f"일목균형표 계산 중 오류: {str(e)}", exc_info=True)
             ichimoku_cols = ['conversion_line', 'base_line', 'ichimoku_cloud_top', 'ichimoku_cloud_bottom']
             for col in ichimoku_cols:
                 df[col] = float(df['close'].iloc[0])
@@ -374,49 +443,55 @@ class MarketDataConverter:
         """
         try:
             # RSI 요소
-            rsi_factor = ((df['rsi'].fillna(50) - 50) / 50).clip(-1, 1)
+            rsi = np.nan_to_num(df['rsi'].to_numpy(dtype=np.float64), nan=50.0)
+            rsi_factor = np.clip((rsi - 50) / 50, -1, 1)
 
             # 거래량 요소
-            volume_mean = df['volume'].rolling(window=20, min_periods=1).mean()
-            volume_factor = ((df['volume'] - volume_mean) / volume_mean.replace(0, np.inf)).clip(-1, 1)
+            volume = df['volume'].to_numpy()
+            volume_mean = move_mean(volume, 20, min_count=1)
+            volume_factor = np.clip(_safe_ratio(volume - volume_mean, volume_mean), -1, 1)
 
-            # 모멘텀 요소
-            momentum = df['close'].pct_change(14).fillna(0)
-            momentum_factor = momentum.clip(-1, 1)
+            # 모멘텀 요소 (14일 변화율, 이미 계산된 momentum 컬럼 재사용)
+            momentum_factor = np.clip(np.nan_to_num(df['momentum'].to_numpy(), nan=0.0), -1, 1)
             
             # 가중 평균
-            sentiment = (rsi_factor * 0.4 + volume_factor * 0.3 + momentum_factor * 0.3)
-            return sentiment.clip(-1, 1).fillna(0)
+            sentiment = np.clip(rsi_factor * 0.4 + volume_factor * 0.3 + momentum_factor * 0.3, -1, 1)
+            return pd.Series(np.nan_to_num(sentiment, nan=0.0), index=df.index)
         except Exception as e:
-            print(f"시장 심리 지수 계산 중 오류: {str(e)}")
+            self.logger.error(f"시장 심리 지수 계산 중 오류: {str(e)}", exc_info=True)
             return pd.Series([0] * len(df))
 
     
-    def _calculate_price_trend(self, df: pd.DataFrame) -> pd.Series:
+    def _calculate_price_trend(self, df: pd.DataFrame, ma5: pd.Series, ma20: pd.Series) -> pd.Series:
         """
         가격 추세 계산 (-1 ~ 1)
         - 양수: 상승 추세
         - 음수: 하락 추세
         - 절대값이 클수록 추세가 강함
+        Args:
+            df: 가격 데이터가 포함된 DataFrame
+            ma5: 단기(5일) 이동평균 (초기 구간은 부분 평균)
+            ma20: 장기(20일) 이동평균 (초기 구간은 부분 평균)
         """
         try:
-            # 단기(5일)와 장기(20일) 이동평균 계산
-            ma5 = df['close'].rolling(window=5, min_periods=1).mean()
-            ma20 = df['close'].rolling(window=20, min_periods=1).mean()
-            
             # 추세 강도 계산
-            trend = ((ma5 - ma20) / ma20.replace(0, np.inf)).clip(-1, 1)
+            ma20 = ma20.to_numpy()
+            trend = np.clip(_safe_ratio(ma5.to_numpy() - ma20, ma20), -1, 1)
             
-            # 모멘텀 반영
-            momentum = df['close'].pct_change(5).fillna(0).clip(-0.1, 0.1) * 5
+            # 모멘텀 반영 (5일 변화율)
+            close = df['close'].to_numpy()
+            momentum = np.zeros(close.size)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                momentum[5:] = close[5:] / close[:-5] - 1
+            momentum = np.nan_to_num(np.clip(momentum, -0.1, 0.1), nan=0.0) * 5
             
             # 최종 추세 계산 (추세 + 모멘텀)
-            price_trend = ((trend + momentum) / 2).clip(-1, 1)
+            price_trend = np.clip((trend + momentum) / 2, -1, 1)
             
-            return price_trend.fillna(0)
+            return pd.Series(np.nan_to_num(price_trend, nan=0.0), index=df.index)
             
         except Exception as e:
-            print(f"가격 추세 계산 중 오류: {str(e)}")
+            self.logger.error(f"가격 추세 계산 중 오류: {str(e)}", exc_info=True)
             return pd.Series([0] * len(df))
 
      
@@ -427,17 +502,18 @@ class MarketDataConverter:
         - 1: 변동성 매우 높음
         """
         try:
-            # 일일 변동폭 계산
-            daily_volatility = ((df['high'] - df['low']) / df['close']).rolling(window=10).std()
-            
-            # 거래량 변동성
-            volume_volatility = (df['volume'] / df['volume'].rolling(window=20).mean()).clip(0, 5)
-            
-            # 종합 변동성 (거래량 변동성 반영)
-            volatility = (daily_volatility * 0.7 + (volume_volatility / 5) * 0.3).clip(0, 1)
-            
-            return volatility.fillna(0)
+            # 일일 변동폭(10일 표준편차)과 거래량 변동성(20일 평균 대비)을 한 번의 순회로 종합
+            volatility = volatility_score(
+                df['high'].to_numpy(dtype=np.float64),
+                df['low'].to_numpy(dtype=np.float64),
+                df['close'].to_numpy(dtype=np.float64),
+                df['volume'].to_numpy(dtype=np.float64),
+                10, 20
+            )
+            return pd.Series(volatility, index=df.index).fillna(0)
             
         except Exception as e:
-            print(f"변동성 계산 중 오류: {str(e)}")
-            return pd.Series([0] * len(df))
\ No newline at end of file
+            self.logger.error(f"변동성 계산 중 오류: {str(e)}", exc_info=True)
+            return pd.Series([0] * len(df))
+
+__all__ = ['MarketDataConverter']
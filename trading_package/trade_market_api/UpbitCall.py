@@ -1,102 +1,80 @@
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import logging
 import time
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple
 import re
 import jwt
 import uuid
+import itertools
 import hashlib
 from urllib.parse import urlencode
 from pathlib import Path
 from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import asyncio
 import aiohttp
 import threading
 from bs4 import BeautifulSoup
 from utils.time_utils import TimeUtils
+from utils.ttl_cache import TTLCache
+from utils.rate_limiter import TokenBucket
+from utils.logger_config import queue_handler
+from utils._json import loads as json_loads
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException
 
 from trade_market_api.MarketDataConverter import MarketDataConverter
-from monitoring.memory_monitor import MemoryProfiler, memory_profiler
+from trade_market_api.CandleBatch import CandleBatch
+from trade_market_api._kernels import rsi_last, rsi_last_matrix
+from monitoring.memory_monitor import MemoryProfiler
 
-class ThreadLock:
-    """싱글톤 패턴으로 구현된 스레드 락 관리자
-    
-    전역적으로 하나의 인스턴스만 존재하며, API 호출에 대한 동시성을 제어합니다.
-    
-    Attributes:
-        _instance: 싱글톤 인스턴스
-        lock: 스레드 간 동기화를 위한 Lock 객체
-        current_thread: 현재 락을 보유한 스레드 ID
-        logger: 로깅을 위한 logger 인스턴스
-    """
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ThreadLock, cls).__new__(cls)
-            cls._instance.lock = Lock()
-            cls._instance.current_thread = None
-            cls._instance.logger = logging.getLogger('investment_center')
-        return cls._instance
-
-    def acquire_lock(self, thread_id: int, operation: str) -> bool:
-        """락 획득 시도"""
-        if self.lock.acquire(blocking=False):
-            self.current_thread = thread_id
-            self.logger.debug(f"Thread {thread_id} acquired lock for {operation}")
-            return True
-        return False
-
-    def release_lock(self, thread_id: int):
-        """락 해제"""
-        if self.current_thread == thread_id:
-            self.lock.release()
-            self.current_thread = None
-            self.logger.debug(f"Thread {thread_id} released lock")
+# 자원 락 획득 재시도 간격(초)
+LOCK_POLL_INTERVAL = 0.05
+# 캔들 조회 API 기본 URL
+CANDLE_BASE_URL = "https://crix-api-endpoint.upbit.com/v1/crix/candles"
 
-def with_thread_lock(operation: str):
-    """API 작업에 대한 스레드 락을 제공하는 데코레이터
+def with_resource_lock(resource: str, timeout: float = 3.0):
+    """API 작업에 대한 자원별 락을 제공하는 데코레이터
     
     Args:
-        operation (str): 락을 획득하려는 작업의 이름 (예: "buy", "sell", "get_candle")
+        resource (str): 락을 획득하려는 자원의 이름 (예: "order", "ubmi", "feargreed")
+        timeout (float): 락 획득 최대 대기 시간(초)
     
     Notes:
-        - 최대 3회까지 락 획득을 시도
-        - 각 시도 사이에 1초 대기
-        - ThreadManager의 락과 별개로 작동하는 전역 락
-        - API 호출의 동시성을 제어하여 rate limit 준수
+        - 자원마다 별도의 락을 사용하므로 서로 다른 작업(주문/크롤링)은 동시에 진행
+        - 인스턴스가 여러 스레드(스레드별 이벤트 루프)에서 공유되므로 threading.Lock 사용
+        - 이벤트 루프를 막지 않도록 비차단 획득을 LOCK_POLL_INTERVAL초 간격으로 재시도
+        - ThreadManager의 락과 별개로 작동
     
     Raises:
-        RuntimeError: 3회 시도 후에도 락 획득 실패시
+        RuntimeError: timeout 동안 락 획득 실패시
     """
     def decorator(func):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
-            thread_id = getattr(self, 'thread_id', 0)
-            lock_manager = ThreadLock()
+            lock = self._resource_locks[resource]
+            deadline = time.monotonic() + timeout
             
-            for attempt in range(3):
-                if lock_manager.acquire_lock(thread_id, operation):
-                    try:
-                        return await func(self, *args, **kwargs)
-                    finally:
-                        lock_manager.release_lock(thread_id)
-                else:
-                    await asyncio.sleep(1)
+            while not lock.acquire(blocking=False):
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"Thread {getattr(self, 'thread_id', 0)} failed to acquire lock for {resource}")
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
             
-            raise RuntimeError(f"Thread {thread_id} failed to acquire lock for {operation}")
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                lock.release()
         return wrapper
     return decorator
 
@@ -106,13 +84,59 @@ class UpbitCall:
     Notes:
         - API 메서드들은 두 단계의 락으로 보호됨:
             1. ThreadManager의 공유 락: 스레드 그룹 간의 동기화
-            2. ThreadLock 데코레이터: API 호출의 전역적 동기화
+            2. with_resource_lock 데코레이터: 자원별 API 호출 동기화
         
         - 주요 보호 대상 메서드:
-            - get_candle: 캔들 데이터 조회
-            - buy_market_order: 시장가 매수
-            - sell_market_order: 시장가 매도
+            - buy_market_order, sell_market_order: 주문 락("order")을 공유
+            - fetch_ubmi_data, get_feargreed_data: 크롤링 자원별 락
+        
+        - 캔들 조회(GET)는 락 없이 동작하며, get_candles_bulk로 여러 마켓을
+          최대 CANDLE_FETCH_WORKERS개씩 동시에 조회
+        - 시세 조회 요청은 토큰 버킷으로 초당 QUOTE_REQUESTS_PER_SECOND회까지만 전송
+          (응답의 Remaining-Req 헤더로 남은 요청 수 보정)
+        
+        - get_candle 결과는 (마켓, 간격, 개수) 기준으로 잠시 캐시됨
+          (유효 시간: 캔들 간격의 절반, 최대 CANDLE_CACHE_MAX_TTL초,
+           캐시가 없을 때 같은 조회가 동시에 들어오면 한 번만 요청)
+        - get_krw_markets는 MARKET_LIST_CACHE_TTL초, get_current_price는 PRICE_CACHE_TTL초 동안 캐시됨
+          (start_price_stream 실행 중에는 웹소켓으로 받은 현재가 사용)
     """
+    # CRIX API 마켓 코드 접두어 (예: CRIX.UPBIT.KRW-BTC)
+    CRIX_PREFIX = "CRIX.UPBIT."
+    # 시간 간격별 캔들 조회 URL
+    CANDLE_URLS = {
+        **{minutes: f"{CANDLE_BASE_URL}/minutes/{minutes}" for minutes in ('1', '3', '5', '10', '15', '30', '60', '240')},
+        'D': f"{CANDLE_BASE_URL}/days",
+        'W': f"{CANDLE_BASE_URL}/weeks",
+        'M': f"{CANDLE_BASE_URL}/months",
+    }
+    # 캔들 캐시 최대 유효 시간(초) - 진행 중인 캔들의 종가가 너무 오래 고정되지 않도록 제한
+    CANDLE_CACHE_MAX_TTL = 60
+    # 디스크 캔들 저장 위치 (실행 위치와 무관하게 패키지 루트 기준, load_candles 참고)
+    CANDLE_STORE_DIR = Path(__file__).resolve().parent.parent / 'candles'
+    # 마켓/간격별로 저장하는 최대 캔들 수 (파일 크기와 갱신 비용 상한)
+    CANDLE_STORE_MAX_ROWS = 10000
+    # 캔들 간격별 길이(초)
+    CANDLE_INTERVAL_SECONDS = {'D': 86400, 'W': 604800, 'M': 2592000}
+    # 원화 마켓 목록 캐시 유효 시간(초) - 목록은 몇 분 단위로만 바뀜
+    MARKET_LIST_CACHE_TTL = 300
+    # 현재가 캐시 유효 시간(초) - 같은 시점의 반복 조회만 하나로 합침
+    PRICE_CACHE_TTL = 1
+    # 실시간 시세 웹소켓 URL
+    PRICE_STREAM_URL = "wss://api.upbit.com/websocket/v1"
+    # 웹소켓으로 받은 현재가의 유효 시간(초) - 스트림이 끊기면 이후 조회는 REST로 대체
+    PRICE_STREAM_TTL = 5
+    # 웹소켓 재연결 대기 시간(초)
+    PRICE_STREAM_RECONNECT_DELAY = 3
+    # 시세 조회(마켓 목록/캔들/현재가) 초당 요청 수 - 업비트 제한(초당 10회)의 80%
+    QUOTE_REQUESTS_PER_SECOND = 8
+    # 한 번의 시세 조회 요청에 묶는 최대 마켓 수
+    TICKER_BATCH_SIZE = 100
+    # 동시 캔들 조회 수 - 업비트 시세 API 초당 10회 제한 이하로 유지
+    CANDLE_FETCH_WORKERS = 8
+    # 캔들 조회 락 개수 (키를 해시로 나눠 고정된 락에 배정, _candle_fetch_lock 참고)
+    CANDLE_FETCH_LOCK_STRIPES = 64
+    
     def __init__(self, access_key: str, secret_key: str, is_test: bool = False):
         self.access_key = access_key
         self.secret_key = secret_key
@@ -123,11 +147,63 @@ class UpbitCall:
             'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36'
         }
         self.session = None
+        # REST 호출은 연결(keep-alive)을 재사용하도록 하나의 세션으로 처리
+        self.http_session = self._create_http_session()
+        # 주문/취소/조회 등 인증 요청용 세션 (_create_http_session 참고)
+        self.auth_session = self._create_http_session(retry_status=False)
         self.thread_id = None  # 스레드 식별용
+        # 인증 요청 nonce (_next_nonce 참고)
+        self._nonce_prefix = f"{uuid.uuid4().hex}-"
+        self._nonce_counter = itertools.count()
         self.last_ubmi_fetch_time = None
         self.memory_profiler = MemoryProfiler() 
+        # 스레드 간 공유되는 캔들 조회 결과 캐시
+        self._candle_cache = TTLCache(maxsize=512)
+        # 캔들 조회 락 (_candle_fetch_lock 참고)
+        self._candle_fetch_locks = tuple(Lock() for _ in range(self.CANDLE_FETCH_LOCK_STRIPES))
+        # 캔들 조건부 요청용 (조회 키별 마지막 ETag, 해당 응답의 변환 결과)
+        self._candle_etags: Dict[Tuple, Tuple[str, List[Dict]]] = {}
+        # 스레드 간 공유되는 마켓 목록/현재가 조회 결과 캐시
+        self._quote_cache = TTLCache(maxsize=1024)
+        # 스레드 간 공유되는 시세 조회 속도 제한기 (캐시에 없을 때만 사용)
+        self._quote_limiter = TokenBucket(rate=self.QUOTE_REQUESTS_PER_SECOND)
+        # 마켓 목록 조건부 요청용 (마지막 ETag, 해당 응답의 마켓 목록)
+        self._markets_etag: Tuple[Optional[str], Tuple[str, ...]] = (None, ())
+        # 변환 결과 캐시를 공유하도록 변환기는 한 번만 생성
+        self.converter = MarketDataConverter()
+        # 여러 마켓 캔들 동시 조회용 스레드 풀 (처음 사용할 때 생성)
+        self._candle_executor: Optional[ThreadPoolExecutor] = None
+        self._candle_executor_lock = Lock()
+        # 자원별 API 호출 락 (with_resource_lock 참고)
+        self._resource_locks = {resource: Lock() for resource in ('order', 'ubmi', 'feargreed')}
         
      
+    def _create_http_session(self, retry_status: bool = True) -> requests.Session:
+        """REST 호출용 세션 생성
+        
+        Args:
+            retry_status (bool): 5xx 응답도 재시도할지 여부 (인증 요청용 세션은 False)
+        
+        Returns:
+            requests.Session: 연결 풀과 재시도가 설정된 세션
+            
+        Notes:
+            - 호스트별 연결 풀 크기는 동시 캔들 조회 수(CANDLE_FETCH_WORKERS)보다 크게 설정
+            - 시세 조회: 5xx 응답과 연결 오류는 짧은 백오프로 최대 2회 재시도 (이후에는 마지막 응답을 그대로 반환)
+            - 429는 재시도하지 않음 (속도 제한기와 Remaining-Req 보정을 거치지 않고 다시 요청하게 되므로)
+            - 인증 요청: JWT nonce가 요청마다 한 번만 만들어지므로 서버에 도달하기 전의 연결 실패만 재시도
+              (같은 nonce 재전송으로 실제 오류가 가려지거나 취소 요청이 두 번 전송되지 않도록)
+        """
+        session = requests.Session()
+        session.headers.update(self.user_agent)
+        if retry_status:
+            retry = Retry(total=2, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+        else:
+            retry = Retry(total=2, read=0, status=0, other=0, backoff_factor=0.1, raise_on_status=False)
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        return session
+
+    
     def _setup_logger(self) -> logging.Logger:
         """로깅 설정
         
@@ -137,6 +213,7 @@ class UpbitCall:
         Notes:
             - API 호출 결과는 INFO 레벨로 기록
             - 주문 관련 작업은 WARNING 레벨로 처리
+            - 파일 핸들러는 QueueHandler/QueueListener로 백그라운드 스레드에서 기록
         """
         logger = logging.getLogger('investment_center')
         
@@ -154,11 +231,22 @@ class UpbitCall:
         
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # 파일 기록은 큐 리스너 스레드에서 처리 (주문/조회 경로가 디스크 I/O를 기다리지 않음)
+        logger.addHandler(queue_handler(handler))
         
         return logger
 
     
+    def _next_nonce(self) -> str:
+        """요청마다 다른 nonce 생성
+        
+        Notes:
+            - 인스턴스 생성 시 한 번 만든 UUID 접두어 + 단조 증가 카운터 (요청마다 uuid4를 만들지 않음)
+            - itertools.count의 next는 GIL 아래에서 원자적이므로 스레드 간에도 중복되지 않음
+        """
+        return f"{self._nonce_prefix}{next(self._nonce_counter)}"
+
+    
     def _get_auth_header(self, query: Optional[Dict] = None) -> Dict:
         """
         인증 헤더 생성
@@ -171,7 +259,7 @@ class UpbitCall:
         """
         payload = {
             'access_key': self.access_key,
-            'nonce': str(uuid.uuid4())
+            'nonce': self._next_nonce()
         }
         
         if query:
@@ -187,37 +275,49 @@ class UpbitCall:
         
         Returns:
             List[str]: 원화 마켓 목록
+            
+        Notes:
+            - 캐시가 만료되면 마지막 응답의 ETag로 조건부 요청 (304이면 이전 목록 재사용)
         """
+        cached_markets = self._quote_cache.get('krw_markets')
+        if cached_markets is not None:
+            return list(cached_markets)
+        
         try:
             url = "https://crix-api.upbit.com/v1/crix/trends/change_rate"
-            response = requests.get(url, headers=self.user_agent)
-            markets = response.json()
+            # 이전 응답의 ETag가 있으면 조건부 요청 (변경이 없으면 304와 빈 본문)
+            etag, etag_markets = self._markets_etag
+            headers = {'If-None-Match': etag} if etag else None
+            self._quote_limiter.acquire()
+            response = self.http_session.get(url, headers=headers)
+            self._sync_quote_limit(response)
+            if response.status_code == 304 and etag_markets:
+                self._quote_cache.set('krw_markets', etag_markets, self.MARKET_LIST_CACHE_TTL)
+                return list(etag_markets)
+            markets = json_loads(response.content)
             
-            # KRW 마켓만 필터링하고 거래량으로 정렬
-            krw_markets = [
-                market for market in markets 
-                if 'KRW-' in market['code']
-            ]
-            
-            # accTradeVolume 기준으로 정렬
+            # KRW 마켓만 필터링하고 거래대금(accTradePrice24h) 기준으로 정렬
+            krw_prefix = self.CRIX_PREFIX + 'KRW-'
             sorted_markets = sorted(
-                krw_markets,
+                (market for market in markets if market['code'].startswith(krw_prefix)),
                 key=lambda x: float(x.get('accTradePrice24h', 0)),
                 reverse=True
             )
             
-            # 마켓 이름만 추출
-            return [
-                market['code'].replace("CRIX.UPBIT.", '')
-                for market in sorted_markets
-            ]
+            # 마켓 이름만 추출 (고정 접두어는 슬라이스로 제거)
+            prefix_length = len(self.CRIX_PREFIX)
+            market_codes = [market['code'][prefix_length:] for market in sorted_markets]
+            if market_codes:
+                self._quote_cache.set('krw_markets', tuple(market_codes), self.MARKET_LIST_CACHE_TTL)
+                self._markets_etag = (response.headers.get('ETag'), tuple(market_codes))
+            return market_codes
                 
         except Exception as e:
             self.logger.error(f"원화 마켓 목록 조회 실패: {str(e)}")
             return []
 
     
-    def _has_sufficient_data(self, candle_data: List[Dict], market: str) -> bool:
+    def _has_sufficient_data(self, candle_data: CandleBatch, market: str) -> bool:
         """충분한 캔들 데이터가 있는지 확인"""
         required_candles = 50  # 필요한 최소 캔들 수
         if not candle_data or len(candle_data) < required_candles:
@@ -238,6 +338,11 @@ class UpbitCall:
                 - 월 단위: 'M'
             count (int): 가져올 캔들 개수 (최대 200)
                 
+        Notes:
+            - 같은 (market, interval, count) 조회는 유효 시간 동안 캐시된 결과를 반환
+            - 캐시는 스레드 간 공유되므로 행 딕셔너리는 매번 복사해 반환 (행 안의 *_history 리스트는 읽기 전용)
+            - 캐시가 만료되면 마지막 응답의 ETag로 조건부 요청 (304이면 이전 결과 재사용)
+                
         Returns:
             List[Dict]: 캔들 데이터 리스트. 각 캔들은 다음 정보를 포함:
                 - timestamp: 타임스탬프
@@ -251,74 +356,236 @@ class UpbitCall:
                 - market: 마켓 코드
         """
         try:
-            # URL 구성
-            base_url = "https://crix-api-endpoint.upbit.com/v1/crix/candles"
-            
             # market이 딕셔너리인 경우 market 키의 값을 추출
             if isinstance(market, dict):
                 market = market.get('market', '')
             
             # 시간 간격에 따른 URL 설정
-            if interval in ['1', '3', '5', '10', '15', '30', '60', '240']:
-                url = base_url + "/minutes/" + str(interval)
-            elif interval == 'D':
-                url = base_url + "/days"
-            elif interval == 'W':
-                url = base_url + "/weeks"
-            elif interval == 'M':
-                url = base_url + "/months"
-            else:
+            url = self.CANDLE_URLS.get(interval)
+            if url is None:
                 self.logger.error(f"Thread {threading.current_thread().name} - 잘못된 시간 간격: {interval}")
                 return []
 
-            # CRIX.UPBIT. 접두어 추가
-            market_code = "CRIX.UPBIT." + str(market)
+            # 유효 시간 내 같은 조회가 있었으면 캐시된 결과 반환
+            cache_key = (market, interval, count)
+            cached_candles = self._candle_cache.get(cache_key)
+            if cached_candles is not None:
+                return [dict(row) for row in cached_candles]
+
+            # 같은 조회가 동시에 캐시를 놓치면 한 스레드만 요청하고 나머지는 그 결과를 사용
+            with self._candle_fetch_lock(cache_key):
+                cached_candles = self._candle_cache.get(cache_key)
+                if cached_candles is not None:
+                    return [dict(row) for row in cached_candles]
+                
+                # 이전 응답의 ETag가 있으면 조건부 요청 (변경이 없으면 304이므로 파싱/변환 생략)
+                etag, etag_candles = self._candle_etags.get(cache_key, (None, None))
+                response = self._request_candles(market, url, count, etag)
+                if response.status_code == 304 and etag_candles:
+                    self._candle_cache.set(cache_key, etag_candles, self._candle_cache_ttl(interval))
+                    return [dict(row) for row in etag_candles]
+                
+                candle_batch = self._parse_candle_response(response, market)
+                if candle_batch is None:
+                    return []
+                
+                # 데이터 유효성 검증
+                if not self._has_sufficient_data(candle_batch, market):
+                    return []
+                 
+                converted_candles = self.converter.convert_upbit_candle(candle_batch)
+                if converted_candles:
+                    self._candle_cache.set(cache_key, converted_candles, self._candle_cache_ttl(interval))
+                    response_etag = response.headers.get('ETag')
+                    if response_etag:
+                        self._candle_etags[cache_key] = (response_etag, converted_candles)
+
+            self.logger.debug(f"Thread {threading.current_thread().name} - {market} 캔들 데이터 수신: {len(candle_batch)}개")
+            return [dict(row) for row in converted_candles]
             
-            # 최종 URL 구성
-            final_url = url + "?code=" + market_code + "&count=" + str(count) + "&to"
+        except Exception as e:
+            self.logger.error(f"Thread {threading.current_thread().name} - 캔들 데이터 조회 중 오류: {str(e)}")
+            return []
+
+    
+    def _candle_fetch_lock(self, cache_key: Tuple) -> Lock:
+        """
+        캔들 조회 키에 배정된 락 (같은 키의 동시 요청을 하나로 합치기 위해 사용)
+        
+        Notes:
+            - 키마다 락을 만들지 않고 hash(key) % CANDLE_FETCH_LOCK_STRIPES번째 락을 사용하므로 락 수가 늘지 않음
+            - 같은 락에 배정된 다른 키끼리는 요청이 순서대로 처리됨
+        """
+        return self._candle_fetch_locks[hash(cache_key) % len(self._candle_fetch_locks)]
+
+    
+    def _sync_quote_limit(self, response: requests.Response) -> None:
+        """응답의 Remaining-Req 헤더(예: "group=candles; min=599; sec=9")로 속도 제한기의 남은 요청 수 보정"""
+        remaining = response.headers.get('Remaining-Req')
+        if not remaining:
+            return
+        for field in remaining.split(';'):
+            name, _, value = field.strip().partition('=')
+            if name == 'sec' and value.isdigit():
+                self._quote_limiter.limit(int(value))
+                return
+
+    
+    def _fetch_candle_batch(self, market: str, url: str, count: int) -> Optional[CandleBatch]:
+        """캔들 API 호출 후 응답을 컬럼별 배열 묶음으로 변환 (요청 실패 시 None)"""
+        return self._parse_candle_response(self._request_candles(market, url, count), market)
+
+    
+    def _request_candles(self, market: str, url: str, count: int, etag: Optional[str] = None) -> requests.Response:
+        """캔들 API 호출 (etag가 있으면 If-None-Match 조건부 요청)"""
+        # 최종 URL 구성 (CRIX.UPBIT. 접두어 추가)
+        final_url = f"{url}?code={self.CRIX_PREFIX}{market}&count={count}&to"
+        
+        # URL 로깅
+        self.logger.debug(f"Thread {threading.current_thread().name} - API 요청 URL: {final_url}")
+        
+        headers = {'If-None-Match': etag} if etag else None
+        self._quote_limiter.acquire()
+        response = self.http_session.get(url=final_url, headers=headers)
+        self._sync_quote_limit(response)
+        return response
+
+    
+    def _parse_candle_response(self, response: requests.Response, market: str) -> Optional[CandleBatch]:
+        """캔들 API 응답을 컬럼별 배열 묶음으로 변환 (요청 실패 시 None)"""
+        if response.status_code != 200:
+            self.logger.error(f"Thread {threading.current_thread().name} - API 요청 실패 ({market}): {response.status_code}")
+            return None
+        
+        # 캔들별 딕셔너리 없이 응답에서 바로 컬럼별 배열 생성
+        return CandleBatch.from_upbit(json_loads(response.content), market)
+
+    
+    def load_candles(self, market: str, interval: str = '1', count: int = 200) -> Optional[CandleBatch]:
+        """
+        디스크에 저장된 캔들을 읽고, 저장 이후의 캔들만 API로 조회해 합칩니다.
+        
+        Args:
+            market (str): 마켓 코드 (예: KRW-BTC)
+            interval (str): 시간 간격 (get_candle 참고)
+            count (int): 반환할 최근 캔들 개수
+                
+        Returns:
+            Optional[CandleBatch]: 시간순으로 정렬된 최근 count개 캔들 (조회 실패 시 None)
             
-            # URL 로깅
-            self.logger.debug(f"Thread {threading.current_thread().name} - API 요청 URL: {final_url}")
+        Notes:
+            - 백테스트 등 같은 과거 캔들을 반복해서 사용하는 경우를 위한 조회
+            - CANDLE_STORE_DIR/{market}/{interval}.npy에 레코드 배열로 저장 (최근 CANDLE_STORE_MAX_ROWS개만 유지)
+            - 마지막 저장 캔들(진행 중이었을 수 있음)부터 현재까지의 캔들만 새로 조회
+            - 저장된 캔들이 count개보다 적으면 count개 전체를 조회
+        """
+        try:
+            url = self.CANDLE_URLS.get(interval)
+            if url is None:
+                self.logger.error(f"Thread {threading.current_thread().name} - 잘못된 시간 간격: {interval}")
+                return None
             
-            headers = {
-                'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36'
-            }
+            path = self.CANDLE_STORE_DIR / market / f"{interval}.npy"
+            stored = None
+            fetch_count = count
+            if path.exists():
+                stored = CandleBatch.from_records(np.load(path), market)
+                if len(stored) >= count:
+                    elapsed_ms = time.time() * 1000 - stored.timestamp[-1]
+                    fetch_count = min(count, int(elapsed_ms // (self._interval_seconds(interval) * 1000)) + 1)
             
-            response = requests.get(url=final_url, headers=headers)
+            fetched = self._fetch_candle_batch(market, url, fetch_count)
+            if fetched is None:
+                return stored.tail(count) if stored is not None else None
             
-            if response.status_code != 200:
-                self.logger.error(f"Thread {threading.current_thread().name} - API 요청 실패 ({market}): {response.status_code}")
-                return []
+            candles = fetched.sorted() if stored is None else stored.merge(fetched)
+            candles = candles.tail(self.CANDLE_STORE_MAX_ROWS)
             
-            candles = response.json()
+            # 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp.npy")
+            np.save(temp_path, candles.to_records())
+            os.replace(temp_path, path)
             
-            # 데이터 유효성 검증
-            if not self._has_sufficient_data(candles, market):
-                return []
-             
-            # 데이터 변환
-            processed_candles = [{
-                'timestamp': candle['timestamp'],
-                'datetime': candle['candleDateTimeKst'],
-                'open': candle['openingPrice'],
-                'high': candle['highPrice'],
-                'low': candle['lowPrice'],
-                'close': candle['tradePrice'],
-                'volume': candle['candleAccTradeVolume'],
-                'value': candle['candleAccTradePrice'],
-                'market': market
-            } for candle in candles]
-            converter = MarketDataConverter()
-            converted_candles = converter.convert_upbit_candle(processed_candles)
-
-            self.logger.debug(f"Thread {threading.current_thread().name} - {market} 캔들 데이터 수신: {len(candles)}개")
-            return converted_candles
+            return candles.tail(count)
             
         except Exception as e:
-            self.logger.error(f"Thread {threading.current_thread().name} - 캔들 데이터 조회 중 오류: {str(e)}")
-            return []
+            self.logger.error(f"Thread {threading.current_thread().name} - 저장 캔들 조회 중 오류 ({market}): {str(e)}")
+            return None
+
+    
+    def get_candles_bulk(self, markets: List[str], interval: str = '1', count: int = 300) -> Dict[str, List[Dict]]:
+        """
+        여러 마켓의 캔들 데이터를 동시에 조회합니다.
+        
+        Args:
+            markets (List[str]): 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+            interval (str): 시간 간격 (get_candle 참고)
+            count (int): 가져올 캔들 개수
+                
+        Returns:
+            Dict[str, List[Dict]]: 마켓별 캔들 데이터 (조회 실패 시 빈 리스트)
+            
+        Notes:
+            - 최대 CANDLE_FETCH_WORKERS개의 요청이 동시에 진행되어 네트워크 대기 시간이 겹침
+            - 각 조회는 get_candle과 같이 캐시를 사용하고 오류 시 빈 리스트를 반환
+        """
+        if not markets:
+            return {}
+        
+        results = self._get_candle_executor().map(lambda market: self.get_candle(market, interval, count), markets)
+        return dict(zip(markets, results))
+
+    
+    async def get_candles_bulk_async(self, markets: List[str], interval: str = '1', count: int = 300) -> Dict[str, List[Dict]]:
+        """
+        get_candles_bulk의 비동기 버전 (이벤트 루프를 막지 않고 여러 마켓을 동시에 조회)
+        
+        Args:
+            markets (List[str]): 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+            interval (str): 시간 간격 (get_candle 참고)
+            count (int): 가져올 캔들 개수
+                
+        Returns:
+            Dict[str, List[Dict]]: 마켓별 캔들 데이터 (조회 실패 시 빈 리스트)
+            
+        Notes:
+            - 같은 스레드 풀을 사용하므로 동시 요청 수는 CANDLE_FETCH_WORKERS개로 제한
+        """
+        if not markets:
+            return {}
+        
+        loop = asyncio.get_running_loop()
+        executor = self._get_candle_executor()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, self.get_candle, market, interval, count)
+            for market in markets
+        ))
+        return dict(zip(markets, results))
 
     
+    def _get_candle_executor(self) -> ThreadPoolExecutor:
+        """여러 마켓 캔들 동시 조회용 스레드 풀 (처음 사용할 때 생성)"""
+        with self._candle_executor_lock:
+            if self._candle_executor is None:
+                self._candle_executor = ThreadPoolExecutor(
+                    max_workers=self.CANDLE_FETCH_WORKERS,
+                    thread_name_prefix='candle-fetch'
+                )
+            return self._candle_executor
+
+    
+    def _interval_seconds(self, interval: str) -> int:
+        """캔들 간격의 길이(초)"""
+        seconds = self.CANDLE_INTERVAL_SECONDS.get(interval)
+        if seconds is None:
+            seconds = int(interval) * 60
+        return seconds
+
+    def _candle_cache_ttl(self, interval: str) -> float:
+        """캔들 간격에 따른 캐시 유효 시간(초) (간격의 절반, 최대 CANDLE_CACHE_MAX_TTL)"""
+        return min(self._interval_seconds(interval) / 2, self.CANDLE_CACHE_MAX_TTL)
+
     def get_current_price(self, symbol: str) -> float:
         """현재가 조회
         
@@ -326,16 +593,86 @@ class UpbitCall:
             symbol (str): 조회할 마켓 심볼 (예: "KRW-BTC")
         
         Returns:
-            float: 현재가
+            float: 현재가 (조회 실패 시 0.0)
         """
-        try:
-            url = f"{self.server_url}/v1/ticker"
-            query = {'markets': symbol}
-            response = requests.get(url, params=query, headers=self.user_agent)
-            return float(response.json()[0]['trade_price'])
-        except Exception as e:
-            self.logger.error(f"현재가 조회 실패: {str(e)}")
-            return 0.0
+        return self.get_current_prices([symbol]).get(symbol, 0.0)
+
+    
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """여러 마켓의 현재가를 한 번에 조회
+        
+        Args:
+            symbols (List[str]): 조회할 마켓 심볼 리스트 (예: ["KRW-BTC", "KRW-ETH"])
+        
+        Returns:
+            Dict[str, float]: 마켓별 현재가 (조회에 실패한 마켓은 제외)
+            
+        Notes:
+            - start_price_stream이 실행 중이면 웹소켓으로 받은 현재가를 그대로 사용
+            - 캐시에 없는 마켓만 /v1/ticker?markets=A,B,C 형태로 묶어서 조회
+            - URL 길이 제한을 넘지 않도록 TICKER_BATCH_SIZE개씩 나누어 요청
+        """
+        prices = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            cached_price = self._quote_cache.get(('price', symbol))
+            if cached_price is not None:
+                prices[symbol] = cached_price
+            else:
+                missing.append(symbol)
+        
+        url = f"{self.server_url}/v1/ticker"
+        for start in range(0, len(missing), self.TICKER_BATCH_SIZE):
+            batch = missing[start:start + self.TICKER_BATCH_SIZE]
+            try:
+                self._quote_limiter.acquire()
+                response = self.http_session.get(url, params={'markets': ','.join(batch)})
+                self._sync_quote_limit(response)
+                for ticker in json_loads(response.content):
+                    price = float(ticker['trade_price'])
+                    prices[ticker['market']] = price
+                    self._quote_cache.set(('price', ticker['market']), price, self.PRICE_CACHE_TTL)
+            except Exception as e:
+                self.logger.error(f"현재가 조회 실패 ({','.join(batch)}): {str(e)}")
+        return prices
+
+    
+    async def start_price_stream(self, markets: List[str]) -> None:
+        """웹소켓 현재가 스트림 수신
+        
+        Args:
+            markets (List[str]): 구독할 마켓 심볼 리스트 (예: ["KRW-BTC", "KRW-ETH"])
+            
+        Notes:
+            - 취소될 때까지 실행되므로 asyncio.create_task로 백그라운드에서 실행
+            - 받은 현재가는 현재가 캐시에 PRICE_STREAM_TTL초 동안 저장되어
+              get_current_price/get_current_prices가 REST 호출 없이 사용
+            - 연결이 끊기면 PRICE_STREAM_RECONNECT_DELAY초 후 다시 연결 (그동안은 REST로 조회)
+            - aiohttp 세션은 이벤트 루프별로 사용해야 하므로 스트림 전용 세션을 생성
+        """
+        subscribe = [
+            {'ticket': self._next_nonce()},
+            {'type': 'ticker', 'codes': list(markets)}
+        ]
+        
+        async with aiohttp.ClientSession(headers=self.user_agent) as session:
+            while True:
+                try:
+                    async with session.ws_connect(self.PRICE_STREAM_URL, heartbeat=30) as ws:
+                        await ws.send_json(subscribe)
+                        async for message in ws:
+                            if message.type == aiohttp.WSMsgType.ERROR:
+                                break
+                            if message.type not in (aiohttp.WSMsgType.BINARY, aiohttp.WSMsgType.TEXT):
+                                continue
+                            ticker = json_loads(message.data)
+                            self._quote_cache.set(('price', ticker['code']), float(ticker['trade_price']), self.PRICE_STREAM_TTL)
+                    self.logger.warning("현재가 스트림 연결 종료, 재연결 대기")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.logger.error(f"현재가 스트림 수신 중 오류: {str(e)}")
+                await asyncio.sleep(self.PRICE_STREAM_RECONNECT_DELAY)
 
     
     def place_order(self, symbol: str, side: str, volume: float, price: Optional[float] = None) -> Dict:
@@ -376,7 +713,7 @@ class UpbitCall:
                 query['price'] = str(price)
 
             headers = self._get_auth_header(query)
-            response = requests.post(url, json=query, headers=headers)
+            response = self.auth_session.post(url, json=query, headers=headers)
             return response.json()
 
         except Exception as e:
@@ -406,7 +743,7 @@ class UpbitCall:
             url = f"{self.server_url}/v1/order"
             query = {'uuid': uuid}
             headers = self._get_auth_header(query)
-            response = requests.delete(url, params=query, headers=headers)
+            response = self.auth_session.delete(url, params=query, headers=headers)
             return response.json()
         except Exception as e:
             self.logger.error(f"주문 취소 실패: {str(e)}")
@@ -435,7 +772,7 @@ class UpbitCall:
             url = f"{self.server_url}/v1/order"
             query = {'uuid': uuid}
             headers = self._get_auth_header(query)
-            response = requests.get(url, params=query, headers=headers)
+            response = self.auth_session.get(url, params=query, headers=headers)
             return response.json()
         except Exception as e:
             self.logger.error(f"주문 상태 조회 실패: {str(e)}")
@@ -450,31 +787,44 @@ class UpbitCall:
             period (int): 계산할 기간 (기본값: 14)
         
         Returns:
-            float: 계산된 RSI 값
+            float: 계산된 RSI 값 (데이터가 period개 이하이면 NaN)
         """
         try:
-            df = pd.DataFrame({'close': data})
-            delta = df['close'].diff()
-            
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            return float(rsi.iloc[-1])
+            # 마지막 값만 필요하므로 결과 배열 없이 Wilder 평활 상태만 갱신하는 커널 사용
+            prices = np.ascontiguousarray(data, dtype=np.float64)
+            if not len(prices):
+                raise ValueError("가격 데이터가 비어 있습니다")
+            return float(rsi_last(prices, period))
         except Exception as e:
             self.logger.error(f"RSI 계산 실패: {str(e)}")
             return 0.0
 
     
-    @with_thread_lock("buy")
+    def calculate_rsi_matrix(self, closes: np.ndarray, period: int = 14) -> np.ndarray:
+        """여러 마켓의 RSI를 한 번에 계산
+        
+        Args:
+            closes (np.ndarray): (마켓 수, 캔들 수) 종가 행렬 (각 행은 시간순)
+            period (int): 계산할 기간 (기본값: 14)
+        
+        Returns:
+            np.ndarray: 마켓별 RSI (calculate_rsi와 같은 값, 계산 실패 시 빈 배열)
+        """
+        try:
+            return rsi_last_matrix(closes, period)
+        except Exception as e:
+            self.logger.error(f"RSI 일괄 계산 실패: {str(e)}")
+            return np.empty(0)
+
+    
+    @with_resource_lock("order")
     async def buy_market_order(self, market: str, price: float) -> Dict:
         """시장가 매수
         
         Notes:
             - ThreadManager의 buy 락과 함께 동작
             - 주문 실행의 동시성 제어
+            - 주문 요청은 공유 HTTP 세션(연결 재사용)으로 작업 스레드에서 전송
         """
         try:
             query = {
@@ -490,7 +840,9 @@ class UpbitCall:
                 'Content-Type': 'application/json'
             }
             
-            response = requests.post(
+            # 동기 HTTP 호출은 작업 스레드에서 실행해 이벤트 루프를 막지 않음
+            response = await asyncio.to_thread(
+                self.auth_session.post,
                 'https://api.upbit.com/v1/orders',
                 json=query,
                 headers=headers
@@ -508,13 +860,14 @@ class UpbitCall:
             return {}
 
     
-    @with_thread_lock("sell")
+    @with_resource_lock("order")
     async def sell_market_order(self, market: str, volume: float) -> Dict:
         """시장가 매도
         
         Notes:
             - ThreadManager의 sell 락과 함께 동작
             - 주문 실행의 동시성 제어
+            - 주문 요청은 공유 HTTP 세션(연결 재사용)으로 작업 스레드에서 전송
         """
         try:
             query = {
@@ -530,7 +883,9 @@ class UpbitCall:
                 'Content-Type': 'application/json'
             }
             
-            response = requests.post(
+            # 동기 HTTP 호출은 작업 스레드에서 실행해 이벤트 루프를 막지 않음
+            response = await asyncio.to_thread(
+                self.auth_session.post,
                 'https://api.upbit.com/v1/orders',
                 json=query,
                 headers=headers
@@ -559,7 +914,7 @@ class UpbitCall:
         """
         payload = {
             'access_key': self.access_key,
-            'nonce': str(uuid.uuid4()),
+            'nonce': self._next_nonce(),
             'query_hash': self._create_query_hash(query),
             'query_hash_alg': 'SHA512',
         }
@@ -576,10 +931,7 @@ class UpbitCall:
         Returns:
             str: 생성된 쿼리 해시
         """
-        query_string = urlencode(query).encode()
-        m = hashlib.sha512()
-        m.update(query_string)
-        return m.hexdigest()
+        return hashlib.sha512(urlencode(query).encode()).hexdigest()
 
     
     async def initialize(self, thread_id: int, loop=None):
@@ -597,6 +949,12 @@ class UpbitCall:
         if self.session:
             await self.session.close()
             self.session = None
+        self.http_session.close()
+        self.auth_session.close()
+        with self._candle_executor_lock:
+            if self._candle_executor is not None:
+                self._candle_executor.shutdown(wait=False)
+                self._candle_executor = None
 
     
     def should_fetch_ubmi(self) -> bool:
@@ -632,7 +990,7 @@ class UpbitCall:
         return options
     
     
-    @with_thread_lock("ubmi")
+    @with_resource_lock("ubmi")
     async def fetch_ubmi_data(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """UBMI 데이터 크롤링"""
         url = 'https://ubcindex.com/home'
@@ -746,7 +1104,7 @@ class UpbitCall:
             return None
 
     
-    @with_thread_lock("feargreed")
+    @with_resource_lock("feargreed")
     async def get_feargreed_data(self, url: str = "https://www.ubcindex.com/feargreed") -> List[Dict[str, Any]]:
         """Fear & Greed 데이터 크롤링
         
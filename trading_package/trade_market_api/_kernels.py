@@ -0,0 +1,334 @@
+"""
+기술적 지표 계산 커널 모듈
+
+MarketDataConverter의 지표 계산 중 반복 연산이 필요한 부분을
+float64 배열만 받는 순수 함수로 분리합니다.
+
+Notes:
+    - 커널은 @njit(cache=True)로 컴파일 (numba가 없으면 순수 파이썬으로 동작)
+    - 여러 마켓을 한 번에 계산하는 *_matrix 함수는 마켓 축 배열 연산으로 처리 (JIT 불필요)
+    - 계산할 수 없는 구간은 NaN으로 반환하고, 기본값 처리는 호출 측에서 담당
+"""
+
+import numpy as np
+from utils._njit import njit
+
+@njit(cache=True)
+def rsi_wilder(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder 평활 방식의 RSI 계산
+
+    Args:
+        prices (np.ndarray): 종가 배열 (float64)
+        period (int): RSI 계산 기간
+
+    Returns:
+        np.ndarray: 입력과 같은 길이의 RSI 배열 (앞 period개는 NaN)
+
+    Notes:
+        - 첫 period개 변화량의 단순 평균으로 시작해 avg = (avg * (period - 1) + x) / period로 갱신
+        - 평균 하락폭이 0이면 상승폭이 있을 때 100, 없을 때 50
+    """
+    n = prices.size
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev = prices[0]
+    for i in range(1, n):
+        price = prices[i]
+        delta = price - prev
+        prev = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+            if i < period:
+                continue
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        else:
+            out[i] = 100.0 if avg_gain > 0 else 50.0
+    return out
+
+@njit(cache=True)
+def rsi_last(prices: np.ndarray, period: int) -> float:
+    """
+    Wilder 평활 방식 RSI의 마지막 값만 계산
+
+    Args:
+        prices (np.ndarray): 종가 배열 (float64)
+        period (int): RSI 계산 기간
+
+    Returns:
+        float: rsi_wilder(prices, period)[-1]과 같은 값 (데이터가 period개 이하이면 NaN)
+
+    Notes:
+        - 결과 배열 없이 평균 상승폭/하락폭 두 값만 유지
+        - 변화량/상승폭/하락폭 배열을 만들지 않고 가격 배열을 한 번만 읽음 (추가 메모리 O(1))
+    """
+    n = prices.size
+    if n <= period:
+        return np.nan
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev = prices[0]
+    for i in range(1, n):
+        price = prices[i]
+        delta = price - prev
+        prev = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss > 0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return 100.0 if avg_gain > 0 else 50.0
+
+def rsi_last_matrix(closes: np.ndarray, period: int) -> np.ndarray:
+    """
+    여러 마켓의 마지막 Wilder RSI를 한 번에 계산
+
+    Args:
+        closes (np.ndarray): (마켓 수, 캔들 수) 종가 행렬 (float64, 각 행은 시간순)
+        period (int): RSI 계산 기간
+
+    Returns:
+        np.ndarray: 마켓별 RSI (행마다 rsi_last와 같은 값, 캔들이 period개 이하이면 NaN)
+
+    Notes:
+        - 재귀식은 시간 축으로만 순회하고, 각 단계는 마켓 축 전체에 대한 배열 연산 한 번
+        - 마켓 수만큼 반복하는 커널보다 호출/순회 비용이 적어 numba 없이도 빠름
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n_markets, n = closes.shape
+    if n <= period:
+        return np.full(n_markets, np.nan)
+
+    delta = np.diff(closes, axis=1)
+    gains = np.maximum(delta, 0.0)
+    losses = np.maximum(-delta, 0.0)
+    avg_gain = gains[:, :period].mean(axis=1)
+    avg_loss = losses[:, :period].mean(axis=1)
+    for t in range(period, n - 1):
+        avg_gain = (avg_gain * (period - 1) + gains[:, t]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[:, t]) / period
+
+    # 하락이 없으면 상승폭이 있을 때 100, 변화가 없을 때 50
+    no_gain_value = np.where(avg_gain > 0, 100.0, 50.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss > 0, rsi, no_gain_value)
+
+@njit(cache=True)
+def bollinger_bands(close: np.ndarray, window: int, num_std: float):
+    """
+    볼린저 밴드 중심선/상단/하단을 한 번의 순회로 계산
+
+    Args:
+        close (np.ndarray): 종가 배열 (float64)
+        window (int): 이동평균 기간
+        num_std (float): 밴드 폭 (표준편차 배수)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (중심선, 상단, 하단) (앞 window - 1개는 NaN)
+
+    Notes:
+        - 윈도우 평균과 편차 제곱합(M2)을 Welford 방식으로 갱신 (값 추가/제거 O(1))
+        - 표준편차는 pandas rolling().std()와 같은 표본 표준편차(ddof=1)
+    """
+    n = close.size
+    middle = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = close[i]
+        if i < window:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            old = close[i - window]
+            prev_mean = mean
+            mean += (x - old) / window
+            m2 += (x - old) * (x - mean + old - prev_mean)
+        if i >= window - 1:
+            std = np.sqrt(m2 / (window - 1)) if m2 > 0 else 0.0
+            middle[i] = mean
+            upper[i] = mean + std * num_std
+            lower[i] = mean - std * num_std
+    return middle, upper, lower
+
+@njit(cache=True)
+def volatility_score(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                     range_window: int, volume_window: int) -> np.ndarray:
+    """
+    가격 변동폭과 거래량 변동성을 합친 변동성 점수(0 ~ 1)를 한 번의 순회로 계산
+
+    Args:
+        high, low, close, volume (np.ndarray): 고가/저가/종가/거래량 배열 (float64)
+        range_window (int): 변동폭((고가 - 저가) / 종가) 표준편차 기간
+        volume_window (int): 거래량 이동평균 기간
+
+    Returns:
+        np.ndarray: 변동성 점수 배열 (두 윈도우가 모두 채워지기 전이나 계산할 수 없으면 NaN)
+
+    Notes:
+        - 0.7 * 변동폭 표준편차(ddof=1) + 0.3 * (거래량 / 거래량 평균, 0 ~ 5로 제한) / 5, 0 ~ 1로 제한
+        - 변동폭은 Welford 방식, 거래량은 누적 합으로 윈도우 값 추가/제거 O(1)
+    """
+    n = close.size
+    out = np.full(n, np.nan)
+
+    range_mean = 0.0
+    range_m2 = 0.0
+    volume_sum = 0.0
+    for i in range(n):
+        x = (high[i] - low[i]) / close[i]
+        if i < range_window:
+            delta = x - range_mean
+            range_mean += delta / (i + 1)
+            range_m2 += delta * (x - range_mean)
+        else:
+            old = (high[i - range_window] - low[i - range_window]) / close[i - range_window]
+            prev_mean = range_mean
+            range_mean += (x - old) / range_window
+            range_m2 += (x - old) * (x - range_mean + old - prev_mean)
+
+        volume_sum += volume[i]
+        if i >= volume_window:
+            volume_sum -= volume[i - volume_window]
+
+        if i < range_window - 1 or i < volume_window - 1:
+            continue
+
+        daily_volatility = np.sqrt(range_m2 / (range_window - 1)) if range_m2 > 0 else 0.0
+        volume_mean = volume_sum / volume_window
+        if volume_mean > 0:
+            volume_volatility = min(max(volume[i] / volume_mean, 0.0), 5.0)
+        elif volume[i] > 0:
+            volume_volatility = 5.0
+        else:
+            continue  # 0 / 0
+        out[i] = min(max(daily_volatility * 0.7 + (volume_volatility / 5) * 0.3, 0.0), 1.0)
+    return out
+
+@njit(cache=True)
+def macd_lines(close: np.ndarray, fast: int, slow: int, signal_span: int):
+    """
+    MACD, 시그널, 오실레이터를 한 번의 순회로 계산
+
+    Args:
+        close (np.ndarray): 종가 배열 (float64)
+        fast (int): 단기 EMA 기간
+        slow (int): 장기 EMA 기간
+        signal_span (int): 시그널 EMA 기간
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (MACD, 시그널, 오실레이터)
+
+    Notes:
+        - EMA는 pandas ewm(span, adjust=False)와 같이 첫 값에서 시작해 y = a * x + (1 - a) * y로 갱신
+        - 시그널도 첫 MACD 값에서 시작
+    """
+    n = close.size
+    macd = np.empty(n)
+    signal = np.empty(n)
+    oscillator = np.empty(n)
+    if n == 0:
+        return macd, signal, oscillator
+
+    fast_alpha = 2.0 / (fast + 1)
+    slow_alpha = 2.0 / (slow + 1)
+    signal_alpha = 2.0 / (signal_span + 1)
+    fast_ema = close[0]
+    slow_ema = close[0]
+    signal_ema = 0.0
+    for i in range(n):
+        fast_ema = fast_alpha * close[i] + (1 - fast_alpha) * fast_ema
+        slow_ema = slow_alpha * close[i] + (1 - slow_alpha) * slow_ema
+        value = fast_ema - slow_ema
+        signal_ema = value if i == 0 else signal_alpha * value + (1 - signal_alpha) * signal_ema
+        macd[i] = value
+        signal[i] = signal_ema
+        oscillator[i] = value - signal_ema
+    return macd, signal, oscillator
+
+@njit(cache=True)
+def ichimoku_lines(high: np.ndarray, low: np.ndarray, conversion_period: int, base_period: int,
+                   span_b_period: int, displacement: int):
+    """
+    일목균형표 전환선/기준선/선행스팬 A/선행스팬 B를 한 번의 순회로 계산
+
+    Args:
+        high, low (np.ndarray): 고가/저가 배열 (float64)
+        conversion_period (int): 전환선 기간 (9)
+        base_period (int): 기준선 기간 (26)
+        span_b_period (int): 선행스팬 B 기간 (52)
+        displacement (int): 선행스팬을 앞으로 옮기는 캔들 수 (26)
+
+    Returns:
+        Tuple[np.ndarray, ...]: (전환선, 기준선, 선행스팬 A, 선행스팬 B) (선행스팬 앞 displacement개는 NaN)
+
+    Notes:
+        - 세 기간의 최고가/최저가를 기간별 단조 덱으로 함께 갱신 (원소당 분할상환 O(1))
+        - 초기 구간은 rolling(min_periods=1)과 같이 그때까지의 값만 사용
+    """
+    n = high.size
+    periods = np.array([conversion_period, base_period, span_b_period])
+    midpoints = np.empty((3, n))
+
+    # 덱에는 인덱스만 저장 (tail은 뒤쪽 제거 시 감소하지만 각 인덱스는 최대 한 번만 추가되므로 tail <= i + 1, 길이 n 배열로 충분)
+    max_deque = np.empty((3, n), dtype=np.int64)
+    min_deque = np.empty((3, n), dtype=np.int64)
+    max_head = np.zeros(3, dtype=np.int64)
+    max_tail = np.zeros(3, dtype=np.int64)
+    min_head = np.zeros(3, dtype=np.int64)
+    min_tail = np.zeros(3, dtype=np.int64)
+
+    for i in range(n):
+        for k in range(3):
+            start = i - periods[k] + 1
+
+            while max_tail[k] > max_head[k] and high[max_deque[k, max_tail[k] - 1]] <= high[i]:
+                max_tail[k] -= 1
+            max_deque[k, max_tail[k]] = i
+            max_tail[k] += 1
+            while max_deque[k, max_head[k]] < start:
+                max_head[k] += 1
+
+            while min_tail[k] > min_head[k] and low[min_deque[k, min_tail[k] - 1]] >= low[i]:
+                min_tail[k] -= 1
+            min_deque[k, min_tail[k]] = i
+            min_tail[k] += 1
+            while min_deque[k, min_head[k]] < start:
+                min_head[k] += 1
+
+            midpoints[k, i] = (high[max_deque[k, max_head[k]]] + low[min_deque[k, min_head[k]]]) / 2
+
+    conversion_line = midpoints[0]
+    base_line = midpoints[1]
+    cloud_top = np.full(n, np.nan)
+    cloud_bottom = np.full(n, np.nan)
+    if n > displacement:
+        cloud_top[displacement:] = ((conversion_line + base_line) / 2)[:n - displacement]
+        cloud_bottom[displacement:] = midpoints[2][:n - displacement]
+    return conversion_line, base_line, cloud_top, cloud_bottom
+
+__all__ = ['rsi_wilder', 'rsi_last', 'rsi_last_matrix', 'bollinger_bands', 'volatility_score', 'macd_lines', 'ichimoku_lines']
@@ -18,6 +18,9 @@ from strategy.Strategies import (
     UptrendEndStrategy,
     DivergenceStrategy
 )
+from strategy.FeatureBundle import FeatureBundle
+from strategy.MarketSnapshot import MarketSnapshot
+import numpy as np
 import pandas as pd
 from trade_market_api.UpbitCall import UpbitCall
 import asyncio
@@ -29,6 +32,19 @@ class MarketAnalyzer:
     시장 분석을 위한 클래스
     여러 기술적 지표와 전략을 사용하여 거래 신호를 생성합니다.
     """
+    # 전략에 제공하는 이력 길이
+    HISTORY_SIZE = 5
+    # (이력 이름, 캔들 키, 기본값, 저장 타입)
+    # 0~100 범위 지표(RSI, 스토캐스틱)는 float32로 충분하고, 가격 단위 값은 정밀도를 위해 float64 유지
+    HISTORY_FIELDS = (
+        ('price_history', 'close', None, np.float64),
+        ('volume_history', 'volume', None, np.float64),
+        ('rsi_history', 'rsi', 50, np.float32),
+        ('macd_history', 'macd', 0, np.float64),
+        ('stoch_k_history', 'stoch_k', 50, np.float32),
+    )
+    # 캔들에서 이력 필드만 읽어 담는 구조화 배열 타입 (필드별 저장 타입)
+    HISTORY_DTYPE = np.dtype([(name, dtype) for name, _, _, dtype in HISTORY_FIELDS])
     def __init__(self, config, exchange_name: str):
         """
         MarketAnalyzer 초기화
@@ -168,6 +184,45 @@ class MarketAnalyzer:
         return result
 
      
+    def _history_records(self, candles: List[Dict]) -> np.ndarray:
+        """
+        캔들 목록에서 이력 필드만 읽어 구조화 배열로 변환
+        
+        Args:
+            candles (List[Dict]): 캔들 데이터
+            
+        Returns:
+            np.ndarray: HISTORY_DTYPE 구조화 배열 (필드 이름은 이력 이름)
+            
+        Notes:
+            - 필요한 키만 한 번씩 읽어 필드별 저장 타입으로 바로 기록 (중간 float 리스트 생성 없음)
+            - 필수 키(종가, 거래량)가 없으면 KeyError
+        """
+        fields = self.HISTORY_FIELDS
+        return np.fromiter(
+            (tuple(candle[key] if default is None else candle.get(key, default)
+                   for _, key, default, _ in fields)
+             for candle in candles),
+            dtype=self.HISTORY_DTYPE,
+            count=len(candles)
+        )
+
+    def _recent_histories(self, candles: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        최근 HISTORY_SIZE개 캔들의 이력 배열 생성
+        
+        Args:
+            candles (List[Dict]): 시간순 캔들 데이터
+            
+        Returns:
+            Dict[str, np.ndarray]: 이력 이름별 고정 크기 배열 (필드별 저장 타입)
+            
+        Notes:
+            - 호출마다 최근 캔들에서 새로 만들므로 마켓/간격별 상태나 락이 필요 없음
+        """
+        records = self._history_records(candles[-self.HISTORY_SIZE:])
+        return {name: np.ascontiguousarray(records[name]) for name, _, _, _ in self.HISTORY_FIELDS}
+
     def analyze_market(self, market: str, candles: List[Dict]) -> Dict:
         """
         주어진 시장에 대해 모든 전략을 실행하여 종합적인 분석을 수행합니다.
@@ -193,24 +248,25 @@ class MarketAnalyzer:
 
             # 현재 캔들 데이터
             current_candle = candles[-1]
+            histories = self._recent_histories(candles)
             
-            # 시장 데이터 구성
+            # 시장 데이터 구성 (DB 저장용이므로 이력은 리스트로 보관)
             market_data = {
                 'current_price': float(current_candle['close']),
-                'price_history': [float(c['close']) for c in candles[-5:]],  # 최근 5개
+                'price_history': histories['price_history'].tolist(),  # 최근 5개
                 'volume': float(current_candle['volume']),
-                'volume_history': [float(c['volume']) for c in candles[-5:]],
+                'volume_history': histories['volume_history'].tolist(),
                 'high': float(current_candle['high']),
                 'low': float(current_candle['low']),
                 
                 # RSI 관련
                 'rsi': float(current_candle.get('rsi', 50)),
-                'rsi_history': [float(c.get('rsi', 50)) for c in candles[-5:]],
+                'rsi_history': histories['rsi_history'].tolist(),
                 
                 # MACD 관련
                 'macd': float(current_candle.get('macd', 0)),
                 'signal': float(current_candle.get('signal', 0)),
-                'macd_history': [float(c.get('macd', 0)) for c in candles[-5:]],
+                'macd_history': histories['macd_history'].tolist(),
                 
                 # 볼린저 밴드
                 'upper_band': float(current_candle.get('upper_band', 0)),
@@ -220,7 +276,7 @@ class MarketAnalyzer:
                 # 스토캐스틱
                 'stoch_k': float(current_candle.get('stoch_k', 50)),
                 'stoch_d': float(current_candle.get('stoch_d', 50)),
-                'stoch_k_history': [float(c.get('stoch_k', 50)) for c in candles[-5:]],
+                'stoch_k_history': histories['stoch_k_history'].tolist(),
                 
                 # 이동평균
                 'ma5': float(current_candle.get('sma5', 0)),
@@ -271,10 +327,38 @@ class MarketAnalyzer:
             # 전략별 결과 수집 및 총합 계산
             strategy_results = {}
             total_strength = 0
+            # 전략 입력은 이력 배열을 그대로 사용하는 스냅샷 (전략 간 공유 지표는 한 번만 계산)
+            # 딕셔너리 병합/키 검색 없이 필요한 필드만 직접 채움
+            snapshot = MarketSnapshot(
+                current_price=market_data['current_price'],
+                price_history=histories['price_history'],
+                price_change_rate=market_data['price_change_rate'],
+                volume=market_data['volume'],
+                volume_history=histories['volume_history'],
+                current_volume=market_data['current_volume'],
+                average_volume=market_data['average_volume'],
+                rsi=market_data['rsi'],
+                rsi_history=histories['rsi_history'],
+                macd=market_data['macd'],
+                signal=market_data['signal'],
+                macd_history=histories['macd_history'],
+                upper_band=market_data['upper_band'],
+                lower_band=market_data['lower_band'],
+                stoch_k=market_data['stoch_k'],
+                stoch_d=market_data['stoch_d'],
+                stoch_k_history=histories['stoch_k_history'],
+                ma5=market_data['ma5'],
+                ma20=market_data['ma20'],
+                momentum=market_data['momentum'],
+                market_sentiment=market_data['market_sentiment'],
+                ichimoku_cloud_top=market_data['ichimoku_cloud_top'],
+                ichimoku_cloud_bottom=market_data['ichimoku_cloud_bottom'],
+            )
+            features = FeatureBundle(snapshot)
             
             for name, strategy in self.strategies.items():
                 try:
-                    result = strategy.analyze(market_data)
+                    result = strategy.analyze(snapshot, features)
                     strategy_results[name] = {
                         'signal': 'buy' if result >= 0.65 else 'sell' if result <= 0.35 else 'hold',
                         'strength': float(result),
@@ -0,0 +1,43 @@
+"""
+bottleneck 이동 윈도우 함수 호환 모듈
+
+bottleneck이 설치된 환경에서는 bottleneck.move_* 함수를 사용하고,
+설치되지 않은 환경에서는 같은 결과를 내는 pandas rolling 계산으로 대체합니다.
+
+Notes:
+    - min_count는 pandas rolling의 min_periods와 같은 의미 (None이면 window)
+    - bottleneck은 window가 배열 길이보다 크면 오류이므로 이 경우에도 pandas로 계산
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    bn = None
+    HAS_BOTTLENECK = False
+
+def _use_bottleneck(values: np.ndarray, window: int) -> bool:
+    return HAS_BOTTLENECK and window <= len(values)
+
+def move_min(values: np.ndarray, window: int, min_count: int = None) -> np.ndarray:
+    """이동 최솟값"""
+    if _use_bottleneck(values, window):
+        return bn.move_min(values, window, min_count=min_count)
+    return pd.Series(values).rolling(window=window, min_periods=min_count).min().to_numpy()
+
+def move_max(values: np.ndarray, window: int, min_count: int = None) -> np.ndarray:
+    """이동 최댓값"""
+    if _use_bottleneck(values, window):
+        return bn.move_max(values, window, min_count=min_count)
+    return pd.Series(values).rolling(window=window, min_periods=min_count).max().to_numpy()
+
+def move_mean(values: np.ndarray, window: int, min_count: int = None) -> np.ndarray:
+    """이동 평균"""
+    if _use_bottleneck(values, window):
+        return bn.move_mean(values, window, min_count=min_count)
+    return pd.Series(values).rolling(window=window, min_periods=min_count).mean().to_numpy()
+
+__all__ = ['move_min', 'move_max', 'move_mean', 'HAS_BOTTLENECK']
@@ -0,0 +1,20 @@
+"""
+orjson 호환 모듈
+
+orjson이 설치된 환경에서는 orjson.loads를 사용하고,
+설치되지 않은 환경에서는 표준 json.loads로 대체합니다.
+
+Notes:
+    - 두 함수 모두 bytes를 그대로 받으므로 response.content를 바로 전달 (텍스트 디코딩 생략)
+"""
+
+try:
+    import orjson
+    loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    loads = json.loads
+    HAS_ORJSON = False
+
+__all__ = ['loads', 'HAS_ORJSON']
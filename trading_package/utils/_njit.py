@@ -0,0 +1,27 @@
+"""
+numba JIT 데코레이터 호환 모듈
+
+numba가 설치된 환경에서는 numba.njit를 그대로 사용하고,
+설치되지 않은 환경에서는 함수를 변경하지 않는 대체 데코레이터를 제공합니다.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        numba.njit 대체 데코레이터 (순수 파이썬 함수 그대로 반환)
+
+        @njit 와 @njit(cache=True) 두 가지 사용 형태를 모두 지원합니다.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+__all__ = ['njit', 'HAS_NUMBA']
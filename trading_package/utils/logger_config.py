@@ -1,8 +1,51 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import yaml
 from utils.time_utils import TimeUtils
 
+def queue_handler(*handlers: logging.Handler) -> QueueHandler:
+    """실제 출력 핸들러를 백그라운드 스레드에서 처리하는 QueueHandler 생성
+    
+    Args:
+        *handlers (logging.Handler): 파일/콘솔 등 실제 출력 핸들러
+        
+    Returns:
+        QueueHandler: 로거에 추가할 핸들러 (로그 기록은 큐에 넣기만 하므로 호출 스레드가 디스크 I/O를 기다리지 않음)
+        
+    Notes:
+        - 각 핸들러의 레벨은 그대로 적용 (respect_handler_level)
+        - 리스너는 핸들러 제거 시 stop_queue_handler로, 프로세스 종료 시 자동으로 정지되며 남은 로그를 모두 기록
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    handler = QueueHandler(log_queue)
+    handler.listener = listener
+    return handler
+
+def stop_queue_handler(handler: logging.Handler) -> None:
+    """queue_handler로 만든 핸들러의 리스너 정지 (남은 로그 기록 후 출력 핸들러 닫기)"""
+    listener = getattr(handler, 'listener', None)
+    if listener is None or listener._thread is None:
+        return
+    listener.stop()
+    for target in listener.handlers:
+        target.close()
+
+@atexit.register
+def _stop_queue_handlers() -> None:
+    """프로세스 종료 시 모든 로거의 큐 리스너 정지"""
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            stop_queue_handler(handler)
+
 def setup_logger(logger_name: str = 'investment_center') -> logging.Logger:
     """로깅 설정
     
@@ -27,11 +70,13 @@ def setup_logger(logger_name: str = 'investment_center') -> logging.Logger:
         if logger.handlers:
             for handler in logger.handlers[:]:
                 logger.removeHandler(handler)
+                stop_queue_handler(handler)
         
         # 로그 포맷 설정
         log_format = config.get('logging', {}).get('format', 
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         formatter = logging.Formatter(log_format)
+        handlers = []
         
         # 콘솔 핸들러 설정
         if config.get('logging', {}).get('console', {}).get('enabled', True):
@@ -39,7 +84,7 @@ def setup_logger(logger_name: str = 'investment_center') -> logging.Logger:
             console_level = config.get('logging', {}).get('console', {}).get('level', 'INFO')
             console_handler.setLevel(getattr(logging, console_level.upper()))
             console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # 파일 핸들러 설정
         if config.get('logging', {}).get('file', {}).get('enabled', True):
@@ -59,7 +104,11 @@ def setup_logger(logger_name: str = 'investment_center') -> logging.Logger:
             file_level = config.get('logging', {}).get('file', {}).get('level', 'DEBUG')
             file_handler.setLevel(getattr(logging, file_level.upper()))
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # 출력은 큐 리스너 스레드에서 처리
+        if handlers:
+            logger.addHandler(queue_handler(*handlers))
         
         return logger
         
@@ -81,7 +130,6 @@ def setup_logger(logger_name: str = 'investment_center') -> logging.Logger:
         )
         file_handler.setFormatter(formatter)
         
-        logger.addHandler(handler)
-        logger.addHandler(file_handler)
+        logger.addHandler(queue_handler(handler, file_handler))
         
         return logger 
\ No newline at end of file
@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import Callable
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 요청 속도 제한기
+
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓이며, 요청마다 토큰 하나를 사용합니다.
+
+    Notes:
+        - 토큰이 남아 있으면 대기 없이 바로 진행 (capacity개까지 연속 요청 허용)
+        - 토큰이 부족하면 다음 토큰이 채워질 시점을 예약하고 그때까지만 대기
+        - 대기는 락 밖에서 하므로 다른 스레드의 예약을 막지 않음
+        - 서버가 알려주는 남은 요청 수(limit)가 더 적으면 그 값에 맞춰 토큰을 줄임
+    """
+    __slots__ = ('_rate', '_capacity', '_tokens', '_updated_at', '_lock', '_timer', '_sleep')
+
+    def __init__(self, rate: float, capacity: float = None,
+                 timer: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            capacity (float): 연속으로 허용할 최대 요청 수 (기본값: rate)
+            timer (Callable[[], float]): 현재 시각(초) 함수 (기본 time.monotonic)
+            sleep (Callable[[float], None]): 대기 함수 (기본 time.sleep)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self._rate = rate
+        self._capacity = rate if capacity is None else capacity
+        self._tokens = self._capacity
+        self._timer = timer
+        self._updated_at = timer()
+        self._lock = threading.Lock()
+        self._sleep = sleep
+
+    def acquire(self) -> float:
+        """토큰 하나를 사용 (부족하면 채워질 때까지 대기)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def limit(self, remaining: float) -> None:
+        """남은 토큰 수를 서버가 알려준 남은 요청 수 이하로 제한
+
+        Args:
+            remaining (float): 현재 구간에서 서버가 허용하는 남은 요청 수
+        """
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate, remaining)
+            self._updated_at = now
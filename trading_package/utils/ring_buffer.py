@@ -0,0 +1,112 @@
+import numpy as np
+from typing import Iterable, Optional
+
+class RingBuffer:
+    """고정 크기 float 링 버퍼
+
+    최근 capacity개의 값을 미리 할당된 NumPy 배열에 보관합니다.
+    값을 두 번(i, i + capacity) 기록하여 최근 구간을 항상 복사 없는 연속 뷰로 제공합니다.
+
+    Notes:
+        - append/replace_last: O(1), 재할당 없음
+        - last(): 시간 순서의 연속 뷰 (이후 append 시 내용이 바뀌므로 보관하려면 복사)
+        - 리스트처럼 len(), 음수 인덱스, 슬라이스 접근 지원
+        - sum()/mean(): 누적 합을 갱신하여 O(1) (한 바퀴마다 다시 합산해 오차 누적 방지)
+    """
+    __slots__ = ('_data', '_capacity', '_head', '_size', '_sum')
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        """
+        Args:
+            capacity (int): 보관할 최대 값 개수
+            dtype: 저장 타입 (기본 float64)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self._data = np.zeros(capacity * 2, dtype=dtype)
+        self._capacity = capacity
+        self._head = 0  # 다음에 기록할 위치
+        self._size = 0
+        self._sum = 0.0  # 보관 중인 값의 합
+
+    def append(self, value: float) -> None:
+        """값 추가 (가득 찬 경우 가장 오래된 값을 덮어씀)"""
+        head = self._head
+        # 밀려나는 값을 빼고 새 값을 더함 (저장 타입으로 변환된 값 기준)
+        removed = self._data[head] if self._size == self._capacity else 0.0
+        self._data[head] = value
+        self._data[head + self._capacity] = value
+        self._sum += self._data[head] - removed
+        if self._size < self._capacity:
+            self._size += 1
+        if head + 1 < self._capacity:
+            self._head = head + 1
+        else:
+            self._head = 0
+            self._sum = float(self._data[:self._size].sum())
+
+    def extend(self, values: Iterable[float]) -> None:
+        """여러 값을 순서대로 추가"""
+        for value in values:
+            self.append(value)
+
+    def replace_last(self, value: float) -> None:
+        """가장 최근 값을 교체 (진행 중인 캔들 갱신용)"""
+        if not self._size:
+            self.append(value)
+            return
+        last = self._head - 1 if self._head else self._capacity - 1
+        removed = self._data[last]
+        self._data[last] = value
+        self._data[last + self._capacity] = value
+        self._sum += self._data[last] - removed
+
+    def clear(self) -> None:
+        """모든 값 제거"""
+        self._head = 0
+        self._size = 0
+        self._sum = 0.0
+
+    def sum(self) -> float:
+        """보관 중인 값의 합 (O(1))"""
+        return float(self._sum)
+
+    def mean(self) -> Optional[float]:
+        """보관 중인 값의 평균 (O(1), 비어 있으면 None)"""
+        if not self._size:
+            return None
+        return float(self._sum) / self._size
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """최근 n개 값을 시간 순서의 뷰로 반환 (n 생략 시 보관 중인 전체)"""
+        end = self._head + self._capacity
+        count = self._size if n is None else min(n, self._size)
+        return self._data[end - count:end]
+
+    def last_scalar(self, offset: int = 1, default: Optional[float] = None) -> Optional[float]:
+        """
+        뒤에서 offset번째 값을 반환 (offset=1이 가장 최근 값)
+
+        Returns:
+            Optional[float]: 값이 부족하면 default
+        """
+        if offset > self._size:
+            return default
+        return float(self._data[self._head + self._capacity - offset])
+
+    @property
+    def capacity(self) -> int:
+        """보관할 최대 값 개수"""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        return self.last()[index]
+
+    def __iter__(self):
+        return iter(self.last())
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({self.last().tolist()}, capacity={self._capacity})"
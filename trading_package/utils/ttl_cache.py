@@ -0,0 +1,66 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+class TTLCache:
+    """만료 시간이 있는 스레드 안전 캐시
+
+    키마다 저장 시점에 유효 시간(ttl)을 지정하고, 만료된 값은 조회 시 제거합니다.
+
+    Notes:
+        - get/set: O(1) (가득 찬 경우에만 만료 항목 정리)
+        - 가득 찬 상태에서 만료 항목이 없으면 가장 먼저 저장된 항목부터 제거
+        - 저장된 객체를 그대로 반환하므로 호출 측은 읽기 전용으로 사용
+    """
+    __slots__ = ('_data', '_lock', '_maxsize', '_timer')
+
+    def __init__(self, maxsize: int = 1024, timer: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize (int): 보관할 최대 항목 수
+            timer (Callable[[], float]): 현재 시각(초) 함수 (기본 time.monotonic)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize는 1 이상이어야 합니다")
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}  # 키 -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._timer = timer
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """유효한 값을 반환 (없거나 만료되었으면 default)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= self._timer():
+                del self._data[key]
+                return default
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """값을 ttl초 동안 저장 (ttl이 0 이하면 저장하지 않음)"""
+        if ttl <= 0:
+            return
+        with self._lock:
+            now = self._timer()
+            # 같은 키를 다시 저장하면 가장 최근 항목이 되도록 기존 위치에서 제거
+            if self._data.pop(key, None) is None and len(self._data) >= self._maxsize:
+                self._evict(now)
+            self._data[key] = (now + ttl, value)
+
+    def _evict(self, now: float) -> None:
+        """만료 항목 정리 후에도 가득 차 있으면 가장 오래 저장된 항목 제거 (락 보유 상태에서 호출)"""
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+        if len(self._data) >= self._maxsize:
+            del self._data[next(iter(self._data))]
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)